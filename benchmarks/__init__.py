@@ -0,0 +1,5 @@
+"""
+Micro-benchmarks for the SDK hot paths.
+
+Run from the repository root, e.g. `python -m benchmarks.bench_response_decode`.
+"""
@@ -0,0 +1,92 @@
+"""
+Synthetic Netlify API payloads shared by the benchmark scripts.
+"""
+
+import typing
+
+
+def site(i: int) -> typing.Dict[str, typing.Any]:
+    """A `models.Site` payload with nested repo/deploy/processing data"""
+    return {
+        "id": f"site-{i:08d}",
+        "name": f"site-{i}",
+        "account_id": "acct-0001",
+        "account_name": "Example Team",
+        "account_slug": "example-team",
+        "admin_url": f"https://app.netlify.com/sites/site-{i}",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-06-01T00:00:00Z",
+        "custom_domain": f"site-{i}.example.com",
+        "domain_aliases": [f"www.site-{i}.example.com"],
+        "force_ssl": True,
+        "managed_dns": False,
+        "ssl": True,
+        "ssl_url": f"https://site-{i}.netlify.app",
+        "url": f"http://site-{i}.netlify.app",
+        "state": "current",
+        "plan": "nf_team_dev",
+        "user_id": "user-0001",
+        "build_settings": {
+            "cmd": "npm run build",
+            "dir": "dist",
+            "provider": "github",
+            "repo_branch": "main",
+            "repo_path": f"example/site-{i}",
+            "repo_url": f"https://github.com/example/site-{i}",
+            "allowed_branches": ["main"],
+            "public_repo": False,
+        },
+        "processing_settings": {"html": {"pretty_urls": True}},
+        "capabilities": {"assets_bandwidth": {"included": 100}},
+        "published_deploy": deploy(i),
+    }
+
+
+def deploy(i: int) -> typing.Dict[str, typing.Any]:
+    """A `models.Deploy` payload"""
+    return {
+        "id": f"deploy-{i:08d}",
+        "site_id": f"site-{i:08d}",
+        "state": "ready",
+        "name": f"site-{i}",
+        "url": f"http://site-{i}.netlify.app",
+        "deploy_url": f"http://main--site-{i}.netlify.app",
+        "branch": "main",
+        "context": "production",
+        "commit_ref": "0" * 40,
+        "created_at": "2024-06-01T00:00:00Z",
+        "published_at": "2024-06-01T00:01:00Z",
+        "required": [],
+        "required_functions": [],
+        "locked": False,
+        "draft": False,
+    }
+
+
+def submission(i: int) -> typing.Dict[str, typing.Any]:
+    """A `models.Submission` payload"""
+    return {
+        "id": f"submission-{i:08d}",
+        "number": i,
+        "email": f"person{i}@example.com",
+        "first_name": "Ada",
+        "last_name": "Lovelace",
+        "name": "Ada Lovelace",
+        "company": "Analytical Engines",
+        "summary": "Hello from the contact form",
+        "body": "Hello from the contact form " * 4,
+        "created_at": "2024-06-01T00:00:00Z",
+        "site_url": "https://example.com",
+        "data": {"email": f"person{i}@example.com", "message": "hi", "ip": "10.0.0.1"},
+    }
+
+
+def file(i: int) -> typing.Dict[str, typing.Any]:
+    """A `models.File` payload"""
+    return {
+        "id": f"/assets/file-{i}.js",
+        "path": f"/assets/file-{i}.js",
+        "sha": f"{i:040x}",
+        "mime_type": "application/javascript",
+        "size": 1024 + i,
+    }
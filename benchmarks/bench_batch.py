@@ -0,0 +1,109 @@
+"""
+Bulk call throughput against a local stub server.
+
+Starts an HTTP server on localhost, in a separate process, that answers
+`GET /sites/{id}/env` after a fixed latency (20 ms by default), then lists
+the environment variables of N sites (500 by default) one at a time, with
+`Client.batch` and with `AsyncClient.batch`, and reports calls per second.
+
+    python -m benchmarks.bench_batch [calls] [latency in ms]
+"""
+
+import asyncio
+import http.server
+import json
+import multiprocessing
+import sys
+import time
+import typing
+
+import httpx
+
+from netlify_py import AsyncClient, Client
+
+CONCURRENCY = 32
+
+
+def _serve(latency: float, ports: "multiprocessing.Queue[int]") -> None:
+    body = json.dumps([{"key": "NODE_VERSION", "values": []}]).encode()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: typing.Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+def _report(label: str, calls: int, elapsed: float, failed: int = 0) -> None:
+    print(
+        f"{label:>22}: {calls:6,} calls, {elapsed:7.2f} s, "
+        f"{calls / elapsed:8.1f} calls/s, {failed} failed"
+    )
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 20.0) / 1000
+    # the stub server runs in its own process so that it does not compete
+    # with the client for the GIL
+    ports: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+    server = multiprocessing.Process(target=_serve, args=(latency, ports), daemon=True)
+    server.start()
+    base_url = f"http://127.0.0.1:{ports.get()}"
+    site_ids = [f"site-{i}" for i in range(calls)]
+    limits = httpx.Limits(max_connections=CONCURRENCY)
+
+    client = Client(
+        token="API_TOKEN", base_url=base_url, httpx_client=httpx.Client(limits=limits)
+    )
+    serial = site_ids[: max(calls // 10, 1)]
+    start = time.perf_counter()
+    for site_id in serial:
+        client.sites.env.list(site_id=site_id)
+    _report("serial (1/10 of calls)", len(serial), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    results = client.batch(
+        [lambda s=site_id: client.sites.env.list(site_id=s) for site_id in site_ids],
+        max_workers=CONCURRENCY,
+    )
+    failed = sum(not result.ok for result in results)
+    _report("Client.batch", calls, time.perf_counter() - start, failed)
+
+    async def run_async() -> None:
+        async_client = AsyncClient(
+            token="API_TOKEN",
+            base_url=base_url,
+            httpx_client=httpx.AsyncClient(limits=limits),
+        )
+        start = time.perf_counter()
+        results = await async_client.batch(
+            [
+                lambda s=site_id: async_client.sites.env.list(site_id=s)
+                for site_id in site_ids
+            ],
+            max_concurrency=CONCURRENCY,
+        )
+        failed = sum(not result.ok for result in results)
+        _report("AsyncClient.batch", calls, time.perf_counter() - start, failed)
+
+    asyncio.run(run_async())
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Encoding of a 200,000 file deploy create body.
+
+Builds the body the way `sites.deploys.create` does (`to_encodable` with the
+deploy serializer, then `json.dumps`), and as a `DeployBody` consumed chunk by
+chunk, plain and gzip compressed. Reports the encoding time and the peak
+memory allocated while encoding, measured in separate runs.
+
+    python -m benchmarks.bench_deploy_body [file count]
+"""
+
+import hashlib
+import json
+import sys
+import time
+import tracemalloc
+import typing
+
+from benchmarks import _payloads
+from netlify_py.core import DeployBody, to_encodable
+from netlify_py.types import params
+
+
+def _generated(files: typing.Dict[str, str]) -> int:
+    encodable = to_encodable(
+        item={"files": files, "draft": True},
+        dump_with=params._SerializerDeployFiles,
+    )
+    return len(json.dumps(encodable).encode())
+
+
+def _streamed(files: typing.Dict[str, str], compress: bool) -> int:
+    return sum(
+        len(chunk) for chunk in DeployBody(files=files, draft=True, compress=compress)
+    )
+
+
+def main(count: int = 200_000) -> None:
+    files = {
+        _payloads.file(i)["path"]: hashlib.sha1(str(i).encode()).hexdigest()
+        for i in range(count)
+    }
+    runs: typing.List[typing.Tuple[str, typing.Callable[[], int]]] = [
+        ("to_encodable + dumps", lambda: _generated(files)),
+        ("DeployBody", lambda: _streamed(files, False)),
+        ("DeployBody, gzip", lambda: _streamed(files, True)),
+    ]
+    for label, encode in runs:
+        start = time.perf_counter()
+        size = encode()
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        encode()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{label:>20}: {elapsed * 1000:8.1f} ms {peak / 1e6:8.1f} MB peak "
+            f"{size / 1e6:6.1f} MB sent"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
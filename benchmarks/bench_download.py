@@ -0,0 +1,71 @@
+"""
+Peak memory of downloading a large file.
+
+Serves a 100 MB body in 64 KiB chunks and compares reading it with a
+buffered request (`response.content`, as `BinaryResponse` does) against
+`download` streaming it to a file.
+
+    python -m benchmarks.bench_download
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+import typing
+
+import httpx
+
+from netlify_py import Client
+
+SIZE = 100 * 1024 * 1024
+CHUNK = b"\0" * (64 * 1024)
+
+
+class _Body(httpx.SyncByteStream):
+    def __iter__(self) -> typing.Iterator[bytes]:
+        for _ in range(SIZE // len(CHUNK)):
+            yield CHUNK
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200, headers={"content-type": "application/octet-stream"}, stream=_Body()
+    )
+
+
+def _measure(label: str, fn: typing.Callable[[], typing.Any]) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>9}: {elapsed * 1000:8.1f} ms, {peak / 1e6:7.1f} MB peak")
+
+
+def main() -> None:
+    client = Client(
+        token="API_TOKEN",
+        base_url="https://api.netlify.test/api/v1",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        _measure(
+            "buffered",
+            lambda: client._base_client.request(
+                method="GET", path="/sites/site/files/big.bin", cast_to=httpx.Response
+            ).content,
+        )
+        _measure(
+            "download",
+            lambda: client.sites.files.download(
+                file_path="big.bin",
+                site_id="site",
+                destination=os.path.join(workdir, "big.bin"),
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Memory of a 500,000 file site listing.
+
+Holds a synthetic `sites.files.list` result as `models.File` instances, as a
+path to digest dict and as a `FileManifest`, and reports the memory held by
+each, then times a manifest diff against a copy with 1% of the files changed.
+
+    python -m benchmarks.bench_file_manifest [file count]
+"""
+
+import hashlib
+import sys
+import time
+import tracemalloc
+import typing
+
+from benchmarks import _payloads
+from netlify_py.deploy import FileManifest
+from netlify_py.types import models
+
+
+def _files(count: int) -> typing.Iterator[models.File]:
+    for i in range(count):
+        payload = _payloads.file(i)
+        payload["sha"] = hashlib.sha1(str(i).encode()).hexdigest()
+        yield models.File.model_validate(payload)
+
+
+def _held(label: str, build: typing.Callable[[], typing.Any]) -> typing.Any:
+    tracemalloc.start()
+    value = build()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>16}: {held / 1e6:8.1f} MB held")
+    return value
+
+
+def main(count: int = 500_000) -> None:
+    _held("List[File]", lambda: list(_files(count)))
+    _held("Dict[str, str]", lambda: {f.path: f.sha for f in _files(count)})
+    deployed = _held("FileManifest", lambda: FileManifest.from_files(_files(count)))
+
+    digests = deployed.digests()
+    for path in list(digests)[::100]:
+        digests[path] = hashlib.sha1(path.encode()).hexdigest()
+    local = FileManifest.from_digests(digests)
+    for label, base in (("diff, 1% changed", local), ("diff, identical", deployed)):
+        start = time.perf_counter()
+        diff = deployed.diff(base)
+        print(f"{label:>16}: {(time.perf_counter() - start) * 1000:8.1f} ms ({diff!r})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
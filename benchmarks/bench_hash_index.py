@@ -0,0 +1,69 @@
+"""
+Incremental hashing of a large build output with a persistent `HashIndex`.
+
+Creates a synthetic tree of small files (100,000 by default) and times a
+plain hash of every file against indexed runs: the first run that fills the
+index, a warm run with nothing changed, a run after touching 100 files, and
+compaction after deleting 1% of the files.
+
+    python -m benchmarks.bench_hash_index [file count]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import typing
+
+from netlify_py.deploy import HashIndex, hash_directory
+
+FILES_PER_DIRECTORY = 500
+
+
+def _build_tree(root: str, count: int) -> typing.List[str]:
+    paths = []
+    for i in range(count):
+        directory = os.path.join(root, f"d{i // FILES_PER_DIRECTORY:04d}")
+        if i % FILES_PER_DIRECTORY == 0:
+            os.makedirs(directory)
+        path = os.path.join(directory, f"f{i:06d}.js")
+        with open(path, "wb") as file:
+            file.write(f"export const value = {i};\n".encode() * 32)
+        paths.append(path)
+    return paths
+
+
+def _timed(label: str, fn: typing.Callable[[], typing.Any]) -> typing.Any:
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:>24}: {time.perf_counter() - start:8.2f} s")
+    return result
+
+
+def main(count: int = 100_000) -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        root = os.path.join(workdir, "dist")
+        paths = _timed(f"create {count:,} files", lambda: _build_tree(root, count))
+
+        _timed("hash (no index)", lambda: hash_directory(root))
+        with HashIndex(os.path.join(workdir, "index.sqlite")) as index:
+            _timed("indexed, cold", lambda: hash_directory(root, index=index))
+            _timed("indexed, warm", lambda: hash_directory(root, index=index))
+
+            for path in paths[:: max(1, count // 100)]:
+                with open(path, "ab") as file:
+                    file.write(b"// changed\n")
+            _timed("indexed, 100 changed", lambda: hash_directory(root, index=index))
+
+        # a fresh process reopening the index pays for loading it once
+        with HashIndex(os.path.join(workdir, "index.sqlite")) as index:
+            _timed("reopened, warm", lambda: hash_directory(root, index=index))
+
+            for path in paths[::100]:
+                os.remove(path)
+            removed = _timed("compact (1% deleted)", index.compact)
+            print(f"{'entries removed':>24}: {removed:8,}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
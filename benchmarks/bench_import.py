@@ -0,0 +1,44 @@
+"""
+Cold-start cost of the SDK, measured in fresh interpreters.
+
+Reports the median time to `import netlify_py`, to construct a `Client`,
+and to reach one resource method (`client.sites.deploys.get`), which pulls
+in only the resource modules and models that call needs.
+
+    python -m benchmarks.bench_import [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+import netlify_py
+imported = time.perf_counter()
+client = netlify_py.Client(token="API_TOKEN")
+constructed = time.perf_counter()
+client.sites.deploys.get
+resolved = time.perf_counter()
+print(imported - start, constructed - imported, resolved - constructed)
+"""
+
+
+def main(runs: int = 15) -> None:
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT], capture_output=True, text=True, check=True
+        ).stdout
+        samples.append([float(value) for value in output.split()])
+
+    for i, label in enumerate(
+        ["import netlify_py", "Client()", "client.sites.deploys"]
+    ):
+        median = statistics.median(sample[i] for sample in samples)
+        print(f"{label:>20}: {median * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 15)
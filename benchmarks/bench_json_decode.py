@@ -0,0 +1,60 @@
+"""
+JSON decoding throughput of the response decoders.
+
+Decodes a 1,000 site `typing.List[models.Site]` body and a 5,000 submission
+`typing.List[models.Submission]` body from bytes into models with each
+available `JsonDecoder` and reports milliseconds per response and MB/s.
+
+    python -m benchmarks.bench_json_decode
+"""
+
+import json
+import timeit
+import typing
+
+from benchmarks import _payloads
+from netlify_py.core import (
+    JsonDecoder,
+    OrjsonDecoder,
+    PydanticJsonDecoder,
+    orjson_available,
+)
+from netlify_py.types import models
+
+BODIES = [
+    (
+        "List[Site]",
+        typing.List[models.Site],
+        json.dumps([_payloads.site(i) for i in range(1_000)]).encode(),
+    ),
+    (
+        "List[Submission]",
+        typing.List[models.Submission],
+        json.dumps([_payloads.submission(i) for i in range(5_000)]).encode(),
+    ),
+]
+
+
+def main(number: int = 10) -> None:
+    decoders: typing.List[JsonDecoder] = [JsonDecoder()]
+    if orjson_available():
+        decoders.append(OrjsonDecoder())
+    else:
+        print("orjson is not installed, skipping OrjsonDecoder")
+    decoders.append(PydanticJsonDecoder())
+
+    for label, cast_to, content in BODIES:
+        mb = len(content) / 1e6
+        print(f"{label} ({mb:.1f} MB)")
+        for decoder in decoders:
+            fn = lambda: decoder.validate(content, cast_to)  # noqa: E731
+            fn()  # warm up the validator
+            best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+            print(
+                f"{decoder.name:>10}: {best * 1000:8.2f} ms / response, "
+                f"{mb / best:7.1f} MB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
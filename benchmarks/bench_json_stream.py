@@ -0,0 +1,65 @@
+"""
+Peak memory of streamed list responses.
+
+Reads a 100,000 file `sites.files.list` body, served in 64 KiB chunks, with
+`list` and with `stream_list`, keeping only the total size of the files, and
+reports the time and the peak memory of each (measured in separate runs,
+as tracing allocations slows the decoding down).
+
+    python -m benchmarks.bench_json_stream
+"""
+
+import json
+import time
+import tracemalloc
+import typing
+
+import httpx
+
+from benchmarks import _payloads
+from netlify_py import Client
+
+BODY = json.dumps([_payloads.file(i) for i in range(100_000)]).encode()
+CHUNK = 64 * 1024
+
+
+class _Body(httpx.SyncByteStream):
+    def __iter__(self) -> typing.Iterator[bytes]:
+        for i in range(0, len(BODY), CHUNK):
+            yield BODY[i : i + CHUNK]
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200, headers={"content-type": "application/json"}, stream=_Body()
+    )
+
+
+def _list(client: Client) -> int:
+    return sum(f.size or 0 for f in client.sites.files.list(site_id="site"))
+
+
+def _stream_list(client: Client) -> int:
+    return sum(f.size or 0 for f in client.sites.files.stream_list(site_id="site"))
+
+
+def main() -> None:
+    client = Client(
+        token="API_TOKEN",
+        base_url="https://api.netlify.test/api/v1",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+    )
+    print(f"body: {len(BODY) / 1e6:.1f} MB")
+    for name, read in (("list", _list), ("stream_list", _stream_list)):
+        start = time.perf_counter()
+        read(client)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        read(client)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:>11}: {elapsed * 1000:8.1f} ms, {peak / 1e6:7.1f} MB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Memory held by projected list responses.
+
+Processes a 5,000 site `sites.list` body as full models, as parsed JSON and
+projected onto three fields, and reports the time per response and the
+memory held by the result.
+
+    python -m benchmarks.bench_projection
+"""
+
+import json
+import timeit
+import tracemalloc
+import typing
+
+import httpx
+
+from benchmarks import _payloads
+from netlify_py.core import SyncBaseClient, project
+from netlify_py.types import models
+
+CAST_TO = typing.List[models.Site]
+RESPONSE = httpx.Response(
+    200,
+    content=json.dumps([_payloads.site(i) for i in range(5_000)]).encode(),
+    headers={"content-type": "application/json"},
+)
+FIELDS = ["id", "name", "published_deploy.id"]
+
+
+def _model(client: SyncBaseClient) -> typing.Any:
+    return client.process_response(response=RESPONSE, cast_to=CAST_TO)
+
+
+def _dict(client: SyncBaseClient) -> typing.Any:
+    return client.process_response(
+        response=RESPONSE, cast_to=CAST_TO, response_mode="dict"
+    )
+
+
+def _projection(client: SyncBaseClient) -> typing.Any:
+    return project(_dict(client), FIELDS)
+
+
+def main(number: int = 5) -> None:
+    client = SyncBaseClient(base_url="https://api.netlify.test", httpx_client=None)  # type: ignore[arg-type]
+    for name, read in (("model", _model), ("dict", _dict), ("fields", _projection)):
+        read(client)  # warm up
+        best = min(timeit.repeat(lambda: read(client), number=number, repeat=3))
+        tracemalloc.start()
+        sites = read(client)
+        held, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del sites
+        print(
+            f"{name:>6}: {best / number * 1000:8.2f} ms / response, "
+            f"{held / 1e6:7.1f} MB held"
+        )
+
+
+if __name__ == "__main__":
+    main()
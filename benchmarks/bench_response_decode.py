@@ -0,0 +1,48 @@
+"""
+Per-response decode overhead for a 1,000 site `sites.list` payload.
+
+Compares building a throwaway Pydantic model per response (the previous
+`from_encodable` implementation) against the cached validator registry.
+
+    python -m benchmarks.bench_response_decode
+"""
+
+import timeit
+import typing
+
+from pydantic import BaseModel
+
+from benchmarks import _payloads
+from netlify_py.core import from_encodable
+from netlify_py.types import models
+
+CAST_TO = typing.List[models.Site]
+PAYLOAD = [_payloads.site(i) for i in range(1_000)]
+
+
+def _uncached(data: typing.Any, load_with: typing.Any) -> typing.Any:
+    class Caster(BaseModel):
+        data: load_with  # type: ignore
+
+    return Caster(data=data).data
+
+
+def main(number: int = 20) -> None:
+    for label, fn in [
+        ("per-call model", lambda: _uncached(PAYLOAD, CAST_TO)),
+        ("cached validator", lambda: from_encodable(data=PAYLOAD, load_with=CAST_TO)),
+    ]:
+        fn()  # warm up
+        best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+        print(f"{label:>18}: {best * 1000:8.2f} ms / response")
+
+    for label, fn in [
+        ("per-call model", lambda: _uncached([], CAST_TO)),
+        ("cached validator", lambda: from_encodable(data=[], load_with=CAST_TO)),
+    ]:
+        best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+        print(f"{label:>18}: {best * 1000:8.2f} ms / empty response (schema cost)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Decode time and memory of the response modes.
+
+Processes a 5,000 site `sites.list` body in the `"model"`, `"dict"` and
+`"lazy"` response modes, then reads the name of 10 sites, and reports the
+time per response and the memory held by the result.
+
+    python -m benchmarks.bench_response_mode
+"""
+
+import json
+import timeit
+import tracemalloc
+import typing
+
+import httpx
+
+from benchmarks import _payloads
+from netlify_py.core import ResponseMode, SyncBaseClient
+from netlify_py.types import models
+
+CAST_TO = typing.List[models.Site]
+RESPONSE = httpx.Response(
+    200,
+    content=json.dumps([_payloads.site(i) for i in range(5_000)]).encode(),
+    headers={"content-type": "application/json"},
+)
+MODES: typing.Tuple[ResponseMode, ...] = ("model", "dict", "lazy")
+
+
+def _read(client: SyncBaseClient, mode: ResponseMode) -> typing.Any:
+    sites = client.process_response(
+        response=RESPONSE, cast_to=CAST_TO, response_mode=mode
+    )
+    for site in sites[:10]:
+        site["name"] if mode == "dict" else site.name
+    return sites
+
+
+def main(number: int = 5) -> None:
+    client = SyncBaseClient(base_url="https://api.netlify.test", httpx_client=None)  # type: ignore[arg-type]
+    for mode in MODES:
+        _read(client, mode)  # warm up
+        best = min(timeit.repeat(lambda: _read(client, mode), number=number, repeat=3))
+        tracemalloc.start()
+        sites = _read(client, mode)
+        held, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del sites
+        print(
+            f"{mode:>6}: {best / number * 1000:8.2f} ms / response, "
+            f"{held / 1e6:7.1f} MB held"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Server-Sent Events decoding throughput.
+
+Decodes a synthetic event stream (100 MB by default) delivered in 64 KiB
+chunks with `SSEDecoder` and reports MB/s. The previous byte-at-a-time
+buffer scan is measured on a smaller stream for comparison, as its cost
+grows with the number of events buffered per chunk.
+
+    python -m benchmarks.bench_sse [size in MB]
+"""
+
+import json
+import sys
+import time
+import typing
+
+from netlify_py.core import SSEDecoder
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _stream(size: int) -> bytes:
+    events = []
+    total = 0
+    i = 0
+    while total < size:
+        payload = json.dumps({"id": i, "state": "building", "log": "x" * 120})
+        event = f"id: {i}\nevent: deploy\ndata: {payload}\n\n".encode()
+        events.append(event)
+        total += len(event)
+        i += 1
+    return b"".join(events)
+
+
+def _chunks(stream: bytes) -> typing.Iterator[bytes]:
+    for offset in range(0, len(stream), CHUNK_SIZE):
+        yield stream[offset : offset + CHUNK_SIZE]
+
+
+def _decode(stream: bytes) -> int:
+    decoder = SSEDecoder()
+    count = 0
+    for chunk in _chunks(stream):
+        count += len(decoder.feed(chunk))
+    return count + len(decoder.flush())
+
+
+def _legacy_decode(stream: bytes) -> int:
+    """The previous `_process_buffer` scan, without model conversion"""
+    buffer = bytearray()
+    position = 0
+    count = 0
+    for chunk in _chunks(stream):
+        buffer += chunk
+        while position < len(buffer):
+            for boundary in [b"\r\n\r\n", b"\n\n", b"\r\r"]:
+                if (position + len(boundary)) <= len(buffer):
+                    if buffer[position : position + len(boundary)] == boundary:
+                        message = buffer[:position].decode()
+                        buffer = buffer[position + len(boundary) :]
+                        position = 0
+                        if any(
+                            line.startswith("data:") for line in message.split("\n")
+                        ):
+                            count += 1
+                        break
+            else:
+                position += 1
+    return count
+
+
+def _measure(label: str, fn: typing.Callable[[bytes], int], stream: bytes) -> None:
+    start = time.perf_counter()
+    count = fn(stream)
+    elapsed = time.perf_counter() - start
+    mb = len(stream) / 1e6
+    print(
+        f"{label:>16}: {mb:7.1f} MB, {count:9,} events, {elapsed:7.2f} s, "
+        f"{mb / elapsed:8.1f} MB/s"
+    )
+
+
+def main(size_mb: float = 100) -> None:
+    _measure("SSEDecoder", _decode, _stream(int(size_mb * 1e6)))
+    _measure("legacy scan", _legacy_decode, _stream(int(min(size_mb, 2) * 1e6)))
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -1,6 +1,36 @@
 from .client import AsyncClient, Client
-from .core import ApiError, BinaryResponse
+from .core import (
+    ApiError,
+    BatchResult,
+    BinaryResponse,
+    CacheRule,
+    ConnectionProfile,
+    HttpCache,
+    MemoryCacheBackend,
+    RateLimiter,
+    ResourceCache,
+    RetryBudget,
+    RetryPolicy,
+    SQLiteCacheBackend,
+    TokenBucket,
+)
 from .environment import Environment
 
-
-__all__ = ["ApiError", "AsyncClient", "BinaryResponse", "Client", "Environment"]
+__all__ = [
+    "ApiError",
+    "AsyncClient",
+    "BatchResult",
+    "BinaryResponse",
+    "CacheRule",
+    "Client",
+    "ConnectionProfile",
+    "Environment",
+    "HttpCache",
+    "MemoryCacheBackend",
+    "RateLimiter",
+    "ResourceCache",
+    "RetryBudget",
+    "RetryPolicy",
+    "SQLiteCacheBackend",
+    "TokenBucket",
+]
@@ -1,23 +1,43 @@
+import functools
 import httpx
 import typing
 
-from netlify_py.core import AsyncBaseClient, AuthBearer, SyncBaseClient
+from netlify_py.core import (
+    AsyncBaseClient,
+    AuthBearer,
+    BatchResult,
+    ConnectionProfile,
+    HttpCache,
+    JsonDecoder,
+    RateLimiter,
+    ResourceCache,
+    RetryPolicy,
+    SyncBaseClient,
+    type_utils,
+)
+from netlify_py.core.batch import ProgressCallback, arun_batch, run_batch
+from netlify_py.core.lazy import ResponseMode
 from netlify_py.environment import Environment
-from netlify_py.resources.accounts import AccountsClient, AsyncAccountsClient
-from netlify_py.resources.billing import AsyncBillingClient, BillingClient
-from netlify_py.resources.builds import AsyncBuildsClient, BuildsClient
-from netlify_py.resources.cache import AsyncCacheClient, CacheClient
-from netlify_py.resources.deploy_keys import AsyncDeployKeysClient, DeployKeysClient
-from netlify_py.resources.deploys import AsyncDeploysClient, DeploysClient
-from netlify_py.resources.dns_zones import AsyncDnsZonesClient, DnsZonesClient
-from netlify_py.resources.forms import AsyncFormsClient, FormsClient
-from netlify_py.resources.hooks import AsyncHooksClient, HooksClient
-from netlify_py.resources.members import AsyncMembersClient, MembersClient
-from netlify_py.resources.oauth import AsyncOauthClient, OauthClient
-from netlify_py.resources.services import AsyncServicesClient, ServicesClient
-from netlify_py.resources.sites import AsyncSitesClient, SitesClient
-from netlify_py.resources.submissions import AsyncSubmissionsClient, SubmissionsClient
-from netlify_py.resources.user import AsyncUserClient, UserClient
+
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.accounts import AccountsClient, AsyncAccountsClient
+    from netlify_py.resources.billing import AsyncBillingClient, BillingClient
+    from netlify_py.resources.builds import AsyncBuildsClient, BuildsClient
+    from netlify_py.resources.cache import AsyncCacheClient, CacheClient
+    from netlify_py.resources.deploy_keys import AsyncDeployKeysClient, DeployKeysClient
+    from netlify_py.resources.deploys import AsyncDeploysClient, DeploysClient
+    from netlify_py.resources.dns_zones import AsyncDnsZonesClient, DnsZonesClient
+    from netlify_py.resources.forms import AsyncFormsClient, FormsClient
+    from netlify_py.resources.hooks import AsyncHooksClient, HooksClient
+    from netlify_py.resources.members import AsyncMembersClient, MembersClient
+    from netlify_py.resources.oauth import AsyncOauthClient, OauthClient
+    from netlify_py.resources.services import AsyncServicesClient, ServicesClient
+    from netlify_py.resources.sites import AsyncSitesClient, SitesClient
+    from netlify_py.resources.submissions import (
+        AsyncSubmissionsClient,
+        SubmissionsClient,
+    )
+    from netlify_py.resources.user import AsyncUserClient, UserClient
 
 
 class Client:
@@ -25,34 +45,161 @@ class Client:
         self,
         *,
         base_url: typing.Optional[str] = None,
-        timeout: typing.Optional[float] = 60,
+        timeout: typing.Union[
+            float, httpx.Timeout, None, type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
         httpx_client: typing.Optional[httpx.Client] = None,
         environment: Environment = Environment.PRODUCTION,
         token: typing.Optional[str] = None,
+        retry: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        connection: typing.Optional[ConnectionProfile] = None,
+        http_cache: typing.Optional[HttpCache] = None,
+        resource_cache: typing.Optional[ResourceCache] = None,
+        json_decoder: typing.Optional[JsonDecoder] = None,
+        response_mode: ResponseMode = "model",
     ):
         """Initialize root client"""
+        _check_httpx_client(httpx_client=httpx_client, connection=connection)
         self._base_client = SyncBaseClient(
             base_url=_get_base_url(base_url=base_url, environment=environment),
-            httpx_client=httpx.Client(timeout=timeout)
-            if httpx_client is None
-            else httpx_client,
+            httpx_client=(
+                httpx.Client(**_httpx_options(timeout=timeout, connection=connection))
+                if httpx_client is None
+                else httpx_client
+            ),
+            retry=retry,
+            rate_limiter=rate_limiter,
+            http_cache=http_cache,
+            resource_cache=resource_cache,
+            json_decoder=json_decoder,
+            response_mode=response_mode,
         )
         self._base_client.register_auth("netlifyAuth", AuthBearer(val=token))
-        self.accounts = AccountsClient(base_client=self._base_client)
-        self.deploy_keys = DeployKeysClient(base_client=self._base_client)
-        self.deploys = DeploysClient(base_client=self._base_client)
-        self.dns_zones = DnsZonesClient(base_client=self._base_client)
-        self.hooks = HooksClient(base_client=self._base_client)
-        self.sites = SitesClient(base_client=self._base_client)
-        self.submissions = SubmissionsClient(base_client=self._base_client)
-        self.members = MembersClient(base_client=self._base_client)
-        self.billing = BillingClient(base_client=self._base_client)
-        self.builds = BuildsClient(base_client=self._base_client)
-        self.forms = FormsClient(base_client=self._base_client)
-        self.oauth = OauthClient(base_client=self._base_client)
-        self.services = ServicesClient(base_client=self._base_client)
-        self.user = UserClient(base_client=self._base_client)
-        self.cache = CacheClient(base_client=self._base_client)
+
+    def batch(
+        self,
+        calls: typing.Iterable[typing.Callable[[], typing.Any]],
+        *,
+        max_workers: int = 16,
+        on_progress: typing.Optional[ProgressCallback] = None,
+    ) -> typing.List[BatchResult[typing.Any]]:
+        """
+        Run many calls of this client on a thread pool.
+
+        Every call goes through this client's retry policy and rate limiter,
+        and a failing call is captured in its result instead of stopping the
+        batch.
+
+        Args:
+            calls: Calls without arguments, e.g.
+                `lambda: client.sites.env.list(site_id=site_id)`
+            max_workers: Maximum number of calls running at once
+            on_progress: Called with (completed, total, result) after each call
+
+        Returns:
+            One result per call, in the order of `calls`
+
+        Examples:
+        ```py
+        results = client.batch(
+            [functools.partial(client.sites.snippets.list, site_id=s) for s in ids],
+            max_workers=32,
+        )
+        failed = [r for r in results if not r.ok]
+        ```
+        """
+        return run_batch(calls, max_workers=max_workers, on_progress=on_progress)
+
+    @functools.cached_property
+    def accounts(self) -> "AccountsClient":
+        from netlify_py.resources.accounts import AccountsClient
+
+        return AccountsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def deploy_keys(self) -> "DeployKeysClient":
+        from netlify_py.resources.deploy_keys import DeployKeysClient
+
+        return DeployKeysClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def deploys(self) -> "DeploysClient":
+        from netlify_py.resources.deploys import DeploysClient
+
+        return DeploysClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def dns_zones(self) -> "DnsZonesClient":
+        from netlify_py.resources.dns_zones import DnsZonesClient
+
+        return DnsZonesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def hooks(self) -> "HooksClient":
+        from netlify_py.resources.hooks import HooksClient
+
+        return HooksClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def sites(self) -> "SitesClient":
+        from netlify_py.resources.sites import SitesClient
+
+        return SitesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def submissions(self) -> "SubmissionsClient":
+        from netlify_py.resources.submissions import SubmissionsClient
+
+        return SubmissionsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def members(self) -> "MembersClient":
+        from netlify_py.resources.members import MembersClient
+
+        return MembersClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def billing(self) -> "BillingClient":
+        from netlify_py.resources.billing import BillingClient
+
+        return BillingClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def builds(self) -> "BuildsClient":
+        from netlify_py.resources.builds import BuildsClient
+
+        return BuildsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def forms(self) -> "FormsClient":
+        from netlify_py.resources.forms import FormsClient
+
+        return FormsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def oauth(self) -> "OauthClient":
+        from netlify_py.resources.oauth import OauthClient
+
+        return OauthClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def services(self) -> "ServicesClient":
+        from netlify_py.resources.services import ServicesClient
+
+        return ServicesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def user(self) -> "UserClient":
+        from netlify_py.resources.user import UserClient
+
+        return UserClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def cache(self) -> "CacheClient":
+        from netlify_py.resources.cache import CacheClient
+
+        return CacheClient(base_client=self._base_client)
 
 
 class AsyncClient:
@@ -60,34 +207,158 @@ class AsyncClient:
         self,
         *,
         base_url: typing.Optional[str] = None,
-        timeout: typing.Optional[float] = 60,
+        timeout: typing.Union[
+            float, httpx.Timeout, None, type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
         httpx_client: typing.Optional[httpx.AsyncClient] = None,
         environment: Environment = Environment.PRODUCTION,
         token: typing.Optional[str] = None,
+        retry: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        connection: typing.Optional[ConnectionProfile] = None,
+        http_cache: typing.Optional[HttpCache] = None,
+        resource_cache: typing.Optional[ResourceCache] = None,
+        json_decoder: typing.Optional[JsonDecoder] = None,
+        response_mode: ResponseMode = "model",
+        coalesce: bool = False,
     ):
         """Initialize root client"""
+        _check_httpx_client(httpx_client=httpx_client, connection=connection)
         self._base_client = AsyncBaseClient(
             base_url=_get_base_url(base_url=base_url, environment=environment),
-            httpx_client=httpx.AsyncClient(timeout=timeout)
-            if httpx_client is None
-            else httpx_client,
+            httpx_client=(
+                httpx.AsyncClient(
+                    **_httpx_options(timeout=timeout, connection=connection)
+                )
+                if httpx_client is None
+                else httpx_client
+            ),
+            retry=retry,
+            rate_limiter=rate_limiter,
+            http_cache=http_cache,
+            resource_cache=resource_cache,
+            json_decoder=json_decoder,
+            response_mode=response_mode,
+            coalesce=coalesce,
         )
         self._base_client.register_auth("netlifyAuth", AuthBearer(val=token))
-        self.accounts = AsyncAccountsClient(base_client=self._base_client)
-        self.deploy_keys = AsyncDeployKeysClient(base_client=self._base_client)
-        self.deploys = AsyncDeploysClient(base_client=self._base_client)
-        self.dns_zones = AsyncDnsZonesClient(base_client=self._base_client)
-        self.hooks = AsyncHooksClient(base_client=self._base_client)
-        self.sites = AsyncSitesClient(base_client=self._base_client)
-        self.submissions = AsyncSubmissionsClient(base_client=self._base_client)
-        self.members = AsyncMembersClient(base_client=self._base_client)
-        self.billing = AsyncBillingClient(base_client=self._base_client)
-        self.builds = AsyncBuildsClient(base_client=self._base_client)
-        self.forms = AsyncFormsClient(base_client=self._base_client)
-        self.oauth = AsyncOauthClient(base_client=self._base_client)
-        self.services = AsyncServicesClient(base_client=self._base_client)
-        self.user = AsyncUserClient(base_client=self._base_client)
-        self.cache = AsyncCacheClient(base_client=self._base_client)
+
+    async def batch(
+        self,
+        calls: typing.Iterable[typing.Callable[[], typing.Awaitable[typing.Any]]],
+        *,
+        max_concurrency: int = 16,
+        on_progress: typing.Optional[ProgressCallback] = None,
+    ) -> typing.List[BatchResult[typing.Any]]:
+        """
+        Run many calls of this client concurrently.
+
+        Every call goes through this client's retry policy and rate limiter,
+        and a failing call is captured in its result instead of stopping the
+        batch.
+
+        Args:
+            calls: Calls without arguments returning awaitables, e.g.
+                `lambda: client.sites.env.list(site_id=site_id)`
+            max_concurrency: Maximum number of calls awaited at once
+            on_progress: Called with (completed, total, result) after each call
+
+        Returns:
+            One result per call, in the order of `calls`
+        """
+        return await arun_batch(
+            calls, max_concurrency=max_concurrency, on_progress=on_progress
+        )
+
+    @functools.cached_property
+    def accounts(self) -> "AsyncAccountsClient":
+        from netlify_py.resources.accounts import AsyncAccountsClient
+
+        return AsyncAccountsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def deploy_keys(self) -> "AsyncDeployKeysClient":
+        from netlify_py.resources.deploy_keys import AsyncDeployKeysClient
+
+        return AsyncDeployKeysClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def deploys(self) -> "AsyncDeploysClient":
+        from netlify_py.resources.deploys import AsyncDeploysClient
+
+        return AsyncDeploysClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def dns_zones(self) -> "AsyncDnsZonesClient":
+        from netlify_py.resources.dns_zones import AsyncDnsZonesClient
+
+        return AsyncDnsZonesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def hooks(self) -> "AsyncHooksClient":
+        from netlify_py.resources.hooks import AsyncHooksClient
+
+        return AsyncHooksClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def sites(self) -> "AsyncSitesClient":
+        from netlify_py.resources.sites import AsyncSitesClient
+
+        return AsyncSitesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def submissions(self) -> "AsyncSubmissionsClient":
+        from netlify_py.resources.submissions import AsyncSubmissionsClient
+
+        return AsyncSubmissionsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def members(self) -> "AsyncMembersClient":
+        from netlify_py.resources.members import AsyncMembersClient
+
+        return AsyncMembersClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def billing(self) -> "AsyncBillingClient":
+        from netlify_py.resources.billing import AsyncBillingClient
+
+        return AsyncBillingClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def builds(self) -> "AsyncBuildsClient":
+        from netlify_py.resources.builds import AsyncBuildsClient
+
+        return AsyncBuildsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def forms(self) -> "AsyncFormsClient":
+        from netlify_py.resources.forms import AsyncFormsClient
+
+        return AsyncFormsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def oauth(self) -> "AsyncOauthClient":
+        from netlify_py.resources.oauth import AsyncOauthClient
+
+        return AsyncOauthClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def services(self) -> "AsyncServicesClient":
+        from netlify_py.resources.services import AsyncServicesClient
+
+        return AsyncServicesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def user(self) -> "AsyncUserClient":
+        from netlify_py.resources.user import AsyncUserClient
+
+        return AsyncUserClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def cache(self) -> "AsyncCacheClient":
+        from netlify_py.resources.cache import AsyncCacheClient
+
+        return AsyncCacheClient(base_client=self._base_client)
 
 
 def _get_base_url(
@@ -99,3 +370,35 @@ def _get_base_url(
         return environment.value
     else:
         raise Exception("Must include a base_url or environment arguments")
+
+
+_DEFAULT_TIMEOUT = 60
+
+
+def _check_httpx_client(
+    *,
+    httpx_client: typing.Union[httpx.Client, httpx.AsyncClient, None],
+    connection: typing.Optional[ConnectionProfile],
+) -> None:
+    if httpx_client is not None and connection is not None:
+        raise ValueError(
+            "connection cannot be combined with httpx_client, "
+            "configure the httpx client with connection.httpx_options() instead"
+        )
+
+
+def _httpx_options(
+    *,
+    timeout: typing.Union[float, httpx.Timeout, None, type_utils.NotGiven],
+    connection: typing.Optional[ConnectionProfile],
+) -> typing.Dict[str, typing.Any]:
+    """Options of the default httpx client. An explicit `timeout` takes
+    precedence over the timeout of the connection profile."""
+    options: typing.Dict[str, typing.Any] = (
+        {"timeout": _DEFAULT_TIMEOUT}
+        if connection is None
+        else connection.httpx_options()
+    )
+    if not isinstance(timeout, type_utils.NotGiven):
+        options["timeout"] = timeout
+    return options
@@ -10,24 +10,67 @@ from .auth import (
     OAuth2,
     OAuth2ClientCredentialsForm,
     OAuth2PasswordForm,
+    TokenCache,
 )
 from .base_client import AsyncBaseClient, BaseClient, SyncBaseClient
+from .batch import BatchResult, arun_batch, run_batch
 from .binary_response import BinaryResponse
+from .connection import ConnectionProfile
+from .file_stream import AsyncFileStream, FileStream
+from .http_cache import (
+    CacheBackend,
+    CachedResponse,
+    CacheStats,
+    HttpCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from .deploy_body import AsyncDeployBody, DeployBody
+from .download import Destination, Download, DownloadTarget
+from .json_decoder import (
+    JsonDecoder,
+    OrjsonDecoder,
+    PydanticJsonDecoder,
+    default_json_decoder,
+    orjson_available,
+)
+from .json_stream import JsonArrayDecoder
+from .lazy import LazyModel, ResponseMode, load_lazy
+from .projection import Projection, project, projection_type
 from .query import encode_query_param, QueryParams
 from .request import (
     filter_not_given,
     to_content,
+    to_content_size,
     to_encodable,
     RequestOptions,
     default_request_options,
 )
-from .response import from_encodable, AsyncStreamResponse, StreamResponse
+from .rate_limit import RateLimiter, TokenBucket
+from .resource_cache import (
+    READ_MOSTLY_RULES,
+    CacheRule,
+    ResourceCache,
+    ResourceLookup,
+)
+from .retry import RetryBudget, RetryPolicy
+from .sse import ServerSentEvent, SSEDecoder
+from .response import (
+    from_encodable,
+    get_validator,
+    AsyncStreamResponse,
+    StreamResponse,
+)
 
 __all__ = [
     "ApiError",
     "AsyncBaseClient",
     "BaseClient",
+    "BatchResult",
+    "arun_batch",
+    "run_batch",
     "BinaryResponse",
+    "ConnectionProfile",
     "RequestOptions",
     "default_request_options",
     "SyncBaseClient",
@@ -41,12 +84,50 @@ __all__ = [
     "OAuth2",
     "OAuth2ClientCredentialsForm",
     "OAuth2PasswordForm",
+    "TokenCache",
     "to_encodable",
     "filter_not_given",
     "to_content",
+    "to_content_size",
+    "Destination",
+    "Download",
+    "DownloadTarget",
+    "FileStream",
+    "AsyncFileStream",
+    "DeployBody",
+    "AsyncDeployBody",
+    "CacheBackend",
+    "CachedResponse",
+    "CacheStats",
+    "HttpCache",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
     "encode_query_param",
+    "JsonDecoder",
+    "JsonArrayDecoder",
+    "LazyModel",
+    "ResponseMode",
+    "load_lazy",
+    "Projection",
+    "project",
+    "projection_type",
+    "OrjsonDecoder",
+    "PydanticJsonDecoder",
+    "default_json_decoder",
+    "orjson_available",
     "from_encodable",
+    "get_validator",
     "AsyncStreamResponse",
     "StreamResponse",
     "QueryParams",
+    "RateLimiter",
+    "READ_MOSTLY_RULES",
+    "CacheRule",
+    "ResourceCache",
+    "ResourceLookup",
+    "RetryBudget",
+    "RetryPolicy",
+    "ServerSentEvent",
+    "SSEDecoder",
+    "TokenBucket",
 ]
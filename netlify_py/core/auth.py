@@ -1,10 +1,12 @@
 import abc
+import asyncio
 import datetime
-from typing import Any, Dict, TypedDict, Optional, List, Tuple, Literal
+import threading
+from typing import Any, Dict, Hashable, TypedDict, Optional, List, Tuple, Literal
 
 import jsonpointer  # type: ignore
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from .request import RequestConfig
 
 
@@ -37,6 +39,15 @@ class AuthProvider(abc.ABC, BaseModel):
             val: Authentication value to set
         """
 
+    async def prepare_async(self) -> None:
+        """
+        Prepares the provider for a request sent from an async client.
+
+        Called by the async client before `add_to_request`, so that providers
+        needing I/O (e.g. fetching a token) can do it without blocking the
+        event loop. Does nothing by default.
+        """
+
 
 class AuthBasic(AuthProvider):
     """
@@ -215,6 +226,55 @@ class OAuth2ClientCredentialsForm(TypedDict, total=True):
     scope: Optional[List[str]]
 
 
+Token = Tuple[str, datetime.datetime]
+
+
+class TokenCache:
+    """
+    Thread safe store of OAuth2 access tokens.
+
+    Tokens are keyed by the token endpoint and credentials they were issued
+    for, so OAuth2 providers of several clients that share a cache also
+    share their tokens and their in-flight token requests.
+    """
+
+    def __init__(self) -> None:
+        self._tokens: Dict[Hashable, Token] = {}
+        self._inflight: Dict[Hashable, "asyncio.Future[Token]"] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Token]:
+        """Cached access token and its expiry, if any"""
+        with self._lock:
+            return self._tokens.get(key)
+
+    def set(self, key: Hashable, token: Token) -> None:
+        """Stores an access token and its expiry"""
+        with self._lock:
+            self._tokens[key] = token
+
+    def lock(self, key: Hashable) -> threading.Lock:
+        """Lock held by a synchronous token request for `key`"""
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def inflight(self, key: Hashable) -> Optional["asyncio.Future[Token]"]:
+        """Asynchronous token request for `key` running on the current loop"""
+        with self._lock:
+            future = self._inflight.get(key)
+        if future is None or future.done():
+            return None
+        if future.get_loop() is not asyncio.get_running_loop():
+            return None
+        return future
+
+    def set_inflight(self, key: Hashable, future: "asyncio.Future[Token]") -> None:
+        """Registers an asynchronous token request for `key`"""
+        with self._lock:
+            self._inflight[key] = future
+
+
 GrantType = Literal["password", "client_credentials"]
 CredentialsLocation = Literal["request_body", "basic_authorization_header"]
 BodyContent = Literal["form", "json"]
@@ -225,8 +285,16 @@ class OAuth2(AuthProvider):
     Implements OAuth2 token retrieval and refreshing.
     Currently supports `password` and `client_credentials`
     grant types.
+
+    Within an async client, tokens are requested without blocking the event
+    loop and only once at a time: concurrent requests await the same token
+    request. Once a token is within `refresh_margin` seconds of expiring, it
+    is refreshed in the background while requests keep using it. Providers
+    sharing a `token_cache` share their tokens.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     # OAuth2 provider configuration
     token_url: str
     access_token_pointer: str
@@ -246,8 +314,19 @@ class OAuth2(AuthProvider):
     # access_token storage
     access_token: Optional[str] = None
     expires_at: Optional[datetime.datetime] = None
+    token_cache: TokenCache = Field(default_factory=TokenCache)
+    refresh_margin: float = 120.0
+
+    def _cache_key(self) -> Hashable:
+        return (
+            self.token_url,
+            self.grant_type,
+            self.client_id,
+            self.username,
+            tuple(self.scope or ()),
+        )
 
-    def _refresh(self) -> Tuple[str, datetime.datetime]:
+    def _token_request(self) -> Dict[str, Any]:
         req_cfg: Dict[str, Any] = {"url": self.token_url}
         req_data: Dict[str, Any] = {"grant_type": self.grant_type}
 
@@ -274,8 +353,9 @@ class OAuth2(AuthProvider):
             req_cfg["data"] = req_data
             req_cfg["headers"] = {"content-type": "application/x-www-form-urlencoded"}
 
-        # make access token request
-        token_res = httpx.post(**req_cfg)
+        return req_cfg
+
+    def _parse_token(self, token_res: httpx.Response) -> Token:
         token_res.raise_for_status()
 
         # retrieve access token & optional expiry seconds
@@ -297,18 +377,63 @@ class OAuth2(AuthProvider):
 
         return (access_token, expires_at)
 
-    def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
-        token_expired = (
-            self.expires_at is not None and self.expires_at <= datetime.datetime.now()
-        )
+    def _refresh(self) -> Token:
+        return self._parse_token(httpx.post(**self._token_request()))
+
+    async def _arefresh(self) -> Token:
+        async with httpx.AsyncClient() as client:
+            token_res = await client.post(**self._token_request())
+        return self._parse_token(token_res)
+
+    def _store(self, token: Token) -> Token:
+        self.token_cache.set(self._cache_key(), token)
+        self.access_token, self.expires_at = token
+        return token
+
+    def _valid_token(self, margin: float = 0.0) -> Optional[Token]:
+        """The cached token, if it is valid for at least `margin` seconds"""
+        token = self.token_cache.get(self._cache_key())
+        if token is None and self.access_token is not None:
+            token = (self.access_token, self.expires_at or datetime.datetime.max)
+        if token is None:
+            return None
+        deadline = datetime.datetime.now() + datetime.timedelta(seconds=margin)
+        if token[1] <= deadline:
+            return None
+        return token
 
-        if self.access_token is None or token_expired:
-            access_token, expires_at = self._refresh()
-            self.expires_at = expires_at
-            self.access_token = access_token
+    def add_to_request(self, cfg: RequestConfig) -> RequestConfig:
+        token = self._valid_token()
+        if token is None:
+            with self.token_cache.lock(self._cache_key()):
+                # another thread may have refreshed while this one waited
+                token = self._valid_token() or self._store(self._refresh())
 
+        self.access_token, self.expires_at = token
         self.request_mutator.set_value(self.access_token)
         return self.request_mutator.add_to_request(cfg)
 
+    def _refresh_task(self) -> "asyncio.Future[Token]":
+        """The in-flight token request, started if there is none"""
+        key = self._cache_key()
+        future = self.token_cache.inflight(key)
+        if future is None:
+
+            async def refresh() -> Token:
+                return self._store(await self._arefresh())
+
+            future = asyncio.ensure_future(refresh())
+            # failed background refreshes are retried by the next request
+            future.add_done_callback(lambda f: None if f.cancelled() else f.exception())
+            self.token_cache.set_inflight(key, future)
+        return future
+
+    async def prepare_async(self) -> None:
+        if self._valid_token() is None:
+            token = await asyncio.shield(self._refresh_task())
+            self.access_token, self.expires_at = token
+        elif self._valid_token(self.refresh_margin) is None:
+            self._refresh_task()
+
     def set_value(self, _val: Optional[str]) -> None:
         raise NotImplementedError("an OAuth2 auth provider cannot be a request_mutator")
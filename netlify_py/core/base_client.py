@@ -1,9 +1,17 @@
+import asyncio
+import time
+import typing
 from typing import (
     Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
     List,
     TypeVar,
     Dict,
     Optional,
+    Tuple,
     Type,
     Union,
     cast,
@@ -15,9 +23,21 @@ from pydantic import BaseModel
 
 from .api_error import ApiError
 from .auth import AuthProvider
+from .download import Destination, Download, DownloadTarget
+from .deploy_body import AsyncDeployBody, DeployBody
+from .file_stream import AsyncFileStream, FileStream
+from .pagination import link_page, next_page
 from .request import RequestConfig, RequestOptions, default_request_options, QueryParams
-from .response import from_encodable, AsyncStreamResponse, StreamResponse
-from .utils import get_response_type, filter_binary_response
+from .response import AsyncStreamResponse, StreamResponse
+from .json_decoder import JsonDecoder, default_json_decoder
+from .json_stream import JsonArrayDecoder
+from .lazy import RESPONSE_MODES, ResponseMode, load_lazy
+from .projection import project
+from .http_cache import CacheLookup, CachedResponse, HttpCache, request_key
+from .rate_limit import RateLimiter
+from .resource_cache import ResourceCache, ResourceLookup
+from .retry import RetryPolicy, is_replayable
+from .utils import get_response_type
 from .binary_response import BinaryResponse
 
 NoneType = type(None)
@@ -36,20 +56,52 @@ class BaseClient:
     Attributes:
         _base_url: Base URL for the API endpoint
         _auths: Dictionary mapping auth provider IDs to AuthProvider instances
+        _retry: Retry policy applied to every request, if any
+        _rate_limiter: Rate limiter every request draws from, if any
+        _http_cache: Conditional request cache of GET requests, if any
+        _resource_cache: Cache of parsed read-mostly resources, if any
+        _json_decoder: Decoder of JSON response bodies
+        _response_mode: How JSON response bodies are returned
     """
 
     def __init__(
         self,
         *,
         base_url: str,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_cache: Optional[HttpCache] = None,
+        resource_cache: Optional[ResourceCache] = None,
+        json_decoder: Optional[JsonDecoder] = None,
+        response_mode: ResponseMode = "model",
     ):
         """Initialize the base client.
 
         Args:
             base_url: Base URL for the API endpoint
+            retry: Retry policy applied to every request, None disables retries
+            rate_limiter: Rate limiter every request draws from, None disables
+                client-side rate limiting
+            http_cache: Conditional request cache of GET requests, None
+                disables caching
+            resource_cache: Cache of parsed read-mostly resources, None
+                disables it
+            json_decoder: Decoder of JSON response bodies, by default the
+                fastest one available
+            response_mode: How JSON response bodies are returned: validated
+                `"model"`s, unvalidated `"dict"`s, or `"lazy"` models validated
+                on first attribute access
         """
         self._base_url = base_url
         self._auths: Dict[str, AuthProvider] = {}
+        self._retry = retry
+        self._rate_limiter = rate_limiter
+        self._http_cache = http_cache
+        self._resource_cache = resource_cache
+        self._json_decoder = json_decoder or default_json_decoder()
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"unknown response mode {response_mode!r}")
+        self._response_mode = response_mode
 
     def register_auth(self, auth_id: str, provider: AuthProvider):
         """Register an authentication provider.
@@ -105,6 +157,38 @@ class BaseClient:
         except TypeError:
             return False
 
+    def _response_mode_of(self, opts: Optional[RequestOptions]) -> ResponseMode:
+        """Response mode of a request, `opts["response_mode"]` overriding the
+        client's mode. Projected requests (`opts["fields"]`) are decoded as
+        `"dict"`, the projection being built from the parsed JSON.
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if (opts or {}).get("fields"):
+            return "dict"
+        mode = (opts or {}).get("response_mode", self._response_mode)
+        if mode not in RESPONSE_MODES:
+            raise ValueError(f"unknown response mode {mode!r}")
+        return mode
+
+    def _project(self, value: Any, opts: Optional[RequestOptions]) -> Any:
+        """Projects a `"dict"` mode value onto `opts["fields"]`, if set"""
+        fields = (opts or {}).get("fields")
+        return project(value, fields) if fields else value
+
+    def _load_item(
+        self, item: bytes, item_type: Any, opts: Optional[RequestOptions]
+    ) -> Any:
+        """Decodes an item of a streamed JSON array in the request's mode"""
+        mode = self._response_mode_of(opts)
+        if mode == "model":
+            return self._json_decoder.validate(item, item_type)
+        data = self._json_decoder.loads(item)
+        if mode == "lazy":
+            return load_lazy(data=data, load_with=item_type)
+        return self._project(data, opts)
+
     def _apply_auth(
         self, *, cfg: RequestConfig, auth_names: List[str]
     ) -> RequestConfig:
@@ -246,6 +330,30 @@ class BaseClient:
 
         if content is not None:
             cfg["content"] = content
+            if isinstance(content, (FileStream, AsyncFileStream)):
+                cfg = self._apply_content_length(cfg=cfg, length=content.length)
+
+        return cfg
+
+    def _apply_content_length(
+        self, *, cfg: RequestConfig, length: Optional[int]
+    ) -> RequestConfig:
+        """Declare the size of a streamed request body.
+
+        Without an explicit length, streamed bodies are sent with chunked
+        transfer encoding.
+
+        Args:
+            cfg: Request configuration to modify
+            length: Body size in bytes, if known
+
+        Returns:
+            Modified request configuration
+        """
+        if length is not None:
+            headers = cfg.get("headers", {})
+            headers["content-length"] = str(length)
+            cfg["headers"] = headers
 
         return cfg
 
@@ -303,12 +411,15 @@ class BaseClient:
         *,
         response=httpx.Response,
         cast_to: Union[Type[T], Any],
+        response_mode: Optional[ResponseMode] = None,
     ) -> T:
         """Process an HTTP response and convert it to the desired type.
 
         Args:
             response: HTTP response to process
             cast_to: Type to cast the response data to
+            response_mode: How a JSON body is returned, the client's mode by
+                default
 
         Returns:
             Processed response data of the specified type
@@ -328,11 +439,14 @@ class BaseClient:
         response_type = get_response_type(response.headers)
 
         if response_type == "json":
-            if cast_to is type(Any):
-                return response.json()
-            return from_encodable(
-                data=response.json(), load_with=filter_binary_response(cast_to=cast_to)
-            )
+            mode = response_mode or self._response_mode
+            if cast_to is type(Any) or mode == "dict":
+                return self._json_decoder.loads(response.content)
+            if mode == "lazy":
+                return load_lazy(
+                    data=self._json_decoder.loads(response.content), load_with=cast_to
+                )
+            return self._json_decoder.validate(response.content, cast_to)
         elif response_type == "text":
             return cast(T, response.text)
         else:
@@ -341,6 +455,254 @@ class BaseClient:
                 BinaryResponse(content=response.content, headers=response.headers),
             )
 
+    def _retry_policy(
+        self, *, cfg: RequestConfig, opts: Optional[RequestOptions]
+    ) -> Optional[RetryPolicy]:
+        """Retry policy of a request, None if it must be sent only once.
+
+        Args:
+            cfg: Request configuration to send
+            opts: Request options, whose `retry` overrides the client policy
+
+        Returns:
+            The applicable retry policy, or None
+        """
+        policy = (opts or {}).get("retry", self._retry)
+        if policy is None or not is_replayable(cfg.get("content")):
+            return None
+        if policy.budget is not None:
+            policy.budget.record_request()
+        return policy
+
+    def _retry_delay(
+        self,
+        *,
+        policy: Optional[RetryPolicy],
+        method: str,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Delay before sending a request again, None if it is not retried.
+
+        Args:
+            policy: Retry policy of the request
+            method: HTTP method of the request
+            attempt: Number of the retry that would be sent, starting at 1
+            response: Response of the previous attempt
+            error: Transport error of the previous attempt
+
+        Returns:
+            Seconds to wait before retrying, or None
+        """
+        if policy is None:
+            return None
+        if response is not None:
+            if not policy.should_retry_response(method, response):
+                return None
+            delay = policy.response_delay(response, attempt)
+        elif error is not None and policy.should_retry_error(method, error):
+            delay = policy.backoff(attempt)
+        else:
+            return None
+
+        if delay is None or not policy.allow(attempt):
+            return None
+        return delay
+
+    def _route(self, cfg: RequestConfig) -> str:
+        """API path of a request, e.g. `/deploys/{deploy_id}/files/{path}`"""
+        url = str(cfg["url"])
+        base = self._base_url.rstrip("/")
+        if url.startswith(base):
+            return url[len(base) :]
+        return httpx.URL(url).path
+
+    def _throttle_delay(self, cfg: RequestConfig) -> float:
+        """Seconds to wait before sending a request, per the rate limiter.
+
+        Args:
+            cfg: Request configuration about to be sent
+
+        Returns:
+            Delay in seconds, 0 when the request may be sent immediately
+        """
+        if self._rate_limiter is None:
+            return 0.0
+        return self._rate_limiter.reserve(cfg["method"], self._route(cfg))
+
+    def _observe_rate_limit(
+        self, *, cfg: RequestConfig, response: httpx.Response
+    ) -> None:
+        """Update the rate limiter with the rate limit headers of a response.
+
+        Args:
+            cfg: Request configuration that was sent
+            response: Response to the request
+        """
+        if self._rate_limiter is not None:
+            self._rate_limiter.observe(cfg["method"], self._route(cfg), response)
+
+    def _resource_lookup(
+        self,
+        *,
+        cfg: RequestConfig,
+        cast_to: Union[Type[T], Any],
+        response_mode: ResponseMode,
+    ) -> Optional[ResourceLookup]:
+        """Look up a request in the resource cache.
+
+        Args:
+            cfg: Request configuration about to be sent
+            cast_to: Type the response is cast to
+            response_mode: How the response body is returned
+
+        Returns:
+            The lookup, None if the request is not cached
+        """
+        if self._resource_cache is None:
+            return None
+        if isinstance(cast_to, type) and issubclass(cast_to, httpx.Response):
+            return None
+        route = f"{cfg['method'].upper()} {self._route(cfg)}"
+        return self._resource_cache.lookup(
+            cfg, route=route, cast_to=(cast_to, response_mode)
+        )
+
+    def _invalidate_resources(self, cfg: RequestConfig) -> None:
+        """Drop the cached resources a modifying request may have changed.
+
+        Args:
+            cfg: Request configuration that was sent
+        """
+        if self._resource_cache is not None:
+            self._resource_cache.observe(f"{cfg['method'].upper()} {self._route(cfg)}")
+
+    def _cache_lookup(self, cfg: RequestConfig) -> Optional[CacheLookup]:
+        """Look up a request in the HTTP cache, making it conditional on a hit.
+
+        Args:
+            cfg: Request configuration to modify
+
+        Returns:
+            The cache lookup, None if the request is not cached
+        """
+        if self._http_cache is None:
+            return None
+        return self._http_cache.prepare(cfg)
+
+    def _process_cacheable_response(
+        self,
+        *,
+        lookup: CacheLookup,
+        response: httpx.Response,
+        cast_to: Union[Type[T], Any],
+        response_mode: ResponseMode,
+    ) -> T:
+        """Process the response to a cached request.
+
+        A `304 Not Modified` is answered with the stored response, whose parsed
+        body is reused when the backend keeps it.
+
+        Args:
+            lookup: Cache lookup of the request
+            response: HTTP response to process
+            cast_to: Type to cast the response data to
+            response_mode: How a JSON body is returned
+
+        Returns:
+            Processed response data of the specified type
+
+        Raises:
+            ApiError: If the response indicates an error
+        """
+        assert self._http_cache is not None
+        entry = self._http_cache.update(lookup, response)
+        if entry is not None and response.status_code == 304:
+            try:
+                return entry.parsed[(cast_to, response_mode)]
+            except (KeyError, TypeError):
+                pass
+            response = entry.to_response(response.request)
+
+        if not response.is_success:
+            raise ApiError(response=response)
+
+        if self._cast_to_raw_response(res=response, cast_to=cast_to):
+            return response
+
+        if entry is None:
+            return self.process_response(
+                response=response, cast_to=cast_to, response_mode=response_mode
+            )
+        return self._cached_value(
+            entry=entry, response=response, cast_to=cast_to, response_mode=response_mode
+        )
+
+    def _cached_value(
+        self,
+        *,
+        entry: CachedResponse,
+        response: httpx.Response,
+        cast_to: Union[Type[T], Any],
+        response_mode: ResponseMode,
+    ) -> T:
+        """Parsed body of a cached response, parsing it at most once per type
+        and response mode.
+
+        Args:
+            entry: Cached response
+            response: HTTP response rebuilt from, or stored in, `entry`
+            cast_to: Type to cast the response data to
+            response_mode: How a JSON body is returned
+
+        Returns:
+            Processed response data of the specified type
+        """
+        key = (cast_to, response_mode)
+        try:
+            return entry.parsed[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable type
+            return self.process_response(
+                response=response, cast_to=cast_to, response_mode=response_mode
+            )
+
+        value = self.process_response(
+            response=response, cast_to=cast_to, response_mode=response_mode
+        )
+        entry.parsed[key] = value
+        return value
+
+    def _page_query(
+        self, *, query_params: Optional[QueryParams], page: int
+    ) -> QueryParams:
+        """Copy of the query parameters requesting a specific page.
+
+        Args:
+            query_params: Query parameters of the paginated request
+            page: Page number to request
+
+        Returns:
+            New query parameters including `page`
+        """
+        params: QueryParams = dict(query_params or {})
+        params["page"] = page
+        return params
+
+    def _page_size(self, query_params: Optional[QueryParams]) -> Optional[int]:
+        """Requested page size of a paginated request, if any.
+
+        Args:
+            query_params: Query parameters of the paginated request
+
+        Returns:
+            The `per_page` query parameter as an int, or None if not requested
+        """
+        per_page = (query_params or {}).get("per_page")
+        return per_page if isinstance(per_page, int) else None
+
 
 class SyncBaseClient(BaseClient):
     """Synchronous HTTP client implementation.
@@ -353,16 +715,94 @@ class SyncBaseClient(BaseClient):
         *,
         base_url: str,
         httpx_client: httpx.Client,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_cache: Optional[HttpCache] = None,
+        resource_cache: Optional[ResourceCache] = None,
+        json_decoder: Optional[JsonDecoder] = None,
+        response_mode: ResponseMode = "model",
     ):
         """Initialize the synchronous client.
 
         Args:
             base_url: Base URL for the API endpoint
             httpx_client: Synchronous HTTPX client instance
+            retry: Retry policy applied to every request, None disables retries
+            rate_limiter: Rate limiter every request draws from, None disables
+                client-side rate limiting
+            http_cache: Conditional request cache of GET requests, None
+                disables caching
+            resource_cache: Cache of parsed read-mostly resources, None
+                disables it
+            json_decoder: Decoder of JSON response bodies, by default the
+                fastest one available
+            response_mode: How JSON response bodies are returned: validated
+                `"model"`s, unvalidated `"dict"`s, or `"lazy"` models validated
+                on first attribute access
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            http_cache=http_cache,
+            resource_cache=resource_cache,
+            json_decoder=json_decoder,
+            response_mode=response_mode,
+        )
         self.httpx_client = httpx_client
 
+    def _send(
+        self,
+        *,
+        cfg: RequestConfig,
+        opts: Optional[RequestOptions],
+        send: Callable[[], httpx.Response],
+        discard: Callable[[httpx.Response], None],
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures per the retry policy.
+
+        Every attempt waits for the rate limiter first. Cached resources the
+        request may have modified are dropped once it is done, even if it failed.
+
+        Args:
+            cfg: Request configuration to send
+            opts: Request options of the request
+            send: Sends the request once
+            discard: Releases a response that is not returned
+
+        Returns:
+            The response of the last attempt
+        """
+        policy = self._retry_policy(cfg=cfg, opts=opts)
+        attempt = 1
+        while True:
+            throttle = self._throttle_delay(cfg)
+            if throttle > 0:
+                time.sleep(throttle)
+            try:
+                response = send()
+            except httpx.TransportError as e:
+                delay = self._retry_delay(
+                    policy=policy, method=cfg["method"], attempt=attempt, error=e
+                )
+                if delay is None:
+                    self._invalidate_resources(cfg)
+                    raise
+            else:
+                self._observe_rate_limit(cfg=cfg, response=response)
+                delay = self._retry_delay(
+                    policy=policy,
+                    method=cfg["method"],
+                    attempt=attempt,
+                    response=response,
+                )
+                if delay is None:
+                    self._invalidate_resources(cfg)
+                    return response
+                discard(response)
+            time.sleep(delay)
+            attempt += 1
+
     def request(
         self,
         *,
@@ -414,15 +854,89 @@ class SyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        response = self.httpx_client.request(**req_cfg)
+        mode = self._response_mode_of(request_options)
+        resource = self._resource_lookup(
+            cfg=req_cfg, cast_to=cast_to, response_mode=mode
+        )
+        if resource is not None and resource.hit:
+            return self._project(resource.value, request_options)
+
+        lookup = self._cache_lookup(req_cfg)
+        response = self._send(
+            cfg=req_cfg,
+            opts=request_options,
+            send=lambda: self.httpx_client.request(**req_cfg),
+            discard=lambda response: None,
+        )
 
-        if not response.is_success:
+        if lookup is not None:
+            value = self._process_cacheable_response(
+                lookup=lookup, response=response, cast_to=cast_to, response_mode=mode
+            )
+        elif not response.is_success:
             raise ApiError(response=response)
-
-        if self._cast_to_raw_response(res=response, cast_to=cast_to):
+        elif self._cast_to_raw_response(res=response, cast_to=cast_to):
             return response
+        else:
+            value = self.process_response(
+                response=response, cast_to=cast_to, response_mode=mode
+            )
 
-        return self.process_response(response=response, cast_to=cast_to)
+        if resource is not None and self._resource_cache is not None:
+            self._resource_cache.store(resource, value)
+        return self._project(value, request_options)
+
+    def paginate(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: Union[Type[T], Any],
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Iterator[Any]:
+        """Iterate over the items of every page of a paginated endpoint.
+
+        Pages are requested one at a time, starting at page 1, and the next page
+        is taken from the `Link` response header. Only one page of items is held
+        in memory at a time.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            cast_to: List type each page is cast to
+            auth_names: List of auth provider IDs
+            query_params: Query parameters sent with every page
+            request_options: Additional request options
+
+        Returns:
+            Iterator over the items of all pages
+
+        Raises:
+            ApiError: If a page request fails
+        """
+        per_page = self._page_size(query_params)
+        page: Optional[int] = 1
+        while page is not None:
+            response: httpx.Response = self.request(
+                method=method,
+                path=path,
+                cast_to=httpx.Response,
+                auth_names=auth_names,
+                query_params=self._page_query(query_params=query_params, page=page),
+                request_options=request_options,
+            )
+            items = (
+                self.process_response(
+                    response=response,
+                    cast_to=cast_to,
+                    response_mode=self._response_mode_of(request_options),
+                )
+                or []
+            )
+            yield from self._project(items, request_options)
+            page = next_page(response, page=page, count=len(items), per_page=per_page)
 
     def stream_request(
         self,
@@ -475,9 +989,164 @@ class SyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
-        response = context.__enter__()
-        return StreamResponse(response, context, cast_to)
+        contexts = []
+
+        def send() -> httpx.Response:
+            contexts.append(self.httpx_client.stream(**req_cfg))
+            return contexts[-1].__enter__()
+
+        def discard(response: httpx.Response) -> None:
+            contexts[-1].__exit__(None, None, None)
+
+        response = self._send(
+            cfg=req_cfg, opts=request_options, send=send, discard=discard
+        )
+        return StreamResponse(response, contexts[-1], cast_to)
+
+    def stream_items(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: Union[Type[T], Any],
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Iterator[Any]:
+        """Iterate over the items of a JSON array response as they arrive.
+
+        The body is decoded incrementally while it downloads, and each item is
+        validated when it is reached, so memory is bounded by one item rather
+        than by the whole list.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            cast_to: List type of the response
+            auth_names: List of auth provider IDs
+            query_params: Query parameters
+            request_options: Additional request options
+
+        Returns:
+            Iterator over the items of the array
+
+        Raises:
+            ApiError: If the request fails
+            ValueError: If the body is not a JSON array
+        """
+        req_cfg = self.build_request(
+            method=method,
+            path=path,
+            auth_names=auth_names,
+            query_params=query_params,
+            request_options=request_options,
+        )
+        item_type = _list_item_type(cast_to)
+        contexts = []
+
+        def send() -> httpx.Response:
+            contexts.append(self.httpx_client.stream(**req_cfg))
+            return contexts[-1].__enter__()
+
+        def discard(response: httpx.Response) -> None:
+            contexts[-1].__exit__(None, None, None)
+
+        response = self._send(
+            cfg=req_cfg, opts=request_options, send=send, discard=discard
+        )
+        try:
+            if not response.is_success:
+                response.read()
+                raise ApiError(response=response)
+            decoder = JsonArrayDecoder()
+            for chunk in response.iter_bytes():
+                for item in decoder.feed(chunk):
+                    yield self._load_item(item, item_type, request_options)
+            decoder.flush()
+        finally:
+            discard(response)
+
+    def download(
+        self,
+        *,
+        path: str,
+        destination: Destination,
+        method: str = "GET",
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        headers: Optional[Dict[str, str]] = None,
+        request_options: Optional[RequestOptions] = None,
+        resume: bool = True,
+        max_resumes: int = 3,
+    ) -> Download:
+        """Download a response body to a file or writable buffer as it arrives.
+
+        A file is written to `<destination>.part` and renamed once complete.
+        A transfer that breaks off is resumed with a `Range` request, at most
+        `max_resumes` times, and a `.part` file left by an earlier call is
+        resumed from unless `resume` is False.
+
+        Args:
+            path: API endpoint path
+            destination: File path, or a writable binary buffer
+            method: HTTP method
+            auth_names: List of auth provider IDs
+            query_params: Query parameters
+            headers: Request headers
+            request_options: Additional request options
+            resume: Whether to resume from a leftover `.part` file
+            max_resumes: Number of times a broken transfer is resumed
+
+        Returns:
+            The completed download
+
+        Raises:
+            ApiError: If the request fails
+            httpx.TransportError: If the transfer breaks off more than
+                `max_resumes` times
+        """
+        target = DownloadTarget(destination, resume=resume)
+        failures = 0
+        try:
+            while True:
+                req_cfg = self.build_request(
+                    method=method,
+                    path=path,
+                    auth_names=auth_names,
+                    query_params=query_params,
+                    headers={**(headers or {}), **target.request_headers()},
+                    request_options=request_options,
+                )
+                contexts = []
+
+                def send() -> httpx.Response:
+                    contexts.append(self.httpx_client.stream(**req_cfg))
+                    return contexts[-1].__enter__()
+
+                def discard(response: httpx.Response) -> None:
+                    contexts[-1].__exit__(None, None, None)
+
+                response = self._send(
+                    cfg=req_cfg, opts=request_options, send=send, discard=discard
+                )
+                try:
+                    if not response.is_success:
+                        response.read()
+                    action = target.start(response)
+                    if action == "write":
+                        for chunk in response.iter_bytes():
+                            target.write(chunk)
+                    if action != "retry":
+                        return target.finish()
+                except httpx.TransportError:
+                    failures += 1
+                    if failures > max_resumes:
+                        raise
+                finally:
+                    discard(response)
+        except BaseException:
+            target.abort()
+            raise
 
 
 class AsyncBaseClient(BaseClient):
@@ -491,15 +1160,193 @@ class AsyncBaseClient(BaseClient):
         *,
         base_url: str,
         httpx_client: httpx.AsyncClient,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_cache: Optional[HttpCache] = None,
+        resource_cache: Optional[ResourceCache] = None,
+        json_decoder: Optional[JsonDecoder] = None,
+        response_mode: ResponseMode = "model",
+        coalesce: bool = False,
     ):
         """Initialize the asynchronous client.
 
         Args:
             base_url: Base URL for the API endpoint
             httpx_client: Asynchronous HTTPX client instance
+            retry: Retry policy applied to every request, None disables retries
+            rate_limiter: Rate limiter every request draws from, None disables
+                client-side rate limiting
+            http_cache: Conditional request cache of GET requests, None
+                disables caching
+            resource_cache: Cache of parsed read-mostly resources, None
+                disables it
+            json_decoder: Decoder of JSON response bodies, by default the
+                fastest one available
+            response_mode: How JSON response bodies are returned: validated
+                `"model"`s, unvalidated `"dict"`s, or `"lazy"` models validated
+                on first attribute access
+            coalesce: Whether identical concurrent GET requests share a single
+                request
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            http_cache=http_cache,
+            resource_cache=resource_cache,
+            json_decoder=json_decoder,
+            response_mode=response_mode,
+        )
         self.httpx_client = httpx_client
+        self._coalesce = coalesce
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Task[httpx.Response]"] = {}
+
+    async def _send(
+        self,
+        *,
+        cfg: RequestConfig,
+        opts: Optional[RequestOptions],
+        send: Callable[[], Awaitable[httpx.Response]],
+        discard: Callable[[httpx.Response], Awaitable[None]],
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures per the retry policy.
+
+        Every attempt waits for the rate limiter first. Cached resources the
+        request may have modified are dropped once it is done, even if it failed.
+
+        Args:
+            cfg: Request configuration to send
+            opts: Request options of the request
+            send: Sends the request once
+            discard: Releases a response that is not returned
+
+        Returns:
+            The response of the last attempt
+        """
+        policy = self._retry_policy(cfg=cfg, opts=opts)
+        attempt = 1
+        while True:
+            throttle = self._throttle_delay(cfg)
+            if throttle > 0:
+                await asyncio.sleep(throttle)
+            try:
+                response = await send()
+            except httpx.TransportError as e:
+                delay = self._retry_delay(
+                    policy=policy, method=cfg["method"], attempt=attempt, error=e
+                )
+                if delay is None:
+                    self._invalidate_resources(cfg)
+                    raise
+            else:
+                self._observe_rate_limit(cfg=cfg, response=response)
+                delay = self._retry_delay(
+                    policy=policy,
+                    method=cfg["method"],
+                    attempt=attempt,
+                    response=response,
+                )
+                if delay is None:
+                    self._invalidate_resources(cfg)
+                    return response
+                await discard(response)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_coalesced(
+        self,
+        *,
+        cfg: RequestConfig,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Send a request, sharing the response of an identical one in flight.
+
+        GET requests with the same URL, query parameters, credentials and
+        conditional headers are sent once and every caller receives the same
+        fully read response. The shared request runs in its own task, so a
+        cancelled caller does not cancel it for the others.
+
+        Args:
+            cfg: Request configuration to send
+            send: Sends the request, including retries
+
+        Returns:
+            The response to the request
+        """
+        if not self._coalesce or cfg["method"].upper() != "GET":
+            return await send()
+
+        headers = {k.lower(): v for k, v in cfg.get("headers", {}).items()}
+        key = (
+            asyncio.get_running_loop(),
+            request_key(cfg),
+            headers.get("if-none-match"),
+            headers.get("if-modified-since"),
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(send())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._request_done(key, done))
+        return await asyncio.shield(task)
+
+    def _request_done(
+        self, key: Tuple[Any, ...], task: "asyncio.Task[httpx.Response]"
+    ) -> None:
+        """Forget a finished shared request.
+
+        Args:
+            key: Key the request was shared under
+            task: Task that sent the request
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved even when every caller was cancelled
+
+    def _apply_body(
+        self,
+        *,
+        cfg: RequestConfig,
+        data: Optional[httpx._types.RequestData] = None,
+        files: Optional[httpx._types.RequestFiles] = None,
+        json: Optional[Any] = None,
+        content: Optional[httpx._types.RequestContent] = None,
+    ) -> RequestConfig:
+        """Apply request body content to the request configuration.
+
+        Streamed file uploads are read asynchronously, and streamed deploy
+        bodies are wrapped for the asynchronous transport.
+
+        Args:
+            cfg: Request configuration to modify
+            data: Optional form data
+            files: Optional files to upload
+            json: Optional JSON data
+            content: Optional raw content
+
+        Returns:
+            Modified request configuration
+        """
+        if isinstance(content, FileStream):
+            content = AsyncFileStream(content)
+        elif isinstance(content, DeployBody):
+            content = AsyncDeployBody(content)
+
+        return super()._apply_body(
+            cfg=cfg, data=data, files=files, json=json, content=content
+        )
+
+    async def _prepare_auth(self, *, auth_names: Optional[List[str]]) -> None:
+        """Let auth providers do their I/O (e.g. token refresh) asynchronously.
+
+        Args:
+            auth_names: List of auth provider IDs used by the request
+        """
+        for auth_name in auth_names or []:
+            auth_provider = self._auths.get(auth_name)
+            if auth_provider is not None:
+                await auth_provider.prepare_async()
 
     async def request(
         self,
@@ -539,6 +1386,7 @@ class AsyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
+        await self._prepare_auth(auth_names=auth_names)
         req_cfg = self.build_request(
             method=method,
             path=path,
@@ -552,15 +1400,145 @@ class AsyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        response = await self.httpx_client.request(**req_cfg)
+        mode = self._response_mode_of(request_options)
+        resource = self._resource_lookup(
+            cfg=req_cfg, cast_to=cast_to, response_mode=mode
+        )
+        if resource is not None and resource.hit:
+            return self._project(resource.value, request_options)
+
+        lookup = self._cache_lookup(req_cfg)
+        response = await self._send_coalesced(
+            cfg=req_cfg,
+            send=lambda: self._send(
+                cfg=req_cfg,
+                opts=request_options,
+                send=lambda: self.httpx_client.request(**req_cfg),
+                discard=_discard_response,
+            ),
+        )
 
-        if not response.is_success:
+        if lookup is not None:
+            value = self._process_cacheable_response(
+                lookup=lookup, response=response, cast_to=cast_to, response_mode=mode
+            )
+        elif not response.is_success:
             raise ApiError(response=response)
-
-        if self._cast_to_raw_response(res=response, cast_to=cast_to):
+        elif self._cast_to_raw_response(res=response, cast_to=cast_to):
             return response
+        else:
+            value = self.process_response(
+                response=response, cast_to=cast_to, response_mode=mode
+            )
+
+        if resource is not None and self._resource_cache is not None:
+            self._resource_cache.store(resource, value)
+        return self._project(value, request_options)
+
+    async def paginate(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: Union[Type[T], Any],
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        request_options: Optional[RequestOptions] = None,
+        max_concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the items of every page of a paginated endpoint.
+
+        By default the next page (taken from the `Link` response header) is
+        requested in the background while the items of the current page are
+        consumed.
+
+        With `max_concurrency > 1` and a first response advertising the last
+        page (`rel="last"`), the remaining pages are fetched in parallel with at
+        most `max_concurrency` requests in flight. Pages are yielded in page
+        order when `ordered` is true, otherwise as soon as they arrive. Without
+        a `rel="last"` link the pages are walked serially.
+
+        Pending requests are cancelled if iteration stops early or a page fails.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            cast_to: List type each page is cast to
+            auth_names: List of auth provider IDs
+            query_params: Query parameters sent with every page
+            request_options: Additional request options
+            max_concurrency: Maximum number of page requests in flight
+            ordered: Whether to yield pages in page order
 
-        return self.process_response(response=response, cast_to=cast_to)
+        Returns:
+            Async iterator over the items of all pages
+
+        Raises:
+            ApiError: If a page request fails
+        """
+        per_page = self._page_size(query_params)
+
+        def fetch(page: int) -> "asyncio.Task[httpx.Response]":
+            return asyncio.ensure_future(
+                self.request(
+                    method=method,
+                    path=path,
+                    cast_to=httpx.Response,
+                    auth_names=auth_names,
+                    query_params=self._page_query(query_params=query_params, page=page),
+                    request_options=request_options,
+                )
+            )
+
+        pending: Dict["asyncio.Task[httpx.Response]", int] = {}
+        try:
+            page = 1
+            pending[fetch(page)] = page
+            last = None
+            while pending:
+                if last is None:
+                    # serial walk, prefetching the following page
+                    task = next(iter(pending))
+                elif ordered:
+                    task = next(t for t, p in pending.items() if p == page)
+                else:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    task = done.pop()
+                page = pending.pop(task)
+                response = await task
+                items = (
+                    self.process_response(
+                        response=response,
+                        cast_to=cast_to,
+                        response_mode=self._response_mode_of(request_options),
+                    )
+                    or []
+                )
+
+                if page == 1 and max_concurrency > 1:
+                    last = link_page(response, "last")
+                    scheduled = 1
+                if last is not None:
+                    while len(pending) < max_concurrency and scheduled < last:
+                        scheduled += 1
+                        pending[fetch(scheduled)] = scheduled
+                    page += 1
+                else:
+                    following = next_page(
+                        response, page=page, count=len(items), per_page=per_page
+                    )
+                    if following is not None:
+                        page = following
+                        pending[fetch(page)] = page
+
+                for item in self._project(items, request_options):
+                    yield item
+        finally:
+            for task in pending:
+                _discard_task(task)
 
     async def stream_request(
         self,
@@ -600,6 +1578,7 @@ class AsyncBaseClient(BaseClient):
         Raises:
             ApiError: If the request fails
         """
+        await self._prepare_auth(auth_names=auth_names)
         req_cfg = self.build_request(
             method=method,
             path=path,
@@ -613,6 +1592,188 @@ class AsyncBaseClient(BaseClient):
             content=content,
             request_options=request_options,
         )
-        context = self.httpx_client.stream(**req_cfg)
-        response = await context.__aenter__()
-        return AsyncStreamResponse(response, context, cast_to)
+        contexts = []
+
+        async def send() -> httpx.Response:
+            contexts.append(self.httpx_client.stream(**req_cfg))
+            return await contexts[-1].__aenter__()
+
+        async def discard(response: httpx.Response) -> None:
+            await contexts[-1].__aexit__(None, None, None)
+
+        response = await self._send(
+            cfg=req_cfg, opts=request_options, send=send, discard=discard
+        )
+        return AsyncStreamResponse(response, contexts[-1], cast_to)
+
+    async def stream_items(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: Union[Type[T], Any],
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the items of a JSON array response as they arrive.
+
+        The body is decoded incrementally while it downloads, and each item is
+        validated when it is reached, so memory is bounded by one item rather
+        than by the whole list.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            cast_to: List type of the response
+            auth_names: List of auth provider IDs
+            query_params: Query parameters
+            request_options: Additional request options
+
+        Returns:
+            Iterator over the items of the array
+
+        Raises:
+            ApiError: If the request fails
+            ValueError: If the body is not a JSON array
+        """
+        await self._prepare_auth(auth_names=auth_names)
+        req_cfg = self.build_request(
+            method=method,
+            path=path,
+            auth_names=auth_names,
+            query_params=query_params,
+            request_options=request_options,
+        )
+        item_type = _list_item_type(cast_to)
+        contexts = []
+
+        async def send() -> httpx.Response:
+            contexts.append(self.httpx_client.stream(**req_cfg))
+            return await contexts[-1].__aenter__()
+
+        async def discard(response: httpx.Response) -> None:
+            await contexts[-1].__aexit__(None, None, None)
+
+        response = await self._send(
+            cfg=req_cfg, opts=request_options, send=send, discard=discard
+        )
+        try:
+            if not response.is_success:
+                await response.aread()
+                raise ApiError(response=response)
+            decoder = JsonArrayDecoder()
+            async for chunk in response.aiter_bytes():
+                for item in decoder.feed(chunk):
+                    yield self._load_item(item, item_type, request_options)
+            decoder.flush()
+        finally:
+            await discard(response)
+
+    async def download(
+        self,
+        *,
+        path: str,
+        destination: Destination,
+        method: str = "GET",
+        auth_names: Optional[List[str]] = None,
+        query_params: Optional[QueryParams] = None,
+        headers: Optional[Dict[str, str]] = None,
+        request_options: Optional[RequestOptions] = None,
+        resume: bool = True,
+        max_resumes: int = 3,
+    ) -> Download:
+        """Download a response body to a file or writable buffer as it arrives.
+
+        A file is written to `<destination>.part` and renamed once complete.
+        A transfer that breaks off is resumed with a `Range` request, at most
+        `max_resumes` times, and a `.part` file left by an earlier call is
+        resumed from unless `resume` is False.
+
+        Args:
+            path: API endpoint path
+            destination: File path, or a writable binary buffer
+            method: HTTP method
+            auth_names: List of auth provider IDs
+            query_params: Query parameters
+            headers: Request headers
+            request_options: Additional request options
+            resume: Whether to resume from a leftover `.part` file
+            max_resumes: Number of times a broken transfer is resumed
+
+        Returns:
+            The completed download
+
+        Raises:
+            ApiError: If the request fails
+            httpx.TransportError: If the transfer breaks off more than
+                `max_resumes` times
+        """
+        target = DownloadTarget(destination, resume=resume)
+        failures = 0
+        try:
+            while True:
+                # a token may expire during a long download, refresh it for
+                # every (resumed) request without blocking the event loop
+                await self._prepare_auth(auth_names=auth_names)
+                req_cfg = self.build_request(
+                    method=method,
+                    path=path,
+                    auth_names=auth_names,
+                    query_params=query_params,
+                    headers={**(headers or {}), **target.request_headers()},
+                    request_options=request_options,
+                )
+                contexts = []
+
+                async def send() -> httpx.Response:
+                    contexts.append(self.httpx_client.stream(**req_cfg))
+                    return await contexts[-1].__aenter__()
+
+                async def discard(response: httpx.Response) -> None:
+                    await contexts[-1].__aexit__(None, None, None)
+
+                response = await self._send(
+                    cfg=req_cfg, opts=request_options, send=send, discard=discard
+                )
+                try:
+                    if not response.is_success:
+                        await response.aread()
+                    action = target.start(response)
+                    if action == "write":
+                        async for chunk in response.aiter_bytes():
+                            target.write(chunk)
+                    if action != "retry":
+                        return target.finish()
+                except httpx.TransportError:
+                    failures += 1
+                    if failures > max_resumes:
+                        raise
+                finally:
+                    await discard(response)
+        except BaseException:
+            target.abort()
+            raise
+
+
+def _list_item_type(cast_to: Any) -> Any:
+    """Item type of a list type, `Any` for untyped lists"""
+    args = typing.get_args(cast_to)
+    return args[0] if args else Any
+
+
+def _discard_task(task: "asyncio.Future[Any]") -> None:
+    """Cancel a background request that is no longer needed.
+
+    If it already finished with an error, the error is retrieved so that it is
+    not reported as an unhandled task exception.
+    """
+    if task.done():
+        if not task.cancelled():
+            task.exception()
+    else:
+        task.cancel()
+
+
+async def _discard_response(response: httpx.Response) -> None:
+    """Release a fully read response that is not returned"""
@@ -0,0 +1,155 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+"""
+Bounded-concurrency execution of many SDK calls.
+
+Calls go through the client they were made with, so its retry policy, rate
+limiter and caches apply to each of them. A failing call does not stop the
+batch: its exception is captured in its result.
+"""
+
+T = TypeVar("T")
+
+
+class BatchResult(Generic[T]):
+    """
+    Outcome of one call of a batch.
+
+    Attributes:
+        index: Position of the call in the batch
+        value: Return value of the call, if it succeeded
+        error: Exception raised by the call, if it failed
+    """
+
+    __slots__ = ("index", "value", "error")
+
+    def __init__(
+        self,
+        *,
+        index: int,
+        value: Optional[T] = None,
+        error: Optional[BaseException] = None,
+    ):
+        self.index = index
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded"""
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """
+        Return value of the call.
+
+        Raises:
+            BaseException: The exception raised by the call
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"BatchResult(index={self.index}, error={self.error!r})"
+        return f"BatchResult(index={self.index}, value={self.value!r})"
+
+
+ProgressCallback = Callable[[int, int, BatchResult[Any]], None]
+
+
+def run_batch(
+    calls: Iterable[Callable[[], T]],
+    *,
+    max_workers: int = 16,
+    on_progress: Optional[ProgressCallback] = None,
+) -> List[BatchResult[T]]:
+    """
+    Runs calls on a thread pool.
+
+    Args:
+        calls: Calls without arguments, e.g. `functools.partial` or lambdas
+        max_workers: Maximum number of calls running at once
+        on_progress: Called with (completed, total, result) after each call,
+            from the thread that completed it
+
+    Returns:
+        One result per call, in the order of `calls`
+    """
+    calls = list(calls)
+    total = len(calls)
+    results: List[Optional[BatchResult[T]]] = [None] * total
+    completed = 0
+    lock = threading.Lock()
+
+    def run(index: int, call: Callable[[], T]) -> None:
+        nonlocal completed
+        try:
+            result = BatchResult(index=index, value=call())
+        except Exception as e:
+            result = BatchResult(index=index, error=e)
+        results[index] = result
+        with lock:
+            completed += 1
+            done = completed
+        if on_progress is not None:
+            on_progress(done, total, result)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(run, index, call) for index, call in enumerate(calls)]
+        for future in futures:
+            future.result()
+    return results  # type: ignore[return-value]
+
+
+async def arun_batch(
+    calls: Iterable[Callable[[], Awaitable[T]]],
+    *,
+    max_concurrency: int = 16,
+    on_progress: Optional[ProgressCallback] = None,
+) -> List[BatchResult[T]]:
+    """
+    Runs coroutine functions concurrently, at most `max_concurrency` at once.
+
+    Args:
+        calls: Calls without arguments returning awaitables, e.g.
+            `lambda: client.sites.get(site_id=site_id)`
+        max_concurrency: Maximum number of calls awaited at once
+        on_progress: Called with (completed, total, result) after each call
+
+    Returns:
+        One result per call, in the order of `calls`
+    """
+    calls = list(calls)
+    total = len(calls)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    completed = 0
+
+    async def run(index: int, call: Callable[[], Awaitable[T]]) -> BatchResult[T]:
+        nonlocal completed
+        async with semaphore:
+            try:
+                result = BatchResult(index=index, value=await call())
+            except Exception as e:
+                result = BatchResult(index=index, error=e)
+        completed += 1
+        if on_progress is not None:
+            on_progress(completed, total, result)
+        return result
+
+    return list(
+        await asyncio.gather(*(run(index, call) for index, call in enumerate(calls)))
+    )
@@ -0,0 +1,152 @@
+import importlib.util
+from typing import Any, Dict, Optional
+
+import httpx
+
+"""
+Connection pool, protocol and timeout settings of the underlying HTTPX client.
+
+HTTP/2 needs the optional `h2` package (`pip install httpx[http2]`).
+"""
+
+
+def http2_available() -> bool:
+    """Whether the optional `h2` package needed for HTTP/2 is installed"""
+    return importlib.util.find_spec("h2") is not None
+
+
+class ConnectionProfile:
+    """
+    Tuning of the connection pool, HTTP version and timeouts of a client.
+
+    Use one of the presets, or configure a profile for your workload:
+
+    - `ConnectionProfile.bulk_upload()`: many concurrent long-lived
+      connections, HTTP/2 when available and generous write timeouts, for
+      deploys of thousands of files
+    - `ConnectionProfile.interactive()`: a small pool and short timeouts that
+      fail fast, for CLIs and request handlers
+
+    Examples:
+    ```py
+    client = Client(token="...", connection=ConnectionProfile.bulk_upload())
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        connect_timeout: Optional[float] = 60.0,
+        read_timeout: Optional[float] = 60.0,
+        write_timeout: Optional[float] = 60.0,
+        pool_timeout: Optional[float] = 60.0,
+        http2: Optional[bool] = False,
+    ):
+        """
+        Initialize a connection profile. The defaults match the client
+        created when no profile is given.
+
+        Args:
+            max_connections: Maximum number of open connections, None for no limit
+            max_keepalive_connections: Maximum number of idle connections kept open
+            keepalive_expiry: Seconds an idle connection is kept open
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for a chunk of the response
+            write_timeout: Seconds to wait for a chunk of the request to be sent
+            pool_timeout: Seconds to wait for a free connection from the pool
+            http2: Whether to negotiate HTTP/2, None to use it only when the
+                optional `h2` package is installed
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.write_timeout = write_timeout
+        self.pool_timeout = pool_timeout
+        self.http2 = http2
+
+    @classmethod
+    def bulk_upload(cls) -> "ConnectionProfile":
+        """
+        Profile for high-throughput workloads such as large deploys.
+
+        Keeps up to 100 connections alive, multiplexes requests over HTTP/2
+        when `h2` is installed, allows slow uploads of large files and lets
+        requests queue for a connection instead of failing.
+        """
+        return cls(
+            max_connections=100,
+            max_keepalive_connections=100,
+            keepalive_expiry=60.0,
+            connect_timeout=10.0,
+            read_timeout=120.0,
+            write_timeout=300.0,
+            pool_timeout=None,
+            http2=None,
+        )
+
+    @classmethod
+    def interactive(cls) -> "ConnectionProfile":
+        """
+        Profile for latency-sensitive, low-volume use.
+
+        Uses a small pool over HTTP/1.1 and short timeouts so that an
+        unreachable or slow API surfaces quickly.
+        """
+        return cls(
+            max_connections=10,
+            max_keepalive_connections=5,
+            keepalive_expiry=15.0,
+            connect_timeout=3.0,
+            read_timeout=15.0,
+            write_timeout=15.0,
+            pool_timeout=5.0,
+            http2=False,
+        )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """Connection pool limits"""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        """Granular request timeouts"""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def use_http2(self) -> bool:
+        """
+        Whether clients built from this profile negotiate HTTP/2.
+
+        Raises:
+            ImportError: If HTTP/2 is required but `h2` is not installed
+        """
+        if self.http2 is None:
+            return http2_available()
+        if self.http2 and not http2_available():
+            raise ImportError(
+                "HTTP/2 requires the 'h2' package, "
+                "install it with `pip install httpx[http2]`"
+            )
+        return self.http2
+
+    def httpx_options(self) -> Dict[str, Any]:
+        """Keyword arguments for `httpx.Client` and `httpx.AsyncClient`"""
+        return {
+            "limits": self.limits,
+            "timeout": self.timeout,
+            "http2": self.use_http2(),
+        }
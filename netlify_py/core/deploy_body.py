@@ -0,0 +1,166 @@
+import itertools
+import json
+import typing
+import zlib
+from json.encoder import encode_basestring_ascii
+
+"""
+Streamed JSON bodies for creating deploys.
+
+A deploy of a large site lists hundreds of thousands of path to digest
+entries. `DeployBody` encodes them into the request body chunk by chunk,
+straight from a mapping or an iterator of pairs, instead of validating the
+whole mapping with a model and serializing it into one string first. The
+body can be gzip compressed on the fly.
+"""
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+GZIP_LEVEL = 6
+
+# entries encoded per string join
+_BATCH = 1024
+
+Digests = typing.Union[
+    typing.Mapping[str, str], typing.Iterable[typing.Tuple[str, str]]
+]
+
+
+def _pairs(digests: Digests) -> typing.Iterator[typing.Tuple[str, str]]:
+    if isinstance(digests, typing.Mapping):
+        return iter(digests.items())
+    return iter(digests)
+
+
+def _encode_object(digests: Digests) -> typing.Iterator[str]:
+    """Encodes pairs of strings as a JSON object, in pieces"""
+    pairs = _pairs(digests)
+    separator = "{"
+    while True:
+        batch = list(itertools.islice(pairs, _BATCH))
+        if not batch:
+            break
+        yield separator + ",".join(
+            encode_basestring_ascii(path) + ":" + encode_basestring_ascii(sha)
+            for path, sha in batch
+        )
+        separator = ","
+    yield "}" if separator == "," else "{}"
+
+
+class DeployBody:
+    """
+    Synchronous streamed JSON body of `sites.deploys.create_streamed`.
+
+    Examples:
+    ```py
+    body = DeployBody(files={"/index.html": "3f78..."}, draft=True, compress=True)
+    deploy = client.sites.deploys.create_streamed(site_id="my-site-id", body=body)
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        files: Digests,
+        functions: typing.Optional[Digests] = None,
+        compress: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **fields: typing.Any,
+    ):
+        """
+        Initialize a body.
+
+        Args:
+            files: Deploy path to SHA1 digest, as a mapping or pairs
+            functions: Function name to SHA256 digest, as a mapping or pairs
+            compress: Gzip the body, sent with `Content-Encoding: gzip`
+            chunk_size: Approximate number of bytes encoded per chunk
+            fields: Other JSON fields of the deploy (`draft`, `branch`,
+                `async_`, ...); None values are left out
+        """
+        self.files = files
+        self.functions = functions
+        self.compress = compress
+        self.chunk_size = chunk_size
+        self.fields = {
+            ("async" if name == "async_" else name): value
+            for name, value in fields.items()
+            if value is not None
+        }
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the body can be sent more than once, False if the digests
+        are one-shot iterators"""
+        return not isinstance(self.files, typing.Iterator) and not isinstance(
+            self.functions, typing.Iterator
+        )
+
+    @property
+    def headers(self) -> typing.Dict[str, str]:
+        """Content headers to send with the body"""
+        headers = {"content-type": "application/json"}
+        if self.compress:
+            headers["content-encoding"] = "gzip"
+        return headers
+
+    def _pieces(self) -> typing.Iterator[str]:
+        yield '{"files":'
+        yield from _encode_object(self.files)
+        if self.functions is not None:
+            yield ',"functions":'
+            yield from _encode_object(self.functions)
+        for name, value in self.fields.items():
+            yield f",{encode_basestring_ascii(name)}:{json.dumps(value)}"
+        yield "}"
+
+    def _chunks(self) -> typing.Iterator[bytes]:
+        """The uncompressed body, in chunks of about `chunk_size` bytes"""
+        parts: typing.List[str] = []
+        size = 0
+        for piece in self._pieces():
+            parts.append(piece)
+            size += len(piece)
+            if size >= self.chunk_size:
+                yield "".join(parts).encode("ascii")
+                parts.clear()
+                size = 0
+        if parts:
+            yield "".join(parts).encode("ascii")
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        """Yields the body chunk by chunk"""
+        if not self.compress:
+            yield from self._chunks()
+            return
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in self._chunks():
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+
+class AsyncDeployBody:
+    """
+    Asynchronous streamed JSON body of `sites.deploys.create_streamed`.
+
+    Wraps a `DeployBody` for use with `httpx.AsyncClient`; the asynchronous
+    client wraps a `DeployBody` passed to it automatically. Encoding a chunk
+    takes about a millisecond, so chunks are encoded on the event loop.
+    """
+
+    def __init__(self, body: DeployBody):
+        self.body = body
+
+    @property
+    def replayable(self) -> bool:
+        return self.body.replayable
+
+    @property
+    def headers(self) -> typing.Dict[str, str]:
+        return self.body.headers
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        for chunk in self.body:
+            yield chunk
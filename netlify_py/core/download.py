@@ -0,0 +1,181 @@
+import os
+import re
+from typing import IO, Dict, Optional, Union
+
+from typing_extensions import Literal
+
+import httpx
+
+from .api_error import ApiError
+
+"""
+Streaming downloads of response bodies to files and writable buffers.
+
+Bodies are written chunk by chunk as they arrive, so their size is not
+bounded by memory. A download to a path is written to `<path>.part` and
+moved into place once complete; when a transfer breaks off, it is resumed
+with a `Range` request from the bytes already written, both within a call
+and, from a leftover `.part` file, across calls.
+"""
+
+PathLike = Union[str, "os.PathLike[str]"]
+Destination = Union[PathLike, IO[bytes]]
+
+StartAction = Literal["write", "done", "retry"]
+
+PARTIAL_SUFFIX = ".part"
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-\d+/(?:\d+|\*)")
+
+
+class Download:
+    """
+    Outcome of a download.
+
+    Attributes:
+        path: File written, None for a buffer destination
+        size: Bytes of the complete body
+        resumed: Number of times the transfer was resumed with a range request
+        headers: Headers of the last response
+    """
+
+    path: Optional[str]
+    size: int
+    resumed: int
+    headers: httpx.Headers
+
+    def __init__(
+        self, *, path: Optional[str], size: int, resumed: int, headers: httpx.Headers
+    ):
+        self.path = path
+        self.size = size
+        self.resumed = resumed
+        self.headers = headers
+
+    def __repr__(self) -> str:
+        target = self.path or "buffer"
+        return f"Download({target!r}, size={self.size}, resumed={self.resumed})"
+
+
+class DownloadTarget:
+    """
+    Where a download is written, and how far it got.
+
+    Tracks the offset reached so each (re)request asks for the missing range
+    only, and validates that the server honoured it.
+    """
+
+    def __init__(self, destination: Destination, *, resume: bool = True):
+        """
+        Args:
+            destination: File path, or a writable binary buffer
+            resume: Whether to resume from a leftover `.part` file
+        """
+        self.path: Optional[str] = None
+        self.offset = 0
+        self.resumed = 0
+        self._etag: Optional[str] = None
+        self._headers = httpx.Headers()
+        if isinstance(destination, (str, os.PathLike)):
+            self.path = os.fspath(destination)
+            partial = self.path + PARTIAL_SUFFIX
+            if resume and os.path.exists(partial):
+                self.offset = os.path.getsize(partial)
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file: IO[bytes] = open(partial, "ab" if self.offset else "wb")
+            self._start = 0
+        else:
+            self._file = destination
+            self._start = destination.tell() if destination.seekable() else 0
+
+    def request_headers(self) -> Dict[str, str]:
+        """Headers of the next request: identity encoding, so that ranges
+        address the stored bytes, and the missing range when resuming"""
+        headers = {"accept-encoding": "identity"}
+        if self.offset:
+            headers["range"] = f"bytes={self.offset}-"
+            if self._etag is not None:
+                headers["if-range"] = self._etag
+        return headers
+
+    def start(self, response: httpx.Response) -> StartAction:
+        """
+        Prepares the target for the body of `response`, which must already
+        be read if it is an error.
+
+        Returns:
+            `"write"` if the body is to be written, `"done"` if the partial
+            file already holds the whole body, `"retry"` if the partial file
+            was discarded, e.g. because the server answered with another
+            range than the one asked for, and the body must be requested again
+
+        Raises:
+            ApiError: If the response is an error
+            httpx.RemoteProtocolError: If a partial body answers a request
+                without a range
+        """
+        self._headers = response.headers
+        if response.status_code == 416 and self.offset:
+            total = response.headers.get("content-range", "").rpartition("/")[2]
+            if not total.isdigit() or int(total) == self.offset:
+                return "done"
+            self._restart()
+            return "retry"
+        if not response.is_success:
+            raise ApiError(response=response)
+
+        self._etag = response.headers.get("etag", self._etag)
+        if response.status_code == 206:
+            match = _CONTENT_RANGE.fullmatch(response.headers.get("content-range", ""))
+            if match is not None and int(match.group(1)) == self.offset:
+                if self.offset:
+                    self.resumed += 1
+                return "write"
+            if not self.offset:
+                raise httpx.RemoteProtocolError(
+                    "partial response to a request without a range",
+                    request=response.request,
+                )
+            # not the range asked for: request the whole body instead
+            self._restart()
+            return "retry"
+        # a full body
+        self._restart()
+        return "write"
+
+    def _restart(self) -> None:
+        if not self.offset:
+            return
+        if not self._file.seekable():
+            raise ValueError("cannot restart a download to an unseekable buffer")
+        self._file.seek(self._start)
+        self._file.truncate()
+        self.offset = 0
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self.offset += len(chunk)
+
+    def finish(self) -> Download:
+        """Completes the download, moving a file into place"""
+        if self.path is not None:
+            self._file.close()
+            os.replace(self.path + PARTIAL_SUFFIX, self.path)
+        else:
+            self._file.flush()
+        return Download(
+            path=self.path,
+            size=self.offset,
+            resumed=self.resumed,
+            headers=self._headers,
+        )
+
+    def abort(self) -> None:
+        """Stops the download, keeping a non-empty `.part` file to resume from
+        later"""
+        if self.path is not None:
+            self._file.close()
+            if not self.offset:
+                os.remove(self.path + PARTIAL_SUFFIX)
@@ -0,0 +1,161 @@
+import asyncio
+import io
+import os
+import stat
+from typing import Any, AsyncIterator, Iterator, Optional
+
+"""
+Chunked request bodies for file uploads.
+
+Uploads are streamed from their source instead of being read into memory
+first: buffers (`bytearray`, `memoryview`, `mmap.mmap`) are sent as
+zero-copy `memoryview` slices and file objects are read one chunk at a time.
+Text streams are encoded to UTF-8 chunk by chunk.
+"""
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+def _as_buffer(source: Any) -> Optional[memoryview]:
+    """Returns a byte view of objects supporting the buffer protocol"""
+    if isinstance(source, (str, io.IOBase)):
+        return None
+    try:
+        return memoryview(source).cast("B")
+    except TypeError:
+        return None
+
+
+def content_size(source: Any) -> Optional[int]:
+    """
+    Determines the number of bytes that will be uploaded from `source`
+    without reading it.
+
+    Buffers report their length, regular files use `os.fstat` and seekable
+    streams are measured from their current position. Returns None if the
+    size cannot be determined, as for pipes, sockets and devices, whose
+    `fstat` size is meaningless, and for text streams, whose encoded size is
+    only known once read.
+    """
+    if isinstance(source, str):
+        return len(source.encode("utf-8"))
+    if isinstance(source, io.TextIOBase):
+        return None
+
+    buffer = _as_buffer(source)
+    if buffer is not None:
+        return buffer.nbytes
+
+    try:
+        position = source.tell()
+    except (AttributeError, OSError, ValueError):
+        position = 0
+    try:
+        st = os.fstat(source.fileno())
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        pass
+    else:
+        if stat.S_ISREG(st.st_mode):
+            return max(st.st_size - position, 0)
+    try:
+        end = source.seek(0, os.SEEK_END)
+        source.seek(position)
+        return max(end - position, 0)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class FileStream:
+    """
+    Synchronous chunked upload body.
+
+    Streams a buffer or file object in `chunk_size` pieces. Seekable file
+    objects are rewound to their initial position whenever the body is
+    iterated again, so the same stream can be re-sent.
+    """
+
+    def __init__(self, source: Any, *, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the stream.
+
+        Args:
+            source: Buffer, binary or text file object to upload
+            chunk_size: Maximum number of bytes yielded per chunk
+        """
+        self.source = source
+        self.chunk_size = chunk_size
+        self.length = content_size(source)
+        self._buffer = _as_buffer(source)
+        try:
+            self._start: Optional[int] = source.tell() if source.seekable() else None
+        except (AttributeError, OSError, ValueError):
+            self._start = None
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the body can be sent more than once"""
+        return self._buffer is not None or self._start is not None
+
+    def _rewind(self) -> None:
+        if self._start is not None:
+            self.source.seek(self._start)
+
+    def _read(self) -> bytes:
+        chunk = self.source.read(self.chunk_size)
+        if isinstance(chunk, str):
+            # text streams, `chunk_size` characters at a time
+            return chunk.encode("utf-8")
+        return chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yields the body chunk by chunk"""
+        if self._buffer is not None:
+            for offset in range(0, self._buffer.nbytes, self.chunk_size):
+                yield self._buffer[offset : offset + self.chunk_size]  # type: ignore[misc]
+            return
+
+        self._rewind()
+        chunk = self._read()
+        while chunk:
+            yield chunk
+            chunk = self._read()
+
+
+class AsyncFileStream:
+    """
+    Asynchronous chunked upload body.
+
+    Wraps a `FileStream` for use with `httpx.AsyncClient`. Reads from file
+    objects run in the default executor so that disk I/O does not block the
+    event loop.
+    """
+
+    def __init__(self, stream: FileStream):
+        """
+        Initialize the stream.
+
+        Args:
+            stream: Synchronous stream describing the upload
+        """
+        self.stream = stream
+        self.length = stream.length
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the body can be sent more than once"""
+        return self.stream.replayable
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yields the body chunk by chunk"""
+        stream = self.stream
+        if stream._buffer is not None:
+            for chunk in stream:
+                yield chunk
+            return
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, stream._rewind)
+        chunk = await loop.run_in_executor(None, stream._read)
+        while chunk:
+            yield chunk
+            chunk = await loop.run_in_executor(None, stream._read)
@@ -0,0 +1,391 @@
+import abc
+import collections
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, OrderedDict, Tuple
+
+import httpx
+
+from .request import RequestConfig
+
+"""
+Conditional request cache.
+
+Successful GET responses carrying an `ETag` or `Last-Modified` header are
+stored; later identical requests are sent with `If-None-Match` /
+`If-Modified-Since`, and a `304 Not Modified` answer is served from the
+stored response. The API still decides whether the data changed, so cached
+data is never stale, but unchanged payloads are neither downloaded nor
+re-validated.
+"""
+
+
+def request_key(cfg: RequestConfig) -> str:
+    """
+    Identity of a request for caching: its URL, query parameters (in any
+    order) and a digest of its credentials.
+    """
+    params = httpx.QueryParams(cfg.get("params"))
+    url = httpx.URL(str(cfg["url"]), params=sorted(params.multi_items()))
+    headers = {k.lower(): v for k, v in cfg.get("headers", {}).items()}
+    credentials = hashlib.sha256(headers.get("authorization", "").encode()).hexdigest()
+    return f"{url}#{credentials}"
+
+
+# headers describing the encoded body on the wire; httpx stores the decoded
+# body, so a rebuilt response carrying them would be decoded a second time
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def _stored_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    return {k: v for k, v in headers.items() if k not in _WIRE_HEADERS}
+
+
+class CachedResponse:
+    """
+    A stored response.
+
+    Attributes:
+        status_code: Status of the original response
+        headers: Headers of the original response, less those describing its
+            encoding on the wire (the content is stored decoded)
+        content: Body of the original response
+        stored_at: `time.time()` at which the response was stored
+        parsed: Parsed bodies by the type they were cast to. Only kept while
+            the entry lives in memory.
+    """
+
+    def __init__(
+        self,
+        *,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        stored_at: float,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.stored_at = stored_at
+        self.parsed: Dict[Any, Any] = {}
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("last-modified")
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Rebuilds the original response"""
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=_stored_headers(self.headers),
+            content=self.content,
+            request=request,
+        )
+
+
+class CacheBackend(abc.ABC):
+    """
+    Storage of cached responses. Implementations must be thread safe.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """The entry stored for `key`, if any"""
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Stores an entry, replacing the previous one for `key`"""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Removes the entry stored for `key`, if any"""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Removes every entry"""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-memory LRU store.
+
+    Keeps parsed models next to the raw responses, so a `304` is answered
+    without parsing or validating the body again.
+    """
+
+    def __init__(self, *, max_entries: int = 1024, ttl: Optional[float] = None):
+        """
+        Initialize an in-memory store.
+
+        Args:
+            max_entries: Maximum number of entries, least recently used
+                entries are evicted first
+            ttl: Seconds an entry is kept, None to keep it until evicted
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, CachedResponse] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl is not None and time.time() - entry.stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    On-disk store in a SQLite database, shared between processes and kept
+    across restarts. Bodies are parsed again after a `304`.
+    """
+
+    def __init__(
+        self,
+        database: "str | os.PathLike[str]",
+        *,
+        max_entries: Optional[int] = 10_000,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Open (or create) an on-disk store.
+
+        Args:
+            database: Path of the SQLite database file
+            max_entries: Maximum number of entries, the oldest are evicted
+                first. None for no limit.
+            ttl: Seconds an entry is kept, None to keep it until evicted
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.fspath(database), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, status_code INTEGER NOT NULL, "
+            "headers TEXT NOT NULL, content BLOB NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, headers, content, stored_at FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        status_code, headers, content, stored_at = row
+        if self.ttl is not None and time.time() - stored_at > self.ttl:
+            self.delete(key)
+            return None
+        return CachedResponse(
+            status_code=status_code,
+            headers=json.loads(headers),
+            content=content,
+            stored_at=stored_at,
+        )
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, status_code, headers, content, stored_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.stored_at,
+                ),
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the underlying database"""
+        with self._lock:
+            self._conn.close()
+
+
+class CacheStats:
+    """
+    Counters of a cache.
+
+    Attributes:
+        lookups: Cacheable requests sent
+        hits: Requests answered with `304 Not Modified` and served from cache
+        misses: Requests answered with a full response
+        stores: Responses stored
+    """
+
+    def __init__(self) -> None:
+        self.lookups = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self._lock = threading.Lock()
+
+    def record(self, **counts: int) -> None:
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of cacheable requests served from cache"""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(lookups={self.lookups}, hits={self.hits}, "
+            f"misses={self.misses}, stores={self.stores}, "
+            f"hit_ratio={self.hit_ratio:.2f})"
+        )
+
+
+CacheLookup = Tuple[str, Optional[CachedResponse]]
+
+
+class HttpCache:
+    """
+    Conditional request cache for GET requests.
+
+    Entries are keyed by URL, query parameters and credentials, so clients
+    authenticated as different users never see each other's responses.
+    Parsed models served from the in-memory backend are shared between
+    callers and should not be mutated.
+
+    Examples:
+    ```py
+    cache = HttpCache(MemoryCacheBackend(max_entries=500, ttl=3600))
+    client = Client(token="...", http_cache=cache)
+    client.sites.get(site_id="my-site-id")  # full response, stored
+    client.sites.get(site_id="my-site-id")  # 304, served from cache
+    print(cache.stats.hit_ratio)
+    ```
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        """
+        Initialize a cache.
+
+        Args:
+            backend: Where responses are stored, an in-memory LRU store by
+                default
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.stats = CacheStats()
+
+    def key(self, cfg: RequestConfig) -> str:
+        """Cache key of a request"""
+        return request_key(cfg)
+
+    def prepare(self, cfg: RequestConfig) -> Optional[CacheLookup]:
+        """
+        Looks up a request and makes it conditional if a response is stored.
+
+        Returns:
+            The cache key and stored entry, None if the request is not
+            cacheable
+        """
+        if cfg["method"].upper() != "GET":
+            return None
+
+        key = self.key(cfg)
+        entry = self.backend.get(key)
+        self.stats.record(lookups=1)
+        if entry is not None:
+            headers = dict(cfg.get("headers", {}))
+            if entry.etag is not None:
+                headers["if-none-match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["if-modified-since"] = entry.last_modified
+            cfg["headers"] = headers
+        return key, entry
+
+    def update(
+        self, lookup: CacheLookup, response: httpx.Response
+    ) -> Optional[CachedResponse]:
+        """
+        Records the response to a cacheable request.
+
+        Returns:
+            The stored entry to serve the request from on a `304`, the newly
+            stored entry for a cacheable response, otherwise None
+        """
+        key, entry = lookup
+        if response.status_code == 304 and entry is not None:
+            self.stats.record(hits=1)
+            return entry
+
+        self.stats.record(misses=1)
+        if not response.is_success:
+            return None
+        headers = {k.lower(): v for k, v in response.headers.items()}
+        if "etag" not in headers and "last-modified" not in headers:
+            if entry is not None:
+                self.backend.delete(key)
+            return None
+        if "no-store" in headers.get("cache-control", ""):
+            return None
+
+        stored = CachedResponse(
+            status_code=response.status_code,
+            headers=_stored_headers(headers),
+            content=response.content,
+            stored_at=time.time(),
+        )
+        self.backend.set(key, stored)
+        self.stats.record(stores=1)
+        return stored
+
+    def invalidate(self, cfg: RequestConfig) -> None:
+        """Removes the stored response of a request"""
+        self.backend.delete(self.key(cfg))
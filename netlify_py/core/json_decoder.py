@@ -0,0 +1,94 @@
+import importlib.util
+import json
+from typing import Any, Callable, Optional
+
+from .response import get_validator
+
+"""
+Pluggable JSON decoding of response bodies.
+
+By default response bodies are validated straight from bytes with
+Pydantic's JSON parser, skipping the intermediate Python objects, and
+untyped bodies are parsed with `orjson` when it is installed
+(`pip install orjson`).
+"""
+
+
+def orjson_available() -> bool:
+    """Whether the optional `orjson` package is installed"""
+    return importlib.util.find_spec("orjson") is not None
+
+
+class JsonDecoder:
+    """
+    Decodes JSON response bodies with the standard library.
+
+    Subclass and override `loads` (and optionally `validate`) to plug in
+    another parser.
+    """
+
+    name = "json"
+
+    def loads(self, content: bytes) -> Any:
+        """Parses a JSON document into Python objects"""
+        return json.loads(content)
+
+    def validate(self, content: bytes, load_with: Any) -> Any:
+        """Parses a JSON document into `load_with`"""
+        return get_validator(load_with).validate_python(self.loads(content))
+
+
+class OrjsonDecoder(JsonDecoder):
+    """
+    Decodes JSON response bodies with `orjson`.
+
+    Raises:
+        ImportError: If `orjson` is not installed
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "OrjsonDecoder requires the 'orjson' package, "
+                "install it with `pip install orjson`"
+            ) from e
+        self._loads: Callable[[bytes], Any] = orjson.loads
+
+    def loads(self, content: bytes) -> Any:
+        return self._loads(content)
+
+
+class PydanticJsonDecoder(JsonDecoder):
+    """
+    Validates typed JSON response bodies from bytes with Pydantic's parser
+    (`TypeAdapter.validate_json`). Untyped bodies are parsed with `untyped`,
+    `orjson` when installed and the standard library otherwise.
+    """
+
+    name = "pydantic"
+
+    def __init__(self, untyped: Optional[JsonDecoder] = None):
+        """
+        Initialize the decoder.
+
+        Args:
+            untyped: Decoder of bodies that are returned without validation
+        """
+        if untyped is None:
+            untyped = OrjsonDecoder() if orjson_available() else JsonDecoder()
+        self.untyped = untyped
+
+    def loads(self, content: bytes) -> Any:
+        return self.untyped.loads(content)
+
+    def validate(self, content: bytes, load_with: Any) -> Any:
+        return get_validator(load_with).validate_json(content)
+
+
+def default_json_decoder() -> JsonDecoder:
+    """The fastest decoder available"""
+    return PydanticJsonDecoder()
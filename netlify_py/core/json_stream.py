@@ -0,0 +1,129 @@
+import re
+from typing import List
+
+"""
+Incremental decoder of JSON arrays.
+
+Splits a JSON array arriving in chunks into the JSON documents of its items,
+so a large list response can be validated one item at a time instead of
+being buffered whole. Only the array structure is scanned, with regular
+expressions: inside an item, everything up to the next bracket or brace is
+skipped in one match, so a flat object costs a couple of matches. A string
+split across chunks is scanned again once its end arrives. The items
+themselves are parsed by a `JsonDecoder`.
+"""
+
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+# at the array level: a whole string, a structural byte, or a lone quote
+# opening a string not received completely
+_TOKEN = re.compile(_STRING + rb'|["\[\]{},]')
+# inside an item: everything up to the next bracket or incomplete string
+_NESTED = re.compile(rb'(?:[^"\[\]{}]+|' + _STRING + rb")*")
+_WHITESPACE = b" \t\r\n"
+_QUOTE = ord('"')
+_OPEN_ARRAY = ord("[")
+_OPEN = b"[{"
+_CLOSE = b"]}"
+
+
+class JsonArrayDecoder:
+    """
+    Turns chunks of a JSON array into the encoded JSON of its items.
+
+    Examples:
+    ```py
+    decoder = JsonArrayDecoder()
+    for chunk in response.iter_bytes():
+        for item in decoder.feed(chunk):
+            handle(json.loads(item))
+    decoder.flush()
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._buffer = b""  # from the first byte of the current item
+        self._pos = 0  # next byte to scan
+        self._depth = 0
+        self._done = False
+        self._count = 0
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Decodes a chunk of the array.
+
+        Returns:
+            Items completed by this chunk, in array order
+
+        Raises:
+            ValueError: If the body is not a JSON array
+        """
+        if self._done:
+            return []
+        buffer = self._buffer + chunk
+        if self._depth == 0:
+            buffer = buffer.lstrip(_WHITESPACE)
+            if not buffer:
+                return []
+            if buffer[0] != _OPEN_ARRAY:
+                raise ValueError("expected a JSON array")
+            buffer = buffer[1:]
+            self._depth = 1
+
+        items: List[bytes] = []
+        start = 0
+        pos = self._pos
+        end = len(buffer)
+        while pos < end:
+            if self._depth > 1:
+                pos = _NESTED.match(buffer, pos).end()  # type: ignore[union-attr]
+                if pos == end:
+                    break
+                char = buffer[pos]
+            else:
+                match = _TOKEN.search(buffer, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.start()
+                char = buffer[pos]
+                if char == _QUOTE and match.end() > pos + 1:
+                    pos = match.end()
+                    continue
+            if char == _QUOTE:
+                # the end of the string is in a later chunk
+                break
+            pos += 1
+            if char in _OPEN:
+                self._depth += 1
+            elif char in _CLOSE:
+                self._depth -= 1
+                if self._depth == 0:
+                    item = buffer[start : pos - 1]
+                    if self._count or item.strip(_WHITESPACE):
+                        items.append(self._item(item))
+                    self._done = True
+                    self._buffer = b""
+                    return items
+            else:
+                items.append(self._item(buffer[start : pos - 1]))
+                start = pos
+
+        self._buffer = buffer[start:]
+        self._pos = pos - start
+        return items
+
+    def flush(self) -> None:
+        """
+        Ends the array.
+
+        Raises:
+            ValueError: If the array is incomplete
+        """
+        if not self._done:
+            raise ValueError("incomplete JSON array")
+
+    def _item(self, item: bytes) -> bytes:
+        if not item.strip(_WHITESPACE):
+            raise ValueError("empty JSON array item")
+        self._count += 1
+        return item
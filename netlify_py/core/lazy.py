@@ -0,0 +1,105 @@
+import typing
+from typing import Any, Dict, Generic, Type, TypeVar
+
+import pydantic
+from typing_extensions import Literal
+
+from .response import from_encodable
+
+"""
+Response modes trading validation for speed.
+
+- `"model"`: bodies are validated into models (the default)
+- `"dict"`: bodies are returned as parsed JSON, without validation
+- `"lazy"`: models are validated on first attribute access, one object at a
+  time, so unread items of a large list are never validated
+"""
+
+ResponseMode = Literal["model", "dict", "lazy"]
+RESPONSE_MODES = ("model", "dict", "lazy")
+
+M = TypeVar("M", bound=pydantic.BaseModel)
+
+
+class LazyModel(Generic[M]):
+    """
+    A model validated on first attribute access.
+
+    Attribute access is forwarded to the validated model, so a lazy model
+    reads like the model it stands for. The parsed JSON stays available as
+    `raw` without triggering validation.
+
+    Examples:
+    ```py
+    sites = client.sites.list(request_options={"response_mode": "lazy"})
+    names = [site.name for site in sites]  # validates each site once
+    ```
+    """
+
+    __slots__ = ("_model", "_raw", "_value")
+
+    def __init__(self, model: Type[M], raw: Dict[str, Any]):
+        self._model = model
+        self._raw = raw
+        self._value: Any = None
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The parsed JSON of the object"""
+        return self._raw
+
+    @property
+    def validated(self) -> bool:
+        """Whether the model was validated already"""
+        return self._value is not None
+
+    def resolve(self) -> M:
+        """
+        Validates the object, once.
+
+        Raises:
+            pydantic.ValidationError: If the object does not match the model
+        """
+        if self._value is None:
+            self._value = from_encodable(data=self._raw, load_with=self._model)
+        return self._value
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # private and special names are never forwarded, so that unset
+            # slots (e.g. while copying) do not recurse into `resolve`
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __reduce__(self) -> Any:
+        """Copies and pickles as the unvalidated object"""
+        return LazyModel, (self._model, self._raw)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyModel):
+            other = other.resolve()
+        return self.resolve() == other
+
+    def __repr__(self) -> str:
+        state = "validated" if self.validated else "pending"
+        return f"LazyModel[{self._model.__name__}]({state})"
+
+
+def _is_model(load_with: Any) -> bool:
+    return isinstance(load_with, type) and issubclass(load_with, pydantic.BaseModel)
+
+
+def load_lazy(*, data: Any, load_with: Any) -> Any:
+    """
+    Wraps parsed JSON in lazy models.
+
+    Objects of a model type, and of lists of a model type, become
+    `LazyModel`s. Any other type is validated right away.
+    """
+    if _is_model(load_with) and isinstance(data, dict):
+        return LazyModel(load_with, data)
+    if typing.get_origin(load_with) in (list, typing.List) and isinstance(data, list):
+        (item_type,) = typing.get_args(load_with) or (Any,)
+        if _is_model(item_type) and all(isinstance(item, dict) for item in data):
+            return [LazyModel(item_type, item) for item in data]
+    return from_encodable(data=data, load_with=load_with)
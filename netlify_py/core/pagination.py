@@ -0,0 +1,56 @@
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+"""
+Helpers for walking `page`/`per_page` paginated endpoints.
+
+The API advertises neighbouring pages through the RFC 8288 `Link` response
+header (`rel="next"`, `rel="last"`, ...), each pointing at the same endpoint
+with a different `page` query parameter.
+"""
+
+
+def page_from_url(url: str) -> Optional[int]:
+    """
+    Extracts the `page` query parameter from a pagination link.
+
+    Returns None when the link has no (valid) page number.
+    """
+    values = parse_qs(urlsplit(url).query).get("page")
+    if not values:
+        return None
+    try:
+        return int(values[0])
+    except ValueError:
+        return None
+
+
+def link_page(response: httpx.Response, rel: str) -> Optional[int]:
+    """
+    Returns the page number of the `Link` header relation `rel` (e.g. "next" or
+    "last"), or None if the response does not advertise it.
+    """
+    link = response.links.get(rel)
+    if link is None or "url" not in link:
+        return None
+    return page_from_url(link["url"])
+
+
+def next_page(
+    response: httpx.Response, *, page: int, count: int, per_page: Optional[int]
+) -> Optional[int]:
+    """
+    Determines the page to request after `page`, or None when it was the last.
+
+    The `Link` header is authoritative when present. Without one, a full page
+    (`count == per_page`) is assumed to have a successor; if no page size was
+    requested the response is treated as the only page, since the server
+    default page size is unknown.
+    """
+    if "link" in response.headers:
+        return link_page(response, "next")
+    if per_page is not None and count > 0 and count >= per_page:
+        return page + 1
+    return None
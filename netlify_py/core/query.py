@@ -4,7 +4,6 @@ from urllib.parse import quote_plus, quote
 
 import httpx
 
-
 # Type alias for query parameters that can handle both primitive data and sequences
 QueryParams = Dict[
     str, Union[httpx._types.PrimitiveData, Sequence[httpx._types.PrimitiveData]]
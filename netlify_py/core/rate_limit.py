@@ -0,0 +1,169 @@
+import fnmatch
+import threading
+import time
+from typing import List, Mapping, Optional, Tuple
+
+import httpx
+
+"""
+Client-side rate limiting.
+
+Requests draw from token buckets before they are sent, so a client (or
+several clients sharing a limiter) stays within the API quota instead of
+discovering it through 429 responses. Buckets are corrected with the
+`X-RateLimit-Limit`, `X-RateLimit-Remaining` and `X-RateLimit-Reset`
+headers of every response.
+"""
+
+
+def _header_float(headers: httpx.Headers, name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket holding `limit` tokens, refilled over `period`
+    seconds.
+
+    Tokens are reserved rather than waited for under the lock: every caller
+    is told how long to wait for its token, so threads and asyncio tasks can
+    share a bucket and sleep in their own way.
+    """
+
+    def __init__(self, *, limit: float, period: float = 60.0):
+        """
+        Initialize a full bucket.
+
+        Args:
+            limit: Requests allowed per period, and the bucket capacity
+            period: Length of the quota window in seconds
+        """
+        self.limit = limit
+        self.period = period
+        self._tokens = float(limit)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second"""
+        return self.limit / self.period
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.limit, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Takes a token.
+
+        Returns:
+            Seconds to wait before the token may be used, 0 if it is
+            available immediately
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def observe(self, headers: httpx.Headers) -> None:
+        """
+        Corrects the bucket with the rate limit headers of a response.
+
+        The server side `X-RateLimit-Limit` replaces the configured limit and
+        the bucket never holds more than `X-RateLimit-Remaining` tokens. An
+        exhausted quota holds back the next token until `X-RateLimit-Reset`.
+        """
+        limit = _header_float(headers, "x-ratelimit-limit")
+        remaining = _header_float(headers, "x-ratelimit-remaining")
+        reset = _header_float(headers, "x-ratelimit-reset")
+        if limit is None and remaining is None:
+            return
+
+        with self._lock:
+            self._refill(time.monotonic())
+            if limit is not None and limit > 0:
+                self.limit = limit
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+            if remaining is not None and remaining <= 0 and reset is not None:
+                wait = reset - time.time()
+                if wait > 0:
+                    self._tokens = min(self._tokens, 1 - wait * self.rate)
+
+
+class RateLimiter:
+    """
+    Set of token buckets applied to the requests of a client.
+
+    Every request draws from the default bucket. Requests matching a route
+    pattern additionally draw from the route's bucket, and that bucket is
+    the one corrected by their response headers. Patterns are
+    `fnmatch`-style and matched against `"<METHOD> <path>"`, e.g.
+    `"PUT /deploys/*/files/*"`.
+
+    A limiter may be shared by several clients to split one quota between
+    them.
+
+    Examples:
+    ```py
+    limiter = RateLimiter(
+        limit=500,
+        routes={"PUT /deploys/*": TokenBucket(limit=100)},
+    )
+    client = Client(token="...", rate_limiter=limiter)
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: float = 500,
+        period: float = 60.0,
+        routes: Optional[Mapping[str, TokenBucket]] = None,
+    ):
+        """
+        Initialize a rate limiter.
+
+        Args:
+            limit: Requests allowed per period across all routes
+            period: Length of the quota window in seconds
+            routes: Additional buckets for route patterns
+        """
+        self.bucket = TokenBucket(limit=limit, period=period)
+        self.routes: List[Tuple[str, TokenBucket]] = list((routes or {}).items())
+
+    def _route_bucket(self, method: str, path: str) -> Optional[TokenBucket]:
+        route = f"{method.upper()} {path}"
+        for pattern, bucket in self.routes:
+            if fnmatch.fnmatchcase(route, pattern):
+                return bucket
+        return None
+
+    def reserve(self, method: str, path: str) -> float:
+        """
+        Takes the tokens needed to send a request.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        delay = self.bucket.reserve()
+        route_bucket = self._route_bucket(method, path)
+        if route_bucket is not None:
+            delay = max(delay, route_bucket.reserve())
+        return delay
+
+    def observe(self, method: str, path: str, response: httpx.Response) -> None:
+        """Corrects the bucket of a request with its response headers"""
+        bucket = self._route_bucket(method, path) or self.bucket
+        bucket.observe(response.headers)
@@ -1,11 +1,14 @@
-from typing import Any, Dict, Type, Union, Sequence, List
+import functools
+from typing import Any, Dict, Optional, Type, Union, Sequence, List
 from urllib.parse import quote_plus
 
 import httpx
-from typing_extensions import TypedDict, Required, NotRequired
-from pydantic import TypeAdapter, BaseModel
+from typing_extensions import Literal, TypedDict, Required, NotRequired
+from pydantic import TypeAdapter, BaseModel, ValidationError
 
-from .type_utils import NotGiven
+from .file_stream import FileStream, content_size
+from .retry import RetryPolicy
+from .type_utils import NOT_GIVEN, NotGiven
 from .query import QueryParams
 
 """
@@ -50,11 +53,19 @@ class RequestOptions(TypedDict):
         timeout: Number of seconds to await an API call before timing out
         additional_headers: Extra headers to include in the request
         additional_params: Extra query parameters to include in the request
+        retry: Retry policy for this request, overriding the client's
+        response_mode: How the JSON body is returned (`"model"`, `"dict"` or
+            `"lazy"`), overriding the client's
+        fields: Fields kept of each returned object, dotted for nested
+            objects; the body is returned as compact projections
     """
 
     timeout: NotRequired[int]
     additional_headers: NotRequired[Dict[str, str]]
     additional_params: NotRequired[QueryParams]
+    retry: NotRequired[Optional[RetryPolicy]]
+    response_mode: NotRequired[Literal["model", "dict", "lazy"]]
+    fields: NotRequired[Sequence[str]]
 
 
 def default_request_options() -> RequestOptions:
@@ -67,19 +78,18 @@ def default_request_options() -> RequestOptions:
     return {}
 
 
-def model_dump(item: Any) -> Any:
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+@functools.lru_cache(maxsize=256)
+def _get_dump_adapter(dump_with: Any) -> TypeAdapter:
     """
-    Recursively converts Pydantic models to dictionaries.
+    Returns a cached TypeAdapter for a request parameter or body type.
 
-    Handles nested structures including lists and individual models,
-    preserving alias information and excluding unset values.
+    `functools.lru_cache` keeps the cache bounded and is safe to call from
+    multiple threads.
     """
-    if isinstance(item, list):
-        return [model_dump(i) for i in item]
-    if isinstance(item, BaseModel):
-        return item.model_dump(exclude_unset=True, by_alias=True)
-    else:
-        return item
+    return TypeAdapter(dump_with)
 
 
 def to_encodable(
@@ -87,29 +97,66 @@ def to_encodable(
 ) -> Any:
     """
     Validates and converts an item to an encodable format using a specified type.
-    Uses Pydantic's TypeAdapter for validation and converts the result
-    to a format suitable for encoding in requests.
+    Uses a cached Pydantic TypeAdapter for validation and dumps the result
+    (by alias, excluding unset fields) with the same adapter so that models
+    nested at any depth are converted in a single serializer pass.
+
+    NotGiven values are only skipped at the top level of a dict item, where
+    generated methods put them: the fields they leave out are never set, so
+    `exclude_unset` drops them from the dump without a walk of the whole item.
+    Items with NotGiven values nested deeper are filtered recursively when
+    validation rejects them.
     """
-    filtered_item = filter_not_given(item)
-    adapter: TypeAdapter = TypeAdapter(dump_with)
-    validated_item = adapter.validate_python(filtered_item)
-    return model_dump(validated_item)
+    dump_type: Any = dump_with
+    try:
+        adapter = _get_dump_adapter(dump_type)
+    except TypeError:
+        # unhashable types cannot be cached
+        adapter = TypeAdapter(dump_type)
+
+    if isinstance(item, _SCALAR_TYPES):
+        # scalars contain no NotGiven values or models, skip the dump
+        return adapter.validate_python(item)
+
+    if isinstance(item, dict):
+        item = {k: v for k, v in item.items() if not isinstance(v, NotGiven)}
+    try:
+        validated_item = adapter.validate_python(item)
+    except ValidationError:
+        filtered = filter_not_given(item)
+        if filtered == item:
+            raise
+        validated_item = adapter.validate_python(filtered)
+    return adapter.dump_python(validated_item, by_alias=True, exclude_unset=True)
 
 
 def to_content(*, file: httpx._types.FileTypes) -> httpx._types.RequestContent:
     """
     Converts the various ways files can be provided to something that is accepted by
-    the httpx.request content kwarg
+    the httpx.request content kwarg.
+
+    File objects and buffers (`bytearray`, `memoryview`, `mmap.mmap`) are wrapped
+    in a `FileStream` so they are uploaded in chunks instead of being read into
+    memory up front.
     """
     if isinstance(file, tuple):
         file_content: httpx._types.FileContent = file[1]
     else:
         file_content = file
 
-    if hasattr(file_content, "read") and callable(file_content.read):
-        return file_content.read()
-    else:
+    if isinstance(file_content, (bytes, str)):
         return file_content
+    return FileStream(file_content)
+
+
+def to_content_size(*, file: httpx._types.FileTypes) -> Union[int, NotGiven]:
+    """
+    Returns the number of bytes `to_content` will upload for `file` without
+    reading it, or NOT_GIVEN if it cannot be determined.
+    """
+    file_content = file[1] if isinstance(file, tuple) else file
+    size = content_size(file_content)
+    return NOT_GIVEN if size is None else size
 
 
 def encode_param(
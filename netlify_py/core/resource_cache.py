@@ -0,0 +1,274 @@
+import collections
+import fnmatch
+import threading
+import time
+from typing import Any, Collection, Optional, OrderedDict, Sequence, Tuple
+
+from .http_cache import CacheStats, request_key
+from .request import RequestConfig
+
+"""
+In-process cache of parsed responses for read-mostly resources.
+
+Unlike the conditional request cache, a fresh entry is served without
+contacting the API at all, so entries may be up to their TTL stale. Entries
+are dropped as soon as the client itself modifies a related resource.
+"""
+
+
+class CacheRule:
+    """
+    Caching of the requests matching a route pattern.
+
+    Patterns are `fnmatch`-style and matched against `"<METHOD> <path>"`,
+    e.g. `"GET /services/*/manifest"`. Only GET routes are cached.
+    """
+
+    def __init__(
+        self,
+        route: str,
+        *,
+        ttl: float,
+        invalidated_by: Optional[Collection[str]] = None,
+    ):
+        """
+        Initialize a cache rule.
+
+        Args:
+            route: Pattern of the cached requests
+            ttl: Seconds a response is served from cache
+            invalidated_by: Patterns of the requests that drop the cached
+                responses. Defaults to any modifying request on the same
+                top level resource, e.g. `"* /hooks*"` for `"GET /hooks/types"`.
+        """
+        self.route = route
+        self.ttl = ttl
+        if invalidated_by is None:
+            path = route.partition(" ")[2]
+            invalidated_by = [f"* /{path.lstrip('/').split('/')[0]}*"]
+        self.invalidated_by = tuple(invalidated_by)
+
+    def matches(self, route: str) -> bool:
+        return fnmatch.fnmatchcase(route, self.route)
+
+    def invalidated(self, route: str) -> bool:
+        return any(
+            fnmatch.fnmatchcase(route, pattern) for pattern in self.invalidated_by
+        )
+
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+READ_MOSTLY_RULES: Tuple[CacheRule, ...] = (
+    CacheRule("GET /hooks/types", ttl=3600),
+    CacheRule("GET /accounts/types", ttl=3600),
+    CacheRule("GET /services/", ttl=3600),
+    CacheRule("GET /services/*/manifest", ttl=3600),
+    CacheRule("GET /user", ttl=300),
+)
+
+
+class _Entry:
+    __slots__ = ("route", "rule", "value", "expires")
+
+    def __init__(self, route: str, rule: CacheRule, value: Any, expires: float):
+        self.route = route
+        self.rule = rule
+        self.value = value
+        self.expires = expires
+
+
+class ResourceLookup:
+    """
+    Result of looking up a request in a `ResourceCache`.
+
+    Attributes:
+        route: `"<METHOD> <path>"` of the request
+        rule: Rule caching the request
+        hit: Whether a fresh value is cached
+        value: The cached value, if any
+    """
+
+    def __init__(
+        self,
+        *,
+        route: str,
+        rule: CacheRule,
+        key: Tuple[str, Any],
+        generation: int,
+        hit: bool,
+        value: Any = None,
+    ):
+        self.route = route
+        self.rule = rule
+        self.key = key
+        self.generation = generation
+        self.hit = hit
+        self.value = value
+
+
+class ResourceCache:
+    """
+    Size bounded LRU cache of parsed responses with per-route TTLs.
+
+    Values are cached per request (URL, query parameters, credentials) and
+    per type they are parsed to. Cached models are shared between callers
+    and should not be mutated. The cache is thread safe and may be shared
+    by several clients.
+
+    Examples:
+    ```py
+    cache = ResourceCache(
+        rules=[*READ_MOSTLY_RULES, CacheRule("GET /sites/*", ttl=60)],
+    )
+    client = Client(token="...", resource_cache=cache)
+    client.hooks.types.list()  # sent
+    client.hooks.types.list()  # served from cache
+    client.hooks.create(...)  # drops the cached hook types
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        rules: Sequence[CacheRule] = READ_MOSTLY_RULES,
+        max_entries: int = 256,
+    ):
+        """
+        Initialize a resource cache.
+
+        Args:
+            rules: Routes to cache, the first matching rule applies. Defaults
+                to hook types, account types, services, service manifests and
+                the current user.
+            max_entries: Maximum number of cached values, least recently used
+                values are evicted first
+        """
+        self.rules = list(rules)
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Tuple[str, Any], _Entry] = collections.OrderedDict()
+        # bumped on every invalidation, so responses to requests sent before
+        # it are not stored
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def rule(self, route: str) -> Optional[CacheRule]:
+        """The rule caching a `"<METHOD> <path>"` route, if any"""
+        if not route.startswith("GET "):
+            return None
+        for rule in self.rules:
+            if rule.matches(route):
+                return rule
+        return None
+
+    def lookup(
+        self, cfg: RequestConfig, *, route: str, cast_to: Any
+    ) -> Optional[ResourceLookup]:
+        """
+        Looks up the parsed response of a request.
+
+        Args:
+            cfg: Request configuration about to be sent
+            route: `"<METHOD> <path>"` of the request
+            cast_to: Type the response is parsed to
+
+        Returns:
+            The lookup, None if the request is not cached
+        """
+        rule = self.rule(route)
+        if rule is None:
+            return None
+        key = (request_key(cfg), cast_to)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+            generation = self._generation
+        if entry is None:
+            self.stats.record(lookups=1, misses=1)
+            return ResourceLookup(
+                route=route, rule=rule, key=key, generation=generation, hit=False
+            )
+        self.stats.record(lookups=1, hits=1)
+        return ResourceLookup(
+            route=route,
+            rule=rule,
+            key=key,
+            generation=generation,
+            hit=True,
+            value=entry.value,
+        )
+
+    def store(self, lookup: ResourceLookup, value: Any) -> None:
+        """Caches the parsed response of a looked up request"""
+        with self._lock:
+            if lookup.generation != self._generation:
+                return
+            self._entries[lookup.key] = _Entry(
+                lookup.route, lookup.rule, value, time.monotonic() + lookup.rule.ttl
+            )
+            self._entries.move_to_end(lookup.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self.stats.record(stores=1)
+
+    def invalidate(self, route: Optional[str] = None) -> int:
+        """
+        Drops cached values.
+
+        Args:
+            route: Pattern of the requests to drop, e.g. `"GET /user"` or
+                `"GET /services/*"`, None to drop everything
+
+        Returns:
+            Number of values dropped
+        """
+        with self._lock:
+            self._generation += 1
+            if route is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if fnmatch.fnmatchcase(entry.route, route)
+            ]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def observe(self, route: str) -> int:
+        """
+        Drops the values invalidated by a request, if it modifies resources.
+
+        Args:
+            route: `"<METHOD> <path>"` of the request
+
+        Returns:
+            Number of values dropped
+        """
+        if route.split(" ", 1)[0] in _SAFE_METHODS:
+            return 0
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.rule.invalidated(route)
+            ]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._entries)
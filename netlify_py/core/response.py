@@ -1,8 +1,13 @@
+import collections
 import json
-from typing import Any, Union, Dict, Type, TypeVar, List, Generic, Optional
-from pydantic import BaseModel
+import threading
+from typing import Any, Deque, Union, Dict, Type, TypeVar, List, Generic, Optional
+from pydantic import BaseModel, TypeAdapter
 import httpx
 
+from .sse import ServerSentEvent, SSEDecoder
+from .utils import filter_binary_response
+
 """
 Provides functionality for handling Server-Sent Events (SSE) streams and response data encoding.
 Includes utilities for both synchronous and asynchronous stream processing.
@@ -23,30 +28,72 @@ EncodableT = TypeVar(
 )
 
 
+_validators: Dict[Any, TypeAdapter] = {}
+_validators_lock = threading.Lock()
+
+
+def get_validator(load_with: Any) -> TypeAdapter:
+    """
+    Returns a compiled Pydantic validator for the specified type.
+
+    Validators are built once per type (after filtering `BinaryResponse` out of
+    unions) and reused for every subsequent response, so the schema build cost
+    is not paid on each request. Unhashable types are compiled on every call.
+    """
+    try:
+        return _validators[load_with]
+    except KeyError:
+        pass
+    except TypeError:
+        return TypeAdapter(filter_binary_response(cast_to=load_with))
+
+    with _validators_lock:
+        adapter = _validators.get(load_with)
+        if adapter is None:
+            adapter = TypeAdapter(filter_binary_response(cast_to=load_with))
+            _validators[load_with] = adapter
+    return adapter
+
+
 def from_encodable(*, data: Any, load_with: Type[EncodableT]) -> Any:
     """
     Converts raw data into a specified type using Pydantic validation.
 
-    Uses a dynamic Pydantic model to validate and convert incoming data
-    into the specified target type.
+    Uses a cached validator (see `get_validator`) to validate and convert
+    incoming data into the specified target type.
     """
+    return get_validator(load_with).validate_python(data)
 
-    class Caster(BaseModel):
-        data: load_with  # type: ignore
 
-    return Caster(data=data).data
+T = TypeVar("T")
 
 
-T = TypeVar("T")
+def _load_event(event: ServerSentEvent, cast_to: Type[T]) -> T:
+    """
+    Converts the data of an event into the specified type.
+
+    JSON data is decoded and wrapped as `{"data": ...}` unless it already is
+    an object with a `data` key; other data is wrapped as a string.
+    """
+    try:
+        parsed_data = json.loads(event.data)
+    except json.JSONDecodeError:
+        return from_encodable(data={"data": event.data}, load_with=cast_to)
+    if not isinstance(parsed_data, dict) or "data" not in parsed_data:
+        parsed_data = {"data": parsed_data}
+    return from_encodable(data=parsed_data, load_with=cast_to)
 
 
 class StreamResponse(Generic[T]):
     """
     Handles synchronous streaming of Server-Sent Events (SSE).
 
-    Processes a streaming HTTP response by buffering chunks of data
-    and parsing them according to SSE format, converting each event
-    into the specified type.
+    Processes a streaming HTTP response with an incremental `SSEDecoder`,
+    converting each event into the specified type.
+
+    Attributes:
+        last_event_id: ID of the last event received, for reconnecting
+        retry: Reconnection time in milliseconds requested by the server
     """
 
     def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
@@ -62,8 +109,18 @@ class StreamResponse(Generic[T]):
         self._context = stream_context
         self.cast_to = cast_to
         self.iterator = response.iter_bytes()
-        self.buffer = bytearray()
-        self.position = 0
+        self.decoder = SSEDecoder()
+        self._events: Deque[ServerSentEvent] = collections.deque()
+        self._exhausted = False
+        self._closed = False
+
+    @property
+    def last_event_id(self) -> str:
+        return self.decoder.last_event_id
+
+    @property
+    def retry(self) -> Optional[int]:
+        return self.decoder.retry
 
     def __iter__(self):
         """Enables iteration over the stream events."""
@@ -73,100 +130,31 @@ class StreamResponse(Generic[T]):
         """
         Retrieves and processes the next event from the stream.
 
-        Buffers incoming data and processes it according to SSE format,
-        converting each complete event into the specified type.
+        Reads chunks until at least one complete event is available and
+        converts it into the specified type.
 
         Raises:
             StopIteration: When the stream is exhausted
         """
-        try:
-            while True:
-                event = self._process_buffer()
-                if event:
-                    return event
-
+        while not self._events:
+            if self._exhausted:
+                self.close()
+                raise StopIteration
+            try:
                 chunk = next(self.iterator)
-                self.buffer += chunk
-
-        except StopIteration:
-            event = self._process_buffer(final=True)
-            if event:
-                return event
+            except StopIteration:
+                self._exhausted = True
+                self._events.extend(self.decoder.flush())
+            else:
+                self._events.extend(self.decoder.feed(chunk))
+
+        return _load_event(self._events.popleft(), self.cast_to)
+
+    def close(self) -> None:
+        """Closes the underlying response."""
+        if not self._closed:
+            self._closed = True
             self._context.__exit__(None, None, None)
-            raise
-
-    def _process_buffer(self, final=False) -> Optional[T]:
-        """
-        Processes the current buffer to extract complete SSE events.
-
-        Searches for event boundaries and parses complete events,
-        handling both JSON and non-JSON payloads.
-
-        Args:
-            final: Whether this is the final processing of the buffer
-        """
-        while self.position < len(self.buffer):
-            for boundary in [b"\r\n\r\n", b"\n\n", b"\r\r"]:
-                if (self.position + len(boundary)) <= len(self.buffer):
-                    if (
-                        self.buffer[self.position : self.position + len(boundary)]
-                        == boundary
-                    ):
-                        message = self.buffer[: self.position].decode()
-                        self.buffer = self.buffer[self.position + len(boundary) :]
-                        self.position = 0
-
-                        data = self._parse_sse(message)
-                        if data:
-                            try:
-                                parsed_data = json.loads(data)
-                                if (
-                                    not isinstance(parsed_data, dict)
-                                    or "data" not in parsed_data
-                                ):
-                                    parsed_data = {"data": parsed_data}
-                                return from_encodable(
-                                    data=parsed_data, load_with=self.cast_to
-                                )
-                            except json.JSONDecodeError:
-                                return from_encodable(
-                                    data={"data": data}, load_with=self.cast_to
-                                )
-                        return None
-
-            self.position += 1
-
-        if final and self.buffer:
-            message = self.buffer.decode()
-            data = self._parse_sse(message)
-            if data:
-                try:
-                    parsed_data = json.loads(data)
-                    if not isinstance(parsed_data, dict) or "data" not in parsed_data:
-                        parsed_data = {"data": parsed_data}
-                    return from_encodable(data=parsed_data, load_with=self.cast_to)
-                except json.JSONDecodeError:
-                    return from_encodable(data={"data": data}, load_with=self.cast_to)
-
-        return None
-
-    def _parse_sse(self, message: str) -> Optional[str]:
-        """
-        Parses an SSE message to extract the data field.
-
-        Handles multi-line data fields and empty data fields according
-        to the SSE specification.
-        """
-        data = []
-        for line in message.split("\n"):
-            if line.startswith("data:"):
-                data.append(line[5:].strip())
-            elif line.strip() == "data:":  # Handle empty data field
-                data.append("")
-
-        if data:
-            return "\n".join(data)
-        return None
 
 
 class AsyncStreamResponse(Generic[T]):
@@ -175,6 +163,10 @@ class AsyncStreamResponse(Generic[T]):
 
     Asynchronous version of StreamResponse, providing the same functionality
     but compatible with async/await syntax.
+
+    Attributes:
+        last_event_id: ID of the last event received, for reconnecting
+        retry: Reconnection time in milliseconds requested by the server
     """
 
     def __init__(self, response: httpx.Response, stream_context, cast_to: Type[T]):
@@ -190,8 +182,18 @@ class AsyncStreamResponse(Generic[T]):
         self._context = stream_context
         self.cast_to = cast_to
         self.iterator = response.aiter_bytes()
-        self.buffer = bytearray()
-        self.position = 0
+        self.decoder = SSEDecoder()
+        self._events: Deque[ServerSentEvent] = collections.deque()
+        self._exhausted = False
+        self._closed = False
+
+    @property
+    def last_event_id(self) -> str:
+        return self.decoder.last_event_id
+
+    @property
+    def retry(self) -> Optional[int]:
+        return self.decoder.retry
 
     def __aiter__(self):
         """Enables async iteration over the stream events."""
@@ -207,87 +209,22 @@ class AsyncStreamResponse(Generic[T]):
         Raises:
             StopAsyncIteration: When the stream is exhausted
         """
-        try:
-            while True:
-                event = self._process_buffer()
-                if event:
-                    return event
-
+        while not self._events:
+            if self._exhausted:
+                await self.aclose()
+                raise StopAsyncIteration
+            try:
                 chunk = await self.iterator.__anext__()
-                self.buffer += chunk
-
-        except StopAsyncIteration:
-            event = self._process_buffer(final=True)
-            if event:
-                return event
+            except StopAsyncIteration:
+                self._exhausted = True
+                self._events.extend(self.decoder.flush())
+            else:
+                self._events.extend(self.decoder.feed(chunk))
+
+        return _load_event(self._events.popleft(), self.cast_to)
+
+    async def aclose(self) -> None:
+        """Closes the underlying response."""
+        if not self._closed:
+            self._closed = True
             await self._context.__aexit__(None, None, None)
-            raise
-
-    def _process_buffer(self, final=False) -> Optional[T]:
-        """
-        Processes the current buffer to extract complete SSE events.
-
-        Identical to the synchronous version's buffer processing.
-        """
-        while self.position < len(self.buffer):
-            for boundary in [b"\r\n\r\n", b"\n\n", b"\r\r"]:
-                if (self.position + len(boundary)) <= len(self.buffer):
-                    if (
-                        self.buffer[self.position : self.position + len(boundary)]
-                        == boundary
-                    ):
-                        message = self.buffer[: self.position].decode()
-                        self.buffer = self.buffer[self.position + len(boundary) :]
-                        self.position = 0
-
-                        data = self._parse_sse(message)
-                        if data:
-                            try:
-                                parsed_data = json.loads(data)
-                                if (
-                                    not isinstance(parsed_data, dict)
-                                    or "data" not in parsed_data
-                                ):
-                                    parsed_data = {"data": parsed_data}
-                                return from_encodable(
-                                    data=parsed_data, load_with=self.cast_to
-                                )
-                            except json.JSONDecodeError:
-                                return from_encodable(
-                                    data={"data": data}, load_with=self.cast_to
-                                )
-                        return None
-
-            self.position += 1
-
-        if final and self.buffer:
-            message = self.buffer.decode()
-            data = self._parse_sse(message)
-            if data:
-                try:
-                    parsed_data = json.loads(data)
-                    if not isinstance(parsed_data, dict) or "data" not in parsed_data:
-                        parsed_data = {"data": parsed_data}
-                    return from_encodable(data=parsed_data, load_with=self.cast_to)
-                except json.JSONDecodeError:
-                    return from_encodable(data={"data": data}, load_with=self.cast_to)
-
-        return None
-
-    def _parse_sse(self, message: str) -> Optional[str]:
-        """
-        Parses an SSE message to extract the data field.
-
-        Identical to the synchronous version's SSE parsing.
-        """
-        data = []
-        for line in message.split("\n"):
-            line = line.strip()
-            if line.startswith("data:"):
-                data.append(line[5:].strip())
-            elif line == "data:":  # Handle empty data field
-                data.append("")
-
-        if data:
-            return "\n".join(data)
-        return None
@@ -0,0 +1,219 @@
+import collections
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Collection, Deque, Optional
+
+import httpx
+
+from .deploy_body import AsyncDeployBody, DeployBody
+from .file_stream import AsyncFileStream, FileStream
+
+"""
+Retry policy for transient API failures.
+
+Rate limited (429) and transiently failing (408, 5xx) requests are retried
+with capped exponential backoff and full jitter. Server hints take
+precedence over the computed delay: `Retry-After` (seconds or HTTP date)
+and, for exhausted rate limits, the `X-RateLimit-Reset` epoch timestamp.
+"""
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# the request was not processed, so any method can safely be sent again
+_NOT_PROCESSED_STATUSES = frozenset({429})
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the recent request volume.
+
+    Over a sliding window of `ttl` seconds, at most
+    `min_retries + ratio * requests` retries are allowed. During an outage
+    this keeps clients from multiplying the load on the API with retries,
+    while a handful of retries stays available at low traffic.
+
+    The budget is thread safe and can be shared by several clients.
+    """
+
+    def __init__(self, *, ratio: float = 0.2, min_retries: int = 10, ttl: float = 10.0):
+        """
+        Initialize a retry budget.
+
+        Args:
+            ratio: Retries allowed per request made within the window
+            min_retries: Retries allowed within the window regardless of volume
+            ttl: Length of the sliding window in seconds
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.ttl = ttl
+        self._requests: Deque[float] = collections.deque()
+        self._retries: Deque[float] = collections.deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        horizon = now - self.ttl
+        for events in (self._requests, self._retries):
+            while events and events[0] <= horizon:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Records a first attempt of a request"""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._requests.append(now)
+
+    def try_withdraw(self) -> bool:
+        """
+        Records a retry if the budget allows one.
+
+        Returns:
+            Whether the retry may be sent
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            allowed = self.min_retries + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again.
+
+    Requests are only retried when it is safe to do so: idempotent methods
+    are retried on any retryable status or transport error, other methods
+    only when the API did not process the request (429, or the connection
+    could not be established). Requests with a one-shot body (e.g. a
+    generator) are never retried.
+
+    Examples:
+    ```py
+    client = Client(token="...", retry=RetryPolicy(max_retries=5))
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 120.0,
+        retry_statuses: Collection[int] = RETRY_STATUSES,
+        retry_methods: Collection[str] = IDEMPOTENT_METHODS,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """
+        Initialize a retry policy.
+
+        Args:
+            max_retries: Maximum number of retries per request
+            backoff_factor: Base delay in seconds, doubled on every retry
+            max_backoff: Upper bound of the computed backoff delay
+            max_retry_after: Longest server requested delay that is honored,
+                responses asking to wait longer are not retried
+            retry_statuses: Response status codes that are retried
+            retry_methods: Methods that are retried on any retryable failure
+            budget: Shared limit on the ratio of retries to requests
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.budget = budget
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Full jitter exponential backoff before retry number `attempt`
+        (starting at 1).
+        """
+        ceiling = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def should_retry_response(self, method: str, response: httpx.Response) -> bool:
+        """Whether the status of `response` allows sending the request again"""
+        status = response.status_code
+        if status not in self.retry_statuses:
+            return False
+        return status in _NOT_PROCESSED_STATUSES or method.upper() in self.retry_methods
+
+    def should_retry_error(self, method: str, error: Exception) -> bool:
+        """Whether a transport error allows sending the request again"""
+        if isinstance(error, _NOT_SENT_ERRORS):
+            return True
+        return (
+            isinstance(error, httpx.TransportError)
+            and method.upper() in self.retry_methods
+        )
+
+    def response_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Delay before retrying after `response`.
+
+        Returns None if the server asks to wait longer than `max_retry_after`.
+        """
+        delay = retry_after(response)
+        if delay is None and response.status_code == 429:
+            delay = rate_limit_reset(response)
+        if delay is None:
+            return self.backoff(attempt)
+        if delay > self.max_retry_after:
+            return None
+        return delay
+
+    def allow(self, attempt: int) -> bool:
+        """Whether retry number `attempt` (starting at 1) may be sent"""
+        if attempt > self.max_retries:
+            return False
+        return self.budget is None or self.budget.try_withdraw()
+
+
+def retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Seconds to wait according to the `Retry-After` header, given either as a
+    number of seconds or as an HTTP date.
+    """
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(date.timestamp() - time.time(), 0.0)
+
+
+def rate_limit_reset(response: httpx.Response) -> Optional[float]:
+    """
+    Seconds until the rate limit window resets, from the `X-RateLimit-Reset`
+    header (a Unix timestamp).
+    """
+    value = response.headers.get("x-ratelimit-reset")
+    if value is None:
+        return None
+    try:
+        return max(float(value) - time.time(), 0.0)
+    except ValueError:
+        return None
+
+
+def is_replayable(content: Any) -> bool:
+    """Whether a request body can be sent more than once"""
+    if isinstance(content, (FileStream, AsyncFileStream, DeployBody, AsyncDeployBody)):
+        return content.replayable
+    return content is None or isinstance(content, (bytes, str))
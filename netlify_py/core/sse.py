@@ -0,0 +1,164 @@
+from typing import List, Optional
+
+"""
+Incremental Server-Sent Events decoder.
+
+Follows the event stream interpretation of the HTML specification: lines end
+with CRLF, LF or CR, a blank line dispatches the event, lines starting with
+`:` are comments, and the `data`, `event`, `id` and `retry` fields are
+recognized. Every byte is scanned a constant number of times no matter how
+the stream is split into chunks, and only complete lines are decoded.
+"""
+
+_LINE_ENDS = (b"\n", b"\r")
+_BOM = b"\xef\xbb\xbf"
+
+
+class ServerSentEvent:
+    """
+    A dispatched event.
+
+    Attributes:
+        data: Data lines of the event, joined with newlines
+        event: Event type, `"message"` unless set by an `event:` field
+        id: Last event ID of the stream at dispatch time
+        retry: Reconnection time in milliseconds set by this event, if any
+    """
+
+    __slots__ = ("data", "event", "id", "retry")
+
+    def __init__(
+        self,
+        *,
+        data: str,
+        event: str = "message",
+        id: str = "",
+        retry: Optional[int] = None,
+    ):
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    def __repr__(self) -> str:
+        return (
+            f"ServerSentEvent(event={self.event!r}, data={self.data!r}, "
+            f"id={self.id!r}, retry={self.retry!r})"
+        )
+
+
+class SSEDecoder:
+    """
+    Turns chunks of an event stream into `ServerSentEvent`s.
+
+    Chunks may split lines (and CRLF line endings) at any byte. A line that
+    spans several chunks is only joined once its end arrives.
+
+    Attributes:
+        last_event_id: ID to send as `Last-Event-ID` when reconnecting
+        retry: Latest reconnection time in milliseconds sent by the server
+    """
+
+    def __init__(self) -> None:
+        self.last_event_id = ""
+        self.retry: Optional[int] = None
+        self._partial: List[bytes] = []
+        self._skip_lf = False
+        self._started = False
+        self._data: List[bytes] = []
+        self._event: Optional[str] = None
+        self._event_retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        """
+        Decodes a chunk of the stream.
+
+        Returns:
+            Events completed by this chunk, in stream order
+        """
+        if self._skip_lf and chunk:
+            self._skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        if not chunk:
+            return []
+
+        if not self._started:
+            # a byte order mark may start the stream
+            chunk = b"".join(self._partial) + chunk
+            self._partial = []
+            if len(chunk) < len(_BOM) and _BOM.startswith(chunk):
+                self._partial.append(chunk)
+                return []
+            self._started = True
+            if chunk.startswith(_BOM):
+                chunk = chunk[len(_BOM) :]
+                if not chunk:
+                    return []
+        elif self._partial:
+            if chunk.find(b"\n") < 0 and chunk.find(b"\r") < 0:
+                self._partial.append(chunk)
+                return []
+            self._partial.append(chunk)
+            chunk = b"".join(self._partial)
+            self._partial = []
+
+        if chunk[-1:] in _LINE_ENDS:
+            # the LF of a CRLF may start the next chunk
+            self._skip_lf = chunk[-1:] == b"\r"
+        else:
+            end = max(chunk.rfind(b"\n"), chunk.rfind(b"\r")) + 1
+            self._partial.append(chunk[end:])
+            chunk = chunk[:end]
+        return self._process_lines(chunk.splitlines())
+
+    def flush(self) -> List[ServerSentEvent]:
+        """
+        Decodes whatever is left at the end of the stream, dispatching an
+        event that was not terminated by a blank line.
+
+        Returns:
+            The remaining events
+        """
+        line = b"".join(self._partial)
+        self._partial = []
+        return self._process_lines([line, b""] if line else [b""])
+
+    def _process_lines(self, lines: List[bytes]) -> List[ServerSentEvent]:
+        events: List[ServerSentEvent] = []
+        data = self._data
+        for line in lines:
+            if not line:
+                if data:
+                    events.append(self._dispatch())
+                    data = self._data
+                else:
+                    self._event = self._event_retry = None
+                continue
+
+            field, _, value = line.partition(b":")
+            if value[:1] == b" ":
+                value = value[1:]
+            if field == b"data":
+                data.append(value)
+            elif not field:
+                continue  # comment
+            elif field == b"event":
+                self._event = value.decode("utf-8", errors="replace")
+            elif field == b"id":
+                if b"\0" not in value:
+                    self.last_event_id = value.decode("utf-8", errors="replace")
+            elif field == b"retry":
+                if value.isdigit():
+                    self.retry = self._event_retry = int(value)
+        return events
+
+    def _dispatch(self) -> ServerSentEvent:
+        data, event, retry = self._data, self._event, self._event_retry
+        self._data, self._event, self._event_retry = [], None, None
+        return ServerSentEvent(
+            data=b"\n".join(data).decode("utf-8", errors="replace"),
+            event=event or "message",
+            id=self.last_event_id,
+            retry=retry,
+        )
@@ -0,0 +1,33 @@
+from .diff import async_diff_directory, diff_directory, local_manifest
+from .engine import (
+    DeployError,
+    DeployPlan,
+    async_deploy_directory,
+    deploy_directory,
+    plan_deploy,
+)
+from .hashing import default_ignore, hash_directory, hash_file, hash_files
+from .index import HashIndex
+from .manifest import FileManifest, ManifestDiff
+from .mirror import MirrorError, async_mirror_site, mirror_site
+
+__all__ = [
+    "DeployError",
+    "DeployPlan",
+    "FileManifest",
+    "HashIndex",
+    "ManifestDiff",
+    "MirrorError",
+    "async_deploy_directory",
+    "async_diff_directory",
+    "async_mirror_site",
+    "default_ignore",
+    "deploy_directory",
+    "diff_directory",
+    "hash_directory",
+    "hash_file",
+    "hash_files",
+    "local_manifest",
+    "mirror_site",
+    "plan_deploy",
+]
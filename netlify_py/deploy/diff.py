@@ -0,0 +1,127 @@
+import asyncio
+import concurrent.futures
+import functools
+import typing
+
+from .hashing import PathLike, default_ignore, hash_directory
+from .index import HashIndex
+from .manifest import FileManifest, ManifestDiff
+
+if typing.TYPE_CHECKING:
+    from netlify_py.client import AsyncClient, Client
+
+"""
+Comparison of a local directory with the live deploy of a site.
+
+The local files are hashed while the site's file listing streams in, and the
+two manifests are compared, so a pipeline can tell which files a deploy
+would change, and skip deploys that would change nothing, without creating
+a deploy or uploading anything.
+"""
+
+
+def local_manifest(
+    directory: PathLike,
+    *,
+    hash_workers: typing.Optional[int] = None,
+    ignore: typing.Optional[typing.Callable[[str], bool]] = default_ignore,
+    index: typing.Optional[HashIndex] = None,
+) -> FileManifest:
+    """
+    Hashes a directory (SHA1, in parallel worker processes) into a manifest.
+
+    Takes the same arguments as `plan_deploy`.
+    """
+    return FileManifest.from_digests(
+        hash_directory(directory, max_workers=hash_workers, ignore=ignore, index=index)
+    )
+
+
+def diff_directory(
+    client: "Client",
+    *,
+    site_id: str,
+    directory: PathLike,
+    hash_workers: typing.Optional[int] = None,
+    ignore: typing.Optional[typing.Callable[[str], bool]] = default_ignore,
+    index: typing.Optional[HashIndex] = None,
+) -> ManifestDiff:
+    """
+    Compares a local directory with the files of a site's live deploy.
+
+    The site's files are listed with `sites.files.stream_list` in a
+    background thread while the directory is hashed.
+
+    Args:
+        client: Client used to list the site's files
+        site_id: Site to compare with
+        directory: Build output directory
+        hash_workers: Worker processes used for hashing, see `hash_files`
+        ignore: Predicate on deploy paths to leave out of the comparison
+        index: Persistent digest index, only changed files are re-hashed
+
+    Returns:
+        The paths a deploy of `directory` would add, remove and change
+
+    Raises:
+        ApiError: If listing the site's files fails
+
+    Examples:
+    ```py
+    if diff_directory(client, site_id="my-site-id", directory="./dist"):
+        deploy_directory(client, site_id="my-site-id", directory="./dist")
+    ```
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        deployed = pool.submit(
+            lambda: FileManifest.from_files(
+                client.sites.files.stream_list(site_id=site_id)
+            )
+        )
+        local = local_manifest(
+            directory, hash_workers=hash_workers, ignore=ignore, index=index
+        )
+        return local.diff(deployed.result())
+
+
+async def async_diff_directory(
+    client: "AsyncClient",
+    *,
+    site_id: str,
+    directory: PathLike,
+    hash_workers: typing.Optional[int] = None,
+    ignore: typing.Optional[typing.Callable[[str], bool]] = default_ignore,
+    index: typing.Optional[HashIndex] = None,
+) -> ManifestDiff:
+    """
+    Compares a local directory with the files of a site's live deploy.
+
+    Asynchronous version of `diff_directory`: hashing runs in the default
+    executor while the site's files stream in on the event loop.
+
+    Returns:
+        The paths a deploy of `directory` would add, remove and change
+
+    Raises:
+        ApiError: If listing the site's files fails
+
+    Examples:
+    ```py
+    diff = await async_diff_directory(client, site_id="my-site-id", directory="./dist")
+    ```
+    """
+    loop = asyncio.get_running_loop()
+    local, deployed = await asyncio.gather(
+        loop.run_in_executor(
+            None,
+            functools.partial(
+                local_manifest,
+                directory,
+                hash_workers=hash_workers,
+                ignore=ignore,
+                index=index,
+            ),
+        ),
+        FileManifest.afrom_files(client.sites.files.astream_list(site_id=site_id)),
+    )
+    return local.diff(deployed)
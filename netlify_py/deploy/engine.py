@@ -0,0 +1,407 @@
+import asyncio
+import concurrent.futures
+import functools
+import os
+import time
+import typing
+from urllib.parse import quote
+
+from netlify_py.core import DeployBody, type_utils
+from netlify_py.types import models
+
+from .hashing import PathLike, default_ignore, hash_files, walk_directory
+from .index import HashIndex
+
+if typing.TYPE_CHECKING:
+    from netlify_py.client import AsyncClient, Client
+
+"""
+Digest-based deploys of a local directory.
+
+The deploy is created with the digest of every file and function; the API
+answers with the digests it has never seen (`required` and
+`required_functions`), only those are uploaded, and the deploy is then
+polled until it is live.
+"""
+
+# states in which the API is still computing `required` for an async deploy
+PREPARING_STATES = ("new", "preparing")
+FAILED_STATES = ("error", "rejected")
+READY_STATE = "ready"
+
+
+class DeployError(Exception):
+    """
+    Raised when a deploy fails to process or does not become ready in time.
+
+    Attributes:
+        deploy: The last known state of the deploy
+    """
+
+    deploy: models.Deploy
+
+    def __init__(self, message: str, *, deploy: models.Deploy):
+        super().__init__(message)
+        self.deploy = deploy
+
+
+class DeployPlan:
+    """
+    Digests of a local directory and function archives, and where each
+    digest's content can be read from.
+    """
+
+    files: typing.Dict[str, str]
+    functions: typing.Dict[str, str]
+
+    def __init__(
+        self,
+        *,
+        files: typing.Dict[str, str],
+        file_sources: typing.Dict[str, typing.Tuple[str, str]],
+        functions: typing.Dict[str, str],
+        function_sources: typing.Dict[str, typing.Tuple[str, str]],
+    ):
+        """
+        Initialize a deploy plan.
+
+        Args:
+            files: Deploy path to SHA1 digest
+            file_sources: SHA1 digest to (deploy path, local path)
+            functions: Function name to SHA256 digest
+            function_sources: SHA256 digest to (function name, local path)
+        """
+        self.files = files
+        self.functions = functions
+        self._file_sources = file_sources
+        self._function_sources = function_sources
+
+    def file_uploads(
+        self, required: typing.Optional[typing.List[str]]
+    ) -> typing.List[typing.Tuple[str, str]]:
+        """(deploy path, local path) for each required file digest"""
+        return [self._file_sources[sha] for sha in required or []]
+
+    def function_uploads(
+        self, required: typing.Optional[typing.List[str]]
+    ) -> typing.List[typing.Tuple[str, str]]:
+        """(function name, local path) for each required function digest"""
+        return [self._function_sources[sha] for sha in required or []]
+
+
+def plan_deploy(
+    directory: PathLike,
+    *,
+    functions: typing.Optional[typing.Mapping[str, PathLike]] = None,
+    hash_workers: typing.Optional[int] = None,
+    ignore: typing.Optional[typing.Callable[[str], bool]] = default_ignore,
+    index: typing.Optional[HashIndex] = None,
+) -> DeployPlan:
+    """
+    Hashes a directory (SHA1) and function archives (SHA256) for a deploy.
+
+    Args:
+        directory: Build output directory to deploy
+        functions: Function name to path of its zipped archive
+        hash_workers: Worker processes used for hashing, see `hash_files`
+        ignore: Predicate on deploy paths to leave out of the deploy
+        index: Persistent digest index, only changed files are re-hashed
+    """
+    hasher = hash_files if index is None else index.hash_files
+    entries = list(walk_directory(directory, ignore=ignore))
+    digests = hasher([local for _, local in entries], max_workers=hash_workers)
+
+    files: typing.Dict[str, str] = {}
+    file_sources: typing.Dict[str, typing.Tuple[str, str]] = {}
+    for (deploy_path, local_path), sha in zip(entries, digests):
+        files[deploy_path] = sha
+        file_sources.setdefault(sha, (deploy_path, local_path))
+
+    function_paths = [os.fspath(path) for path in (functions or {}).values()]
+    function_digests = hasher(function_paths, algorithm="sha256", max_workers=1)
+    function_map: typing.Dict[str, str] = {}
+    function_sources: typing.Dict[str, typing.Tuple[str, str]] = {}
+    for name, local_path, sha in zip(functions or {}, function_paths, function_digests):
+        function_map[name] = sha
+        function_sources.setdefault(sha, (name, local_path))
+
+    return DeployPlan(
+        files=files,
+        file_sources=file_sources,
+        functions=function_map,
+        function_sources=function_sources,
+    )
+
+
+def _upload_path(deploy_path: str) -> str:
+    """URL path segment for a deploy path, e.g. `/a b.js` -> `a%20b.js`"""
+    return quote(deploy_path.lstrip("/"))
+
+
+def _check_failed(deploy: models.Deploy) -> None:
+    if deploy.state in FAILED_STATES:
+        raise DeployError(
+            f"deploy {deploy.id} failed with state {deploy.state!r}: "
+            f"{deploy.error_message or 'no error message'}",
+            deploy=deploy,
+        )
+
+
+def _check_timeout(deploy: models.Deploy, deadline: float, waiting_for: str) -> None:
+    if time.monotonic() >= deadline:
+        raise DeployError(
+            f"timed out waiting for deploy {deploy.id} to be {waiting_for} "
+            f"(last state {deploy.state!r})",
+            deploy=deploy,
+        )
+
+
+def _create_body(
+    plan: DeployPlan,
+    *,
+    draft: bool,
+    branch: typing.Optional[str],
+    async_: bool,
+    compress: bool,
+) -> DeployBody:
+    return DeployBody(
+        files=plan.files,
+        functions=plan.functions or None,
+        draft=draft,
+        async_=async_ or None,
+        branch=branch,
+        compress=compress,
+    )
+
+
+def deploy_directory(
+    client: "Client",
+    *,
+    site_id: str,
+    directory: PathLike,
+    functions: typing.Optional[typing.Mapping[str, PathLike]] = None,
+    draft: bool = False,
+    branch: typing.Optional[str] = None,
+    title: typing.Optional[str] = None,
+    async_: bool = False,
+    compress: bool = False,
+    max_concurrency: int = 8,
+    hash_workers: typing.Optional[int] = None,
+    ignore: typing.Optional[typing.Callable[[str], bool]] = default_ignore,
+    index: typing.Optional[HashIndex] = None,
+    poll_interval: float = 1.0,
+    timeout: float = 600.0,
+) -> models.Deploy:
+    """
+    Deploys a local directory to a site, uploading only content Netlify does
+    not already have.
+
+    Files are hashed in parallel worker processes, the deploy is created with
+    their digests, the `required` files and `required_functions` archives are
+    uploaded with at most `max_concurrency` uploads in flight, and the deploy
+    is polled until its state is `ready`.
+
+    Args:
+        client: Client used for every API call
+        site_id: Site to deploy to
+        directory: Build output directory to deploy
+        functions: Function name to path of its zipped archive
+        draft: Create a draft deploy instead of publishing it
+        branch: Branch the deploy belongs to
+        title: Deploy title
+        async_: Let the API compute the required digests asynchronously,
+            recommended for very large deploys
+        compress: Gzip the request body listing the digests
+        max_concurrency: Maximum number of parallel uploads
+        hash_workers: Worker processes used for hashing, see `hash_files`
+        ignore: Predicate on deploy paths to leave out of the deploy
+        index: Persistent digest index, only changed files are re-hashed
+        poll_interval: Seconds between deploy state checks
+        timeout: Seconds to wait for the deploy to be processed and ready
+
+    Returns:
+        The ready deploy
+
+    Raises:
+        DeployError: If the deploy fails or is not ready within `timeout`
+        ApiError: If an API call fails
+
+    Examples:
+    ```py
+    deploy = deploy_directory(client, site_id="my-site-id", directory="./dist")
+    ```
+    """
+    plan = plan_deploy(
+        directory,
+        functions=functions,
+        hash_workers=hash_workers,
+        ignore=ignore,
+        index=index,
+    )
+    deadline = time.monotonic() + timeout
+    deploy = client.sites.deploys.create_streamed(
+        site_id=site_id,
+        body=_create_body(
+            plan, draft=draft, branch=branch, async_=async_, compress=compress
+        ),
+        title=type_utils.NOT_GIVEN if title is None else title,
+    )
+    deploy_id = typing.cast(str, deploy.id)
+
+    def refresh() -> models.Deploy:
+        time.sleep(poll_interval)
+        return client.sites.deploys.get(site_id=site_id, deploy_id=deploy_id)
+
+    while deploy.state in PREPARING_STATES:
+        _check_timeout(deploy, deadline, "prepared")
+        deploy = refresh()
+    _check_failed(deploy)
+
+    def upload_file(upload: typing.Tuple[str, str]) -> None:
+        deploy_path, local_path = upload
+        with open(local_path, "rb") as data:
+            client.deploys.files.upload(
+                deploy_id=deploy_id, path=_upload_path(deploy_path), data=data
+            )
+
+    def upload_function(upload: typing.Tuple[str, str]) -> None:
+        name, local_path = upload
+        with open(local_path, "rb") as data:
+            client.deploys.functions.upload(deploy_id=deploy_id, name=name, data=data)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        futures = [
+            *(pool.submit(upload_file, u) for u in plan.file_uploads(deploy.required)),
+            *(
+                pool.submit(upload_function, u)
+                for u in plan.function_uploads(deploy.required_functions)
+            ),
+        ]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    while deploy.state != READY_STATE:
+        deploy = refresh()
+        _check_failed(deploy)
+        if deploy.state != READY_STATE:
+            _check_timeout(deploy, deadline, READY_STATE)
+
+    return deploy
+
+
+async def async_deploy_directory(
+    client: "AsyncClient",
+    *,
+    site_id: str,
+    directory: PathLike,
+    functions: typing.Optional[typing.Mapping[str, PathLike]] = None,
+    draft: bool = False,
+    branch: typing.Optional[str] = None,
+    title: typing.Optional[str] = None,
+    async_: bool = False,
+    compress: bool = False,
+    max_concurrency: int = 8,
+    hash_workers: typing.Optional[int] = None,
+    ignore: typing.Optional[typing.Callable[[str], bool]] = default_ignore,
+    index: typing.Optional[HashIndex] = None,
+    poll_interval: float = 1.0,
+    timeout: float = 600.0,
+) -> models.Deploy:
+    """
+    Deploys a local directory to a site, uploading only content Netlify does
+    not already have.
+
+    Asynchronous version of `deploy_directory`: hashing runs in the default
+    executor (fanning out to worker processes) so the event loop stays
+    responsive, and uploads are gated by a semaphore of `max_concurrency`.
+
+    Returns:
+        The ready deploy
+
+    Raises:
+        DeployError: If the deploy fails or is not ready within `timeout`
+        ApiError: If an API call fails
+
+    Examples:
+    ```py
+    deploy = await async_deploy_directory(
+        client, site_id="my-site-id", directory="./dist"
+    )
+    ```
+    """
+    loop = asyncio.get_running_loop()
+    plan = await loop.run_in_executor(
+        None,
+        functools.partial(
+            plan_deploy,
+            directory,
+            functions=functions,
+            hash_workers=hash_workers,
+            ignore=ignore,
+            index=index,
+        ),
+    )
+    deadline = time.monotonic() + timeout
+    deploy = await client.sites.deploys.create_streamed(
+        site_id=site_id,
+        body=_create_body(
+            plan, draft=draft, branch=branch, async_=async_, compress=compress
+        ),
+        title=type_utils.NOT_GIVEN if title is None else title,
+    )
+    deploy_id = typing.cast(str, deploy.id)
+
+    async def refresh() -> models.Deploy:
+        await asyncio.sleep(poll_interval)
+        return await client.sites.deploys.get(site_id=site_id, deploy_id=deploy_id)
+
+    while deploy.state in PREPARING_STATES:
+        _check_timeout(deploy, deadline, "prepared")
+        deploy = await refresh()
+    _check_failed(deploy)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def upload_file(upload: typing.Tuple[str, str]) -> None:
+        deploy_path, local_path = upload
+        async with semaphore:
+            with open(local_path, "rb") as data:
+                await client.deploys.files.upload(
+                    deploy_id=deploy_id, path=_upload_path(deploy_path), data=data
+                )
+
+    async def upload_function(upload: typing.Tuple[str, str]) -> None:
+        name, local_path = upload
+        async with semaphore:
+            with open(local_path, "rb") as data:
+                await client.deploys.functions.upload(
+                    deploy_id=deploy_id, name=name, data=data
+                )
+
+    tasks = [
+        *(
+            asyncio.ensure_future(upload_file(u))
+            for u in plan.file_uploads(deploy.required)
+        ),
+        *(
+            asyncio.ensure_future(upload_function(u))
+            for u in plan.function_uploads(deploy.required_functions)
+        ),
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    while deploy.state != READY_STATE:
+        deploy = await refresh()
+        _check_failed(deploy)
+        if deploy.state != READY_STATE:
+            _check_timeout(deploy, deadline, READY_STATE)
+
+    return deploy
@@ -0,0 +1,145 @@
+import concurrent.futures
+import functools
+import hashlib
+import os
+import typing
+
+if typing.TYPE_CHECKING:
+    from .index import HashIndex
+
+"""
+Content hashing for digest-based deploys.
+
+Netlify deploys are described by the SHA1 digest of every file (and the
+SHA256 digest of every function archive); only content the API has not seen
+before is uploaded.
+"""
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# below this many files, starting worker processes costs more than it saves
+PARALLEL_HASH_THRESHOLD = 64
+
+PathLike = typing.Union[str, "os.PathLike[str]"]
+
+
+def hash_file(path: PathLike, algorithm: str = "sha1") -> str:
+    """
+    Returns the hex digest of a file's content, read in 1 MiB chunks.
+    """
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as file:
+        for chunk in iter(functools.partial(file.read, HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_files(
+    paths: typing.Sequence[PathLike],
+    *,
+    algorithm: str = "sha1",
+    max_workers: typing.Optional[int] = None,
+) -> typing.List[str]:
+    """
+    Hashes many files, in parallel worker processes for large batches.
+
+    Args:
+        paths: Files to hash
+        algorithm: `hashlib` algorithm name
+        max_workers: Number of worker processes, `1` hashes in this process.
+            Defaults to the number of CPUs.
+
+    Returns:
+        Hex digests in the same order as `paths`
+    """
+    hasher = functools.partial(hash_file, algorithm=algorithm)
+    if max_workers == 1 or len(paths) < PARALLEL_HASH_THRESHOLD:
+        return [hasher(path) for path in paths]
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, min(256, len(paths) // (workers * 4)))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(hasher, paths, chunksize=chunksize))
+
+
+def default_ignore(deploy_path: str) -> bool:
+    """
+    Mirrors the files the Netlify CLI leaves out of a deploy: hidden files and
+    directories (except `.well-known`) and `__MACOSX` archive metadata.
+    """
+    for segment in deploy_path.split("/"):
+        if segment == "__MACOSX":
+            return True
+        if segment.startswith(".") and segment != ".well-known":
+            return True
+    return False
+
+
+def _directory_id(path: str) -> typing.Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_dev, st.st_ino
+
+
+def walk_directory(
+    root: PathLike,
+    *,
+    ignore: typing.Optional[typing.Callable[[str], bool]] = default_ignore,
+) -> typing.Iterator[typing.Tuple[str, str]]:
+    """
+    Yields `(deploy_path, local_path)` for every file under `root`.
+
+    Deploy paths are relative to `root`, use forward slashes and start with
+    `/`, as expected by the deploy API. Symbolic links are followed, except
+    links to a directory containing them, which would repeat it endlessly.
+    """
+    root = os.fspath(root)
+    # (st_dev, st_ino) of each directory and of its ancestors
+    chains = {root: frozenset([_directory_id(root)])}
+    for directory, dirnames, filenames in os.walk(root, followlinks=True):
+        chain = chains.pop(directory)
+        relative = os.path.relpath(directory, root)
+        prefix = "" if relative == "." else "/" + relative.replace(os.sep, "/")
+        if ignore is not None and prefix and ignore(prefix):
+            dirnames[:] = []
+            continue
+        followed = []
+        for dirname in sorted(dirnames):
+            path = os.path.join(directory, dirname)
+            try:
+                key = _directory_id(path)
+            except OSError:
+                continue
+            if key not in chain:
+                chains[path] = chain | {key}
+                followed.append(dirname)
+        dirnames[:] = followed
+        for filename in sorted(filenames):
+            deploy_path = f"{prefix}/{filename}"
+            if ignore is not None and ignore(deploy_path):
+                continue
+            yield deploy_path, os.path.join(directory, filename)
+
+
+def hash_directory(
+    root: PathLike,
+    *,
+    algorithm: str = "sha1",
+    max_workers: typing.Optional[int] = None,
+    ignore: typing.Optional[typing.Callable[[str], bool]] = default_ignore,
+    index: typing.Optional["HashIndex"] = None,
+) -> typing.Dict[str, str]:
+    """
+    Hashes every file under `root`.
+
+    When an `index` is given, files unchanged since they were last hashed
+    are not read again.
+
+    Returns:
+        Mapping of deploy path (e.g. `/assets/app.js`) to hex digest
+    """
+    entries = list(walk_directory(root, ignore=ignore))
+    hasher = hash_files if index is None else index.hash_files
+    digests = hasher(
+        [local for _, local in entries], algorithm=algorithm, max_workers=max_workers
+    )
+    return {deploy_path: digest for (deploy_path, _), digest in zip(entries, digests)}
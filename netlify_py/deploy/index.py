@@ -0,0 +1,185 @@
+import os
+import sqlite3
+import threading
+import typing
+
+from .hashing import PathLike, hash_files
+
+"""
+Persistent content hash index for incremental deploys.
+
+Digests are stored in a SQLite database next to the `(size, mtime, inode)`
+of the file they were computed from. A file whose stat signature is
+unchanged is not read again, so re-deploying a large build output only
+hashes the files that changed.
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS digests (
+    path TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (path, algorithm)
+)
+"""
+
+Signature = typing.Tuple[int, int, int]
+
+
+def _signature(stat: os.stat_result) -> Signature:
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+class HashIndex:
+    """
+    On-disk index of file digests keyed by path and stat signature.
+
+    The index can be shared between threads. Use it as a context manager, or
+    call `close` when done.
+
+    Examples:
+    ```py
+    with HashIndex(".netlify-hashes.sqlite") as index:
+        deploy_directory(client, site_id="my-site-id", directory="./dist", index=index)
+    ```
+    """
+
+    def __init__(self, database: PathLike):
+        """
+        Open (or create) an index.
+
+        Args:
+            database: Path of the SQLite database file, `":memory:"` for a
+                throwaway index
+        """
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.fspath(database), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._cache: typing.Dict[
+            str, typing.Dict[str, typing.Tuple[Signature, str]]
+        ] = {}
+
+    def __enter__(self) -> "HashIndex":
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database"""
+        with self._lock:
+            self._conn.close()
+
+    def _entries(
+        self, algorithm: str
+    ) -> typing.Dict[str, typing.Tuple[Signature, str]]:
+        """All entries of an algorithm, loaded once with a single query"""
+        entries = self._cache.get(algorithm)
+        if entries is None:
+            rows = self._conn.execute(
+                "SELECT path, size, mtime_ns, inode, digest FROM digests "
+                "WHERE algorithm = ?",
+                (algorithm,),
+            )
+            entries = {
+                path: ((size, mtime_ns, inode), digest)
+                for path, size, mtime_ns, inode, digest in rows
+            }
+            self._cache[algorithm] = entries
+        return entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM digests").fetchone()
+            return int(count)
+
+    def hash_files(
+        self,
+        paths: typing.Sequence[PathLike],
+        *,
+        algorithm: str = "sha1",
+        max_workers: typing.Optional[int] = None,
+    ) -> typing.List[str]:
+        """
+        Hashes files, reusing stored digests of files whose size, mtime and
+        inode are unchanged. New digests are written back to the index.
+
+        Takes the same arguments as `netlify_py.deploy.hash_files`.
+
+        Returns:
+            Hex digests in the same order as `paths`
+        """
+        keys = [os.path.abspath(path) for path in paths]
+        signatures = [_signature(os.stat(key)) for key in keys]
+        digests: typing.List[typing.Optional[str]] = []
+        misses: typing.List[int] = []
+
+        with self._lock:
+            entries = self._entries(algorithm)
+            for i, (key, signature) in enumerate(zip(keys, signatures)):
+                entry = entries.get(key)
+                if entry is not None and entry[0] == signature:
+                    digests.append(entry[1])
+                else:
+                    digests.append(None)
+                    misses.append(i)
+
+        if not misses:
+            return typing.cast(typing.List[str], digests)
+
+        computed = hash_files(
+            [keys[i] for i in misses], algorithm=algorithm, max_workers=max_workers
+        )
+        rows = []
+        for i, digest in zip(misses, computed):
+            digests[i] = digest
+            rows.append((keys[i], algorithm, *signatures[i], digest))
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO digests "
+                    "(path, algorithm, size, mtime_ns, inode, digest) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            entries = self._entries(algorithm)
+            for key, _, size, mtime_ns, inode, digest in rows:
+                entries[key] = ((size, mtime_ns, inode), digest)
+
+        return typing.cast(typing.List[str], digests)
+
+    def compact(self) -> int:
+        """
+        Drops entries for files that were deleted or changed since they were
+        hashed, then reclaims the free space of the database file.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, algorithm, size, mtime_ns, inode FROM digests"
+            ).fetchall()
+            stale = []
+            for path, algorithm, size, mtime_ns, inode in rows:
+                try:
+                    current = _signature(os.stat(path))
+                except OSError:
+                    current = None
+                if current != (size, mtime_ns, inode):
+                    stale.append((path, algorithm))
+
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM digests WHERE path = ? AND algorithm = ?", stale
+                )
+            self._conn.execute("VACUUM")
+            self._cache.clear()
+            return len(stale)
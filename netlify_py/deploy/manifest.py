@@ -0,0 +1,374 @@
+import array
+import typing
+
+"""
+Compact in-memory manifests of deployed and local files.
+
+A site can have hundreds of thousands of files; holding each as a
+`models.File` costs hundreds of bytes per file. A `FileManifest` packs the
+sorted paths into one UTF-8 buffer indexed by an `array("q")` of offsets,
+the SHA1 digests as 20-byte binary into another buffer, the sizes into an
+`array("q")` and the MIME types as indices into a small table, so that a
+file costs little more than the bytes of its path and digest.
+
+The API can list a file without a digest; such a file is kept with an
+unknown digest, which never matches another, so diffs report it as changed
+instead of failing.
+"""
+
+SHA1_SIZE = 20
+UNKNOWN_SIZE = -1
+# digest stored for files listed without one, see `FileManifest.unknown`
+_NO_DIGEST = bytes(SHA1_SIZE)
+
+
+class _HasFile(typing.Protocol):
+    path: typing.Optional[str]
+    sha: typing.Optional[str]
+    size: typing.Optional[int]
+
+
+class ManifestDiff:
+    """
+    Differences between a manifest and the base it was compared with.
+
+    Attributes:
+        added: Paths only in the manifest, sorted
+        removed: Paths only in the base, sorted
+        changed: Paths in both with different digests, sorted
+    """
+
+    added: typing.List[str]
+    removed: typing.List[str]
+    changed: typing.List[str]
+
+    def __init__(
+        self,
+        *,
+        added: typing.List[str],
+        removed: typing.List[str],
+        changed: typing.List[str],
+    ):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __bool__(self) -> bool:
+        """Whether the manifests differ at all"""
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return (
+            f"ManifestDiff(added={len(self.added)}, removed={len(self.removed)}, "
+            f"changed={len(self.changed)})"
+        )
+
+
+class FileManifest:
+    """
+    Deploy path to SHA1 digest, size and MIME type of many files.
+
+    Paths are kept sorted, so lookups are binary searches, `paths(prefix)`
+    lists a directory without scanning the manifest, and two manifests are
+    compared in a single merge pass.
+
+    Examples:
+    ```py
+    deployed = FileManifest.from_files(client.sites.files.stream_list(site_id="my-site-id"))
+    local = FileManifest.from_digests(hash_directory("./dist"))
+    diff = local.diff(deployed)
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty manifest, see `from_files` and `from_digests`"""
+        self._paths = b""
+        self._offsets = array.array("q", [0])
+        self._digests = b""
+        self._sizes = array.array("q")
+        self._mime_types = array.array("H")
+        self._mime_table: typing.List[typing.Optional[str]] = [None]
+        self._unknown: typing.FrozenSet[str] = frozenset()
+
+    @classmethod
+    def from_files(cls, files: typing.Iterable[_HasFile]) -> "FileManifest":
+        """
+        Builds a manifest from `sites.files.list` (or `stream_list`) items.
+
+        Any object with `path`, `sha`, `size` and, optionally, `mime_type`
+        attributes is accepted, so models, lazy models and projections all
+        work. Files are consumed one at a time, so a streamed listing is never
+        held in memory as a whole.
+
+        Files without a digest are kept with an unknown one, see
+        `unknown`.
+
+        Raises:
+            ValueError: If a file has no path or an invalid SHA1 digest
+        """
+        builder = _Builder()
+        for file in files:
+            builder.add(
+                file.path, file.sha, file.size, getattr(file, "mime_type", None)
+            )
+        return builder.build(cls())
+
+    @classmethod
+    async def afrom_files(cls, files: typing.AsyncIterable[_HasFile]) -> "FileManifest":
+        """
+        Builds a manifest from an asynchronous iterator of files, such as
+        `sites.files.astream_list`. See `from_files`.
+        """
+        builder = _Builder()
+        async for file in files:
+            builder.add(
+                file.path, file.sha, file.size, getattr(file, "mime_type", None)
+            )
+        return builder.build(cls())
+
+    @classmethod
+    def from_digests(
+        cls,
+        digests: typing.Mapping[str, str],
+        sizes: typing.Optional[typing.Mapping[str, int]] = None,
+    ) -> "FileManifest":
+        """
+        Builds a manifest from deploy path to hex SHA1 digest, such as the
+        result of `hash_directory`.
+
+        Raises:
+            ValueError: If a digest is not a valid SHA1 digest
+        """
+        builder = _Builder()
+        for path, sha in digests.items():
+            builder.add(path, sha, None if sizes is None else sizes.get(path))
+        return builder.build(cls())
+
+    def _path(self, i: int) -> bytes:
+        return self._paths[self._offsets[i] : self._offsets[i + 1]]
+
+    def _digest(self, i: int) -> bytes:
+        return self._digests[i * SHA1_SIZE : (i + 1) * SHA1_SIZE]
+
+    def _bisect(self, key: bytes) -> int:
+        """Index of the first path not lower than `key`"""
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self._path(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _position(self, path: str) -> int:
+        """Index of `path`, -1 if absent"""
+        key = path.encode()
+        i = self._bisect(key)
+        return i if i < len(self) and self._path(i) == key else -1
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, str) and self._position(path) >= 0
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """Paths, sorted"""
+        for i in range(len(self)):
+            yield self._path(i).decode()
+
+    @property
+    def unknown(self) -> typing.FrozenSet[str]:
+        """Paths of the files listed without a digest"""
+        return self._unknown
+
+    def sha(self, path: str) -> typing.Optional[str]:
+        """Hex SHA1 digest of a file, None if it is unknown or not in the
+        manifest"""
+        i = self._position(path)
+        if i < 0 or path in self._unknown:
+            return None
+        return self._digest(i).hex()
+
+    def size(self, path: str) -> typing.Optional[int]:
+        """Size of a file, None if unknown or not in the manifest"""
+        i = self._position(path)
+        if i < 0 or self._sizes[i] == UNKNOWN_SIZE:
+            return None
+        return self._sizes[i]
+
+    def mime_type(self, path: str) -> typing.Optional[str]:
+        """MIME type of a file, None if unknown or not in the manifest"""
+        i = self._position(path)
+        return None if i < 0 else self._mime_table[self._mime_types[i]]
+
+    def paths(self, prefix: str = "") -> typing.List[str]:
+        """
+        Sorted paths starting with `prefix`, e.g. `"/assets/"` for a
+        directory, found by binary search.
+        """
+        key = prefix.encode()
+        paths = []
+        for i in range(self._bisect(key), len(self)):
+            path = self._path(i)
+            if not path.startswith(key):
+                break
+            paths.append(path.decode())
+        return paths
+
+    def digests(self) -> typing.Dict[str, str]:
+        """Deploy path to hex SHA1 digest, as taken by `sites.deploys.create`.
+        Files with an unknown digest are left out."""
+        digests = {
+            self._path(i).decode(): self._digest(i).hex() for i in range(len(self))
+        }
+        for path in self._unknown:
+            del digests[path]
+        return digests
+
+    def diff(self, base: "FileManifest") -> ManifestDiff:
+        """
+        Compares the manifest with `base`, e.g. a local build with the live
+        deploy, in a single pass over both. A file whose digest is unknown
+        on either side is reported as changed.
+
+        Returns:
+            The paths added, removed and changed relative to `base`
+        """
+        unknown = self._unknown | base._unknown
+        if self._paths == base._paths and self._offsets == base._offsets:
+            changed = _changed(self._digests, base._digests)
+            return ManifestDiff(
+                added=[],
+                removed=[],
+                changed=sorted(unknown.union(self._path(i).decode() for i in changed)),
+            )
+
+        added: typing.List[str] = []
+        removed: typing.List[str] = []
+        changed_paths: typing.List[str] = []
+        i = j = 0
+        ours, theirs = len(self), len(base)
+        while i < ours and j < theirs:
+            path, other = self._path(i), base._path(j)
+            if path == other:
+                if self._digest(i) != base._digest(j) or (
+                    unknown and path.decode() in unknown
+                ):
+                    changed_paths.append(path.decode())
+                i += 1
+                j += 1
+            elif path < other:
+                added.append(path.decode())
+                i += 1
+            else:
+                removed.append(other.decode())
+                j += 1
+        added.extend(self._path(k).decode() for k in range(i, ours))
+        removed.extend(base._path(k).decode() for k in range(j, theirs))
+        return ManifestDiff(added=added, removed=removed, changed=changed_paths)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FileManifest):
+            return NotImplemented
+        return (
+            self._paths == other._paths
+            and self._offsets == other._offsets
+            and self._digests == other._digests
+            and self._unknown == other._unknown
+        )
+
+    def __repr__(self) -> str:
+        return f"FileManifest({len(self)} files)"
+
+
+# entries compared at once when looking for changed digests
+_BLOCK = 1024
+
+
+def _changed(ours: bytes, theirs: bytes) -> typing.List[int]:
+    """Indices of the differing digests of two digest buffers of equal length,
+    comparing whole blocks first so that unchanged regions cost one comparison
+    """
+    changed = []
+    block = _BLOCK * SHA1_SIZE
+    for start in range(0, len(ours), block):
+        if ours[start : start + block] == theirs[start : start + block]:
+            continue
+        end = min(start + block, len(ours))
+        for offset in range(start, end, SHA1_SIZE):
+            if ours[offset : offset + SHA1_SIZE] != theirs[offset : offset + SHA1_SIZE]:
+                changed.append(offset // SHA1_SIZE)
+    return changed
+
+
+class _Builder:
+    """Collects the entries of a manifest, then sorts and packs them"""
+
+    def __init__(self) -> None:
+        self.paths: typing.List[bytes] = []
+        self.digests = bytearray()
+        self.sizes = array.array("q")
+        self.mime_types = array.array("H")
+        self.mime_table: typing.List[typing.Optional[str]] = [None]
+        self.unknown: typing.Set[int] = set()
+
+    def add(
+        self,
+        path: typing.Optional[str],
+        sha: typing.Optional[str],
+        size: typing.Optional[int],
+        mime_type: typing.Optional[str] = None,
+    ) -> None:
+        if not path:
+            raise ValueError("file without a path")
+        if not sha:
+            self.unknown.add(len(self.paths))
+            digest = _NO_DIGEST
+        else:
+            try:
+                digest = bytes.fromhex(sha)
+            except ValueError:
+                digest = b""
+            if len(digest) != SHA1_SIZE:
+                raise ValueError(f"invalid SHA1 digest {sha!r} for {path}")
+        self.paths.append(path.encode())
+        self.digests += digest
+        self.sizes.append(UNKNOWN_SIZE if size is None else size)
+        if mime_type not in self.mime_table:
+            self.mime_table.append(mime_type)
+        self.mime_types.append(self.mime_table.index(mime_type))
+
+    def build(self, manifest: FileManifest) -> FileManifest:
+        """Packs the entries into `manifest`, sorted by path. Of duplicate
+        paths, the last added wins."""
+        paths = self.paths
+        # UTF-8 byte order is code point order, so paths sort like strings
+        order = sorted(range(len(paths)), key=paths.__getitem__)
+        # a stable sort keeps duplicates in insertion order
+        order = [
+            i
+            for n, i in enumerate(order)
+            if n + 1 == len(order) or paths[order[n + 1]] != paths[i]
+        ]
+
+        offsets = array.array("q", [0])
+        total = 0
+        for i in order:
+            total += len(paths[i])
+            offsets.append(total)
+        digests = self.digests
+        manifest._paths = b"".join(paths[i] for i in order)
+        manifest._offsets = offsets
+        manifest._digests = b"".join(
+            digests[i * SHA1_SIZE : (i + 1) * SHA1_SIZE] for i in order
+        )
+        manifest._sizes = array.array("q", (self.sizes[i] for i in order))
+        manifest._mime_types = array.array("H", (self.mime_types[i] for i in order))
+        manifest._mime_table = self.mime_table
+        if self.unknown:
+            manifest._unknown = frozenset(
+                paths[i].decode() for i in order if i in self.unknown
+            )
+        return manifest
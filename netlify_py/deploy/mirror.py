@@ -0,0 +1,208 @@
+import asyncio
+import concurrent.futures
+import functools
+import os
+import typing
+from urllib.parse import quote
+
+from .hashing import PathLike, hash_file, hash_files
+from .manifest import FileManifest
+
+if typing.TYPE_CHECKING:
+    from netlify_py.client import AsyncClient, Client
+
+"""
+Mirroring of a site's live deploy to a local directory.
+
+Files are listed with `sites.files.stream_list` into a `FileManifest`, local
+copies whose digest already matches are kept, and the other files are
+downloaded in parallel, each streamed to disk and resumable, then checked
+against their SHA1 digest. Files listed without a digest are always
+downloaded, unchecked.
+"""
+
+
+class MirrorError(Exception):
+    """
+    Raised when a deployed file cannot be mirrored safely.
+
+    Attributes:
+        path: Deploy path of the file
+    """
+
+    path: str
+
+    def __init__(self, message: str, *, path: str):
+        super().__init__(message)
+        self.path = path
+
+
+def _local_path(root: str, deploy_path: str) -> str:
+    """Local path of a deploy path under `root`, refusing paths escaping it"""
+    local = os.path.normpath(os.path.join(root, *deploy_path.lstrip("/").split("/")))
+    if os.path.commonpath([root, local]) != root or local == root:
+        raise MirrorError(f"unsafe deploy path {deploy_path!r}", path=deploy_path)
+    return local
+
+
+def _plan_mirror(
+    manifest: FileManifest,
+    directory: PathLike,
+    *,
+    skip_unchanged: bool,
+    hash_workers: typing.Optional[int],
+) -> typing.List[typing.Tuple[str, str]]:
+    """(deploy path, local path) of the files to download"""
+    root = os.path.abspath(os.fspath(directory))
+    files = [(path, _local_path(root, path)) for path in manifest]
+    if not skip_unchanged:
+        return files
+    existing = [(path, local) for path, local in files if os.path.isfile(local)]
+    digests = hash_files([local for _, local in existing], max_workers=hash_workers)
+    unchanged = {
+        path for (path, _), sha in zip(existing, digests) if sha == manifest.sha(path)
+    }
+    return [(path, local) for path, local in files if path not in unchanged]
+
+
+def _verify(manifest: FileManifest, deploy_path: str, local_path: str) -> None:
+    expected = manifest.sha(deploy_path)
+    if expected is None:
+        # listed without a digest, nothing to check against
+        return
+    if hash_file(local_path) != expected:
+        os.remove(local_path)
+        raise MirrorError(
+            f"digest of {deploy_path} does not match the deployed {expected}",
+            path=deploy_path,
+        )
+
+
+def mirror_site(
+    client: "Client",
+    *,
+    site_id: str,
+    directory: PathLike,
+    max_concurrency: int = 8,
+    skip_unchanged: bool = True,
+    verify: bool = True,
+    hash_workers: typing.Optional[int] = None,
+) -> typing.List[str]:
+    """
+    Downloads the files of a site's live deploy into a directory.
+
+    Each file is streamed to disk, so memory use does not depend on file
+    sizes, and an interrupted file is resumed from its `.part` file when the
+    mirror is run again.
+
+    Args:
+        client: Client used for every API call
+        site_id: Site to mirror
+        directory: Directory to mirror into, created as needed
+        max_concurrency: Maximum number of parallel downloads
+        skip_unchanged: Keep local files whose digest matches the deploy
+        verify: Check the SHA1 digest of every downloaded file
+        hash_workers: Worker processes hashing existing files, see `hash_files`
+
+    Returns:
+        Deploy paths of the files downloaded, sorted
+
+    Raises:
+        MirrorError: If a file has an unsafe path or, with `verify`, a digest
+            other than the deployed one
+        ApiError: If an API call fails
+
+    Examples:
+    ```py
+    mirror_site(client, site_id="my-site-id", directory="./mirror")
+    ```
+    """
+    manifest = FileManifest.from_files(client.sites.files.stream_list(site_id=site_id))
+    downloads = _plan_mirror(
+        manifest, directory, skip_unchanged=skip_unchanged, hash_workers=hash_workers
+    )
+
+    def download(entry: typing.Tuple[str, str]) -> None:
+        deploy_path, local_path = entry
+        client.sites.files.download(
+            file_path=quote(deploy_path.lstrip("/")),
+            site_id=site_id,
+            destination=local_path,
+        )
+        if verify:
+            _verify(manifest, deploy_path, local_path)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        futures = [pool.submit(download, entry) for entry in downloads]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+    return [path for path, _ in downloads]
+
+
+async def async_mirror_site(
+    client: "AsyncClient",
+    *,
+    site_id: str,
+    directory: PathLike,
+    max_concurrency: int = 8,
+    skip_unchanged: bool = True,
+    verify: bool = True,
+    hash_workers: typing.Optional[int] = None,
+) -> typing.List[str]:
+    """
+    Downloads the files of a site's live deploy into a directory.
+
+    Asynchronous version of `mirror_site`: hashing runs in the default
+    executor and downloads are gated by a semaphore of `max_concurrency`.
+
+    Returns:
+        Deploy paths of the files downloaded, sorted
+
+    Raises:
+        MirrorError: If a file has an unsafe path or, with `verify`, a digest
+            other than the deployed one
+        ApiError: If an API call fails
+
+    Examples:
+    ```py
+    await async_mirror_site(client, site_id="my-site-id", directory="./mirror")
+    ```
+    """
+    loop = asyncio.get_running_loop()
+    manifest = await FileManifest.afrom_files(
+        client.sites.files.astream_list(site_id=site_id)
+    )
+    downloads = await loop.run_in_executor(
+        None,
+        functools.partial(
+            _plan_mirror,
+            manifest,
+            directory,
+            skip_unchanged=skip_unchanged,
+            hash_workers=hash_workers,
+        ),
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def download(entry: typing.Tuple[str, str]) -> None:
+        deploy_path, local_path = entry
+        async with semaphore:
+            await client.sites.files.download(
+                file_path=quote(deploy_path.lstrip("/")),
+                site_id=site_id,
+                destination=local_path,
+            )
+        if verify:
+            await loop.run_in_executor(None, _verify, manifest, deploy_path, local_path)
+
+    tasks = [asyncio.ensure_future(download(entry)) for entry in downloads]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return [path for path, _ in downloads]
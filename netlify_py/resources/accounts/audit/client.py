@@ -100,6 +100,78 @@ class AuditClient:
             request_options=request_options or default_request_options(),
         )
 
+    def iter_list(
+        self,
+        *,
+        account_id: str,
+        log_type: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        per_page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        query: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[models.AuditLog]:
+        """
+        GET /accounts/{account_id}/audit
+
+        Args:
+            log_type: str
+            per_page: int
+            query: str
+            account_id: str
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the items of every page, following the `Link` header
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        for item in client.accounts.audit.iter_list(account_id="string"):
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(log_type, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "log_type",
+                to_encodable(item=log_type, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(per_page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "per_page",
+                to_encodable(item=per_page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(query, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "query",
+                to_encodable(item=query, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.paginate(
+            method="GET",
+            path=f"/accounts/{account_id}/audit",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            cast_to=typing.List[models.AuditLog],
+            request_options=request_options or default_request_options(),
+        )
+
 
 class AsyncAuditClient:
     def __init__(self, *, base_client: AsyncBaseClient):
@@ -187,3 +259,81 @@ class AsyncAuditClient:
             cast_to=typing.List[models.AuditLog],
             request_options=request_options or default_request_options(),
         )
+
+    def aiter_list(
+        self,
+        *,
+        account_id: str,
+        log_type: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        per_page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        query: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        max_concurrency: int = 1,
+        ordered: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[models.AuditLog]:
+        """
+        GET /accounts/{account_id}/audit
+
+        Args:
+            log_type: str
+            per_page: int
+            query: str
+            account_id: str
+            max_concurrency: Maximum number of pages requested in parallel once the last page is known
+            ordered: Whether to yield pages in page order when requesting them in parallel
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the items of every page, following the `Link` header
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async for item in client.accounts.audit.aiter_list(account_id="string"):
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(log_type, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "log_type",
+                to_encodable(item=log_type, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(per_page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "per_page",
+                to_encodable(item=per_page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(query, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "query",
+                to_encodable(item=query, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.paginate(
+            method="GET",
+            path=f"/accounts/{account_id}/audit",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            cast_to=typing.List[models.AuditLog],
+            request_options=request_options or default_request_options(),
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
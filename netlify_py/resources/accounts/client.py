@@ -1,3 +1,4 @@
+import functools
 import typing
 import typing_extensions
 
@@ -9,21 +10,38 @@ from netlify_py.core import (
     to_encodable,
     type_utils,
 )
-from netlify_py.resources.accounts.account_types import (
-    AccountTypesClient,
-    AsyncAccountTypesClient,
-)
-from netlify_py.resources.accounts.audit import AsyncAuditClient, AuditClient
-from netlify_py.resources.accounts.env_vars import AsyncEnvVarsClient, EnvVarsClient
 from netlify_py.types import models, params
 
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.accounts.account_types import (
+        AccountTypesClient,
+        AsyncAccountTypesClient,
+    )
+    from netlify_py.resources.accounts.audit import AsyncAuditClient, AuditClient
+    from netlify_py.resources.accounts.env_vars import AsyncEnvVarsClient, EnvVarsClient
+
 
 class AccountsClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.env_vars = EnvVarsClient(base_client=self._base_client)
-        self.account_types = AccountTypesClient(base_client=self._base_client)
-        self.audit = AuditClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def env_vars(self) -> "EnvVarsClient":
+        from netlify_py.resources.accounts.env_vars import EnvVarsClient
+
+        return EnvVarsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def account_types(self) -> "AccountTypesClient":
+        from netlify_py.resources.accounts.account_types import AccountTypesClient
+
+        return AccountTypesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def audit(self) -> "AuditClient":
+        from netlify_py.resources.accounts.audit import AuditClient
+
+        return AuditClient(base_client=self._base_client)
 
     def cancel(
         self,
@@ -257,9 +275,24 @@ class AccountsClient:
 class AsyncAccountsClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.env_vars = AsyncEnvVarsClient(base_client=self._base_client)
-        self.account_types = AsyncAccountTypesClient(base_client=self._base_client)
-        self.audit = AsyncAuditClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def env_vars(self) -> "AsyncEnvVarsClient":
+        from netlify_py.resources.accounts.env_vars import AsyncEnvVarsClient
+
+        return AsyncEnvVarsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def account_types(self) -> "AsyncAccountTypesClient":
+        from netlify_py.resources.accounts.account_types import AsyncAccountTypesClient
+
+        return AsyncAccountTypesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def audit(self) -> "AsyncAuditClient":
+        from netlify_py.resources.accounts.audit import AsyncAuditClient
+
+        return AsyncAuditClient(base_client=self._base_client)
 
     async def cancel(
         self,
@@ -1,17 +1,34 @@
+import functools
+import typing
+
 from netlify_py.core import AsyncBaseClient, SyncBaseClient
-from netlify_py.resources.billing.payment_methods import (
-    AsyncPaymentMethodsClient,
-    PaymentMethodsClient,
-)
+
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.billing.payment_methods import (
+        AsyncPaymentMethodsClient,
+        PaymentMethodsClient,
+    )
 
 
 class BillingClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.payment_methods = PaymentMethodsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def payment_methods(self) -> "PaymentMethodsClient":
+        from netlify_py.resources.billing.payment_methods import PaymentMethodsClient
+
+        return PaymentMethodsClient(base_client=self._base_client)
 
 
 class AsyncBillingClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.payment_methods = AsyncPaymentMethodsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def payment_methods(self) -> "AsyncPaymentMethodsClient":
+        from netlify_py.resources.billing.payment_methods import (
+            AsyncPaymentMethodsClient,
+        )
+
+        return AsyncPaymentMethodsClient(base_client=self._base_client)
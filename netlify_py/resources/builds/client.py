@@ -1,3 +1,4 @@
+import functools
 import typing
 
 from netlify_py.core import (
@@ -6,18 +7,35 @@ from netlify_py.core import (
     SyncBaseClient,
     default_request_options,
 )
-from netlify_py.resources.builds.log import AsyncLogClient, LogClient
-from netlify_py.resources.builds.start import AsyncStartClient, StartClient
-from netlify_py.resources.builds.status import AsyncStatusClient, StatusClient
 from netlify_py.types import models
 
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.builds.log import AsyncLogClient, LogClient
+    from netlify_py.resources.builds.start import AsyncStartClient, StartClient
+    from netlify_py.resources.builds.status import AsyncStatusClient, StatusClient
+
 
 class BuildsClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.status = StatusClient(base_client=self._base_client)
-        self.log = LogClient(base_client=self._base_client)
-        self.start = StartClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def status(self) -> "StatusClient":
+        from netlify_py.resources.builds.status import StatusClient
+
+        return StatusClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def log(self) -> "LogClient":
+        from netlify_py.resources.builds.log import LogClient
+
+        return LogClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def start(self) -> "StartClient":
+        from netlify_py.resources.builds.start import StartClient
+
+        return StartClient(base_client=self._base_client)
 
     def get(
         self, *, build_id: str, request_options: typing.Optional[RequestOptions] = None
@@ -53,9 +71,24 @@ class BuildsClient:
 class AsyncBuildsClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.status = AsyncStatusClient(base_client=self._base_client)
-        self.log = AsyncLogClient(base_client=self._base_client)
-        self.start = AsyncStartClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def status(self) -> "AsyncStatusClient":
+        from netlify_py.resources.builds.status import AsyncStatusClient
+
+        return AsyncStatusClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def log(self) -> "AsyncLogClient":
+        from netlify_py.resources.builds.log import AsyncLogClient
+
+        return AsyncLogClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def start(self) -> "AsyncStartClient":
+        from netlify_py.resources.builds.start import AsyncStartClient
+
+        return AsyncStartClient(base_client=self._base_client)
 
     async def get(
         self, *, build_id: str, request_options: typing.Optional[RequestOptions] = None
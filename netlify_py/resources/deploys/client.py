@@ -1,3 +1,4 @@
+import functools
 import typing
 
 from netlify_py.core import (
@@ -6,16 +7,31 @@ from netlify_py.core import (
     SyncBaseClient,
     default_request_options,
 )
-from netlify_py.resources.deploys.files import AsyncFilesClient, FilesClient
-from netlify_py.resources.deploys.functions import AsyncFunctionsClient, FunctionsClient
 from netlify_py.types import models
 
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.deploys.files import AsyncFilesClient, FilesClient
+    from netlify_py.resources.deploys.functions import (
+        AsyncFunctionsClient,
+        FunctionsClient,
+    )
+
 
 class DeploysClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.files = FilesClient(base_client=self._base_client)
-        self.functions = FunctionsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def files(self) -> "FilesClient":
+        from netlify_py.resources.deploys.files import FilesClient
+
+        return FilesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def functions(self) -> "FunctionsClient":
+        from netlify_py.resources.deploys.functions import FunctionsClient
+
+        return FunctionsClient(base_client=self._base_client)
 
     def delete(
         self, *, deploy_id: str, request_options: typing.Optional[RequestOptions] = None
@@ -171,8 +187,18 @@ class DeploysClient:
 class AsyncDeploysClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.files = AsyncFilesClient(base_client=self._base_client)
-        self.functions = AsyncFunctionsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def files(self) -> "AsyncFilesClient":
+        from netlify_py.resources.deploys.files import AsyncFilesClient
+
+        return AsyncFilesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def functions(self) -> "AsyncFunctionsClient":
+        from netlify_py.resources.deploys.functions import AsyncFunctionsClient
+
+        return AsyncFunctionsClient(base_client=self._base_client)
 
     async def delete(
         self, *, deploy_id: str, request_options: typing.Optional[RequestOptions] = None
@@ -9,6 +9,7 @@ from netlify_py.core import (
     default_request_options,
     encode_query_param,
     to_content,
+    to_content_size,
     to_encodable,
     type_utils,
 )
@@ -54,6 +55,8 @@ class FilesClient:
         )
         ```
         """
+        if isinstance(size, type_utils.NotGiven):
+            size = to_content_size(file=data)
         _query: QueryParams = {}
         if not isinstance(size, type_utils.NotGiven):
             encode_query_param(
@@ -116,6 +119,8 @@ class AsyncFilesClient:
         )
         ```
         """
+        if isinstance(size, type_utils.NotGiven):
+            size = to_content_size(file=data)
         _query: QueryParams = {}
         if not isinstance(size, type_utils.NotGiven):
             encode_query_param(
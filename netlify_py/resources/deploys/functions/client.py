@@ -9,6 +9,7 @@ from netlify_py.core import (
     default_request_options,
     encode_query_param,
     to_content,
+    to_content_size,
     to_encodable,
     type_utils,
 )
@@ -66,6 +67,8 @@ class FunctionsClient:
         )
         ```
         """
+        if isinstance(size, type_utils.NotGiven):
+            size = to_content_size(file=data)
         _query: QueryParams = {}
         if not isinstance(invocation_mode, type_utils.NotGiven):
             encode_query_param(
@@ -164,6 +167,8 @@ class AsyncFunctionsClient:
         )
         ```
         """
+        if isinstance(size, type_utils.NotGiven):
+            size = to_content_size(file=data)
         _query: QueryParams = {}
         if not isinstance(invocation_mode, type_utils.NotGiven):
             encode_query_param(
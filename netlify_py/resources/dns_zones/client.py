@@ -1,3 +1,4 @@
+import functools
 import typing
 
 from netlify_py.core import (
@@ -10,19 +11,34 @@ from netlify_py.core import (
     to_encodable,
     type_utils,
 )
-from netlify_py.resources.dns_zones.dns_records import (
-    AsyncDnsRecordsClient,
-    DnsRecordsClient,
-)
-from netlify_py.resources.dns_zones.transfer import AsyncTransferClient, TransferClient
 from netlify_py.types import models, params
 
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.dns_zones.dns_records import (
+        AsyncDnsRecordsClient,
+        DnsRecordsClient,
+    )
+    from netlify_py.resources.dns_zones.transfer import (
+        AsyncTransferClient,
+        TransferClient,
+    )
+
 
 class DnsZonesClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.dns_records = DnsRecordsClient(base_client=self._base_client)
-        self.transfer = TransferClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def dns_records(self) -> "DnsRecordsClient":
+        from netlify_py.resources.dns_zones.dns_records import DnsRecordsClient
+
+        return DnsRecordsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def transfer(self) -> "TransferClient":
+        from netlify_py.resources.dns_zones.transfer import TransferClient
+
+        return TransferClient(base_client=self._base_client)
 
     def delete(
         self, *, zone_id: str, request_options: typing.Optional[RequestOptions] = None
@@ -181,8 +197,18 @@ class DnsZonesClient:
 class AsyncDnsZonesClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.dns_records = AsyncDnsRecordsClient(base_client=self._base_client)
-        self.transfer = AsyncTransferClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def dns_records(self) -> "AsyncDnsRecordsClient":
+        from netlify_py.resources.dns_zones.dns_records import AsyncDnsRecordsClient
+
+        return AsyncDnsRecordsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def transfer(self) -> "AsyncTransferClient":
+        from netlify_py.resources.dns_zones.transfer import AsyncTransferClient
+
+        return AsyncTransferClient(base_client=self._base_client)
 
     async def delete(
         self, *, zone_id: str, request_options: typing.Optional[RequestOptions] = None
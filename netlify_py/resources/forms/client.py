@@ -1,17 +1,32 @@
+import functools
+import typing
+
 from netlify_py.core import AsyncBaseClient, SyncBaseClient
-from netlify_py.resources.forms.submissions import (
-    AsyncSubmissionsClient,
-    SubmissionsClient,
-)
+
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.forms.submissions import (
+        AsyncSubmissionsClient,
+        SubmissionsClient,
+    )
 
 
 class FormsClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.submissions = SubmissionsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def submissions(self) -> "SubmissionsClient":
+        from netlify_py.resources.forms.submissions import SubmissionsClient
+
+        return SubmissionsClient(base_client=self._base_client)
 
 
 class AsyncFormsClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.submissions = AsyncSubmissionsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def submissions(self) -> "AsyncSubmissionsClient":
+        from netlify_py.resources.forms.submissions import AsyncSubmissionsClient
+
+        return AsyncSubmissionsClient(base_client=self._base_client)
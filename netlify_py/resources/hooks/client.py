@@ -1,3 +1,4 @@
+import functools
 import typing
 
 from netlify_py.core import (
@@ -10,14 +11,21 @@ from netlify_py.core import (
     to_encodable,
     type_utils,
 )
-from netlify_py.resources.hooks.types import AsyncTypesClient, TypesClient
 from netlify_py.types import models, params
 
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.hooks.types import AsyncTypesClient, TypesClient
+
 
 class HooksClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.types = TypesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def types(self) -> "TypesClient":
+        from netlify_py.resources.hooks.types import TypesClient
+
+        return TypesClient(base_client=self._base_client)
 
     def delete(
         self, *, hook_id: str, request_options: typing.Optional[RequestOptions] = None
@@ -319,7 +327,12 @@ class HooksClient:
 class AsyncHooksClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.types = AsyncTypesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def types(self) -> "AsyncTypesClient":
+        from netlify_py.resources.hooks.types import AsyncTypesClient
+
+        return AsyncTypesClient(base_client=self._base_client)
 
     async def delete(
         self, *, hook_id: str, request_options: typing.Optional[RequestOptions] = None
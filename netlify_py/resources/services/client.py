@@ -1,3 +1,4 @@
+import functools
 import typing
 
 from netlify_py.core import (
@@ -10,14 +11,24 @@ from netlify_py.core import (
     to_encodable,
     type_utils,
 )
-from netlify_py.resources.services.manifest import AsyncManifestClient, ManifestClient
 from netlify_py.types import models
 
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.services.manifest import (
+        AsyncManifestClient,
+        ManifestClient,
+    )
+
 
 class ServicesClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.manifest = ManifestClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def manifest(self) -> "ManifestClient":
+        from netlify_py.resources.services.manifest import ManifestClient
+
+        return ManifestClient(base_client=self._base_client)
 
     def list(
         self,
@@ -101,7 +112,12 @@ class ServicesClient:
 class AsyncServicesClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.manifest = AsyncManifestClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def manifest(self) -> "AsyncManifestClient":
+        from netlify_py.resources.services.manifest import AsyncManifestClient
+
+        return AsyncManifestClient(base_client=self._base_client)
 
     async def list(
         self,
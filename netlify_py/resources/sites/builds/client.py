@@ -76,6 +76,54 @@ class BuildsClient:
             request_options=request_options or default_request_options(),
         )
 
+    def iter_list(
+        self,
+        *,
+        site_id: str,
+        per_page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[models.Build]:
+        """
+        GET /sites/{site_id}/builds
+
+        Args:
+            per_page: int
+            site_id: str
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the items of every page, following the `Link` header
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        for item in client.sites.builds.iter_list(site_id="string"):
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(per_page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "per_page",
+                to_encodable(item=per_page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.paginate(
+            method="GET",
+            path=f"/sites/{site_id}/builds",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            cast_to=typing.List[models.Build],
+            request_options=request_options or default_request_options(),
+        )
+
     def create(
         self,
         *,
@@ -186,6 +234,60 @@ class AsyncBuildsClient:
             request_options=request_options or default_request_options(),
         )
 
+    def aiter_list(
+        self,
+        *,
+        site_id: str,
+        per_page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        max_concurrency: int = 1,
+        ordered: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[models.Build]:
+        """
+        GET /sites/{site_id}/builds
+
+        Args:
+            per_page: int
+            site_id: str
+            max_concurrency: Maximum number of pages requested in parallel once the last page is known
+            ordered: Whether to yield pages in page order when requesting them in parallel
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the items of every page, following the `Link` header
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async for item in client.sites.builds.aiter_list(site_id="string"):
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(per_page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "per_page",
+                to_encodable(item=per_page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.paginate(
+            method="GET",
+            path=f"/sites/{site_id}/builds",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            cast_to=typing.List[models.Build],
+            request_options=request_options or default_request_options(),
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+
     async def create(
         self,
         *,
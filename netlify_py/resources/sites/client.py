@@ -1,3 +1,4 @@
+import functools
 import typing
 import typing_extensions
 
@@ -11,78 +12,188 @@ from netlify_py.core import (
     to_encodable,
     type_utils,
 )
-from netlify_py.resources.sites.assets import AssetsClient, AsyncAssetsClient
-from netlify_py.resources.sites.build_hooks import (
-    AsyncBuildHooksClient,
-    BuildHooksClient,
-)
-from netlify_py.resources.sites.builds import AsyncBuildsClient, BuildsClient
-from netlify_py.resources.sites.deployed_branches import (
-    AsyncDeployedBranchesClient,
-    DeployedBranchesClient,
-)
-from netlify_py.resources.sites.deploys import AsyncDeploysClient, DeploysClient
-from netlify_py.resources.sites.dev_server_hooks import (
-    AsyncDevServerHooksClient,
-    DevServerHooksClient,
-)
-from netlify_py.resources.sites.dev_servers import (
-    AsyncDevServersClient,
-    DevServersClient,
-)
-from netlify_py.resources.sites.dns import AsyncDnsClient, DnsClient
-from netlify_py.resources.sites.env import AsyncEnvClient, EnvClient
-from netlify_py.resources.sites.files import AsyncFilesClient, FilesClient
-from netlify_py.resources.sites.forms import AsyncFormsClient, FormsClient
-from netlify_py.resources.sites.functions import AsyncFunctionsClient, FunctionsClient
-from netlify_py.resources.sites.metadata import AsyncMetadataClient, MetadataClient
-from netlify_py.resources.sites.rollback import AsyncRollbackClient, RollbackClient
-from netlify_py.resources.sites.service_instances import (
-    AsyncServiceInstancesClient,
-    ServiceInstancesClient,
-)
-from netlify_py.resources.sites.services import AsyncServicesClient, ServicesClient
-from netlify_py.resources.sites.snippets import AsyncSnippetsClient, SnippetsClient
-from netlify_py.resources.sites.ssl import AsyncSslClient, SslClient
-from netlify_py.resources.sites.submissions import (
-    AsyncSubmissionsClient,
-    SubmissionsClient,
-)
-from netlify_py.resources.sites.traffic_splits import (
-    AsyncTrafficSplitsClient,
-    TrafficSplitsClient,
-)
-from netlify_py.resources.sites.unlink_repo import (
-    AsyncUnlinkRepoClient,
-    UnlinkRepoClient,
-)
 from netlify_py.types import models, params
 
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.sites.assets import AssetsClient, AsyncAssetsClient
+    from netlify_py.resources.sites.build_hooks import (
+        AsyncBuildHooksClient,
+        BuildHooksClient,
+    )
+    from netlify_py.resources.sites.builds import AsyncBuildsClient, BuildsClient
+    from netlify_py.resources.sites.deployed_branches import (
+        AsyncDeployedBranchesClient,
+        DeployedBranchesClient,
+    )
+    from netlify_py.resources.sites.deploys import AsyncDeploysClient, DeploysClient
+    from netlify_py.resources.sites.dev_server_hooks import (
+        AsyncDevServerHooksClient,
+        DevServerHooksClient,
+    )
+    from netlify_py.resources.sites.dev_servers import (
+        AsyncDevServersClient,
+        DevServersClient,
+    )
+    from netlify_py.resources.sites.dns import AsyncDnsClient, DnsClient
+    from netlify_py.resources.sites.env import AsyncEnvClient, EnvClient
+    from netlify_py.resources.sites.files import AsyncFilesClient, FilesClient
+    from netlify_py.resources.sites.forms import AsyncFormsClient, FormsClient
+    from netlify_py.resources.sites.functions import (
+        AsyncFunctionsClient,
+        FunctionsClient,
+    )
+    from netlify_py.resources.sites.metadata import AsyncMetadataClient, MetadataClient
+    from netlify_py.resources.sites.rollback import AsyncRollbackClient, RollbackClient
+    from netlify_py.resources.sites.service_instances import (
+        AsyncServiceInstancesClient,
+        ServiceInstancesClient,
+    )
+    from netlify_py.resources.sites.services import AsyncServicesClient, ServicesClient
+    from netlify_py.resources.sites.snippets import AsyncSnippetsClient, SnippetsClient
+    from netlify_py.resources.sites.ssl import AsyncSslClient, SslClient
+    from netlify_py.resources.sites.submissions import (
+        AsyncSubmissionsClient,
+        SubmissionsClient,
+    )
+    from netlify_py.resources.sites.traffic_splits import (
+        AsyncTrafficSplitsClient,
+        TrafficSplitsClient,
+    )
+    from netlify_py.resources.sites.unlink_repo import (
+        AsyncUnlinkRepoClient,
+        UnlinkRepoClient,
+    )
+
 
 class SitesClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.assets = AssetsClient(base_client=self._base_client)
-        self.build_hooks = BuildHooksClient(base_client=self._base_client)
-        self.deploys = DeploysClient(base_client=self._base_client)
-        self.dev_server_hooks = DevServerHooksClient(base_client=self._base_client)
-        self.dev_servers = DevServersClient(base_client=self._base_client)
-        self.forms = FormsClient(base_client=self._base_client)
-        self.services = ServicesClient(base_client=self._base_client)
-        self.snippets = SnippetsClient(base_client=self._base_client)
-        self.env = EnvClient(base_client=self._base_client)
-        self.builds = BuildsClient(base_client=self._base_client)
-        self.deployed_branches = DeployedBranchesClient(base_client=self._base_client)
-        self.dns = DnsClient(base_client=self._base_client)
-        self.files = FilesClient(base_client=self._base_client)
-        self.functions = FunctionsClient(base_client=self._base_client)
-        self.metadata = MetadataClient(base_client=self._base_client)
-        self.service_instances = ServiceInstancesClient(base_client=self._base_client)
-        self.ssl = SslClient(base_client=self._base_client)
-        self.submissions = SubmissionsClient(base_client=self._base_client)
-        self.traffic_splits = TrafficSplitsClient(base_client=self._base_client)
-        self.rollback = RollbackClient(base_client=self._base_client)
-        self.unlink_repo = UnlinkRepoClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def assets(self) -> "AssetsClient":
+        from netlify_py.resources.sites.assets import AssetsClient
+
+        return AssetsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def build_hooks(self) -> "BuildHooksClient":
+        from netlify_py.resources.sites.build_hooks import BuildHooksClient
+
+        return BuildHooksClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def deploys(self) -> "DeploysClient":
+        from netlify_py.resources.sites.deploys import DeploysClient
+
+        return DeploysClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def dev_server_hooks(self) -> "DevServerHooksClient":
+        from netlify_py.resources.sites.dev_server_hooks import DevServerHooksClient
+
+        return DevServerHooksClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def dev_servers(self) -> "DevServersClient":
+        from netlify_py.resources.sites.dev_servers import DevServersClient
+
+        return DevServersClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def forms(self) -> "FormsClient":
+        from netlify_py.resources.sites.forms import FormsClient
+
+        return FormsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def services(self) -> "ServicesClient":
+        from netlify_py.resources.sites.services import ServicesClient
+
+        return ServicesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def snippets(self) -> "SnippetsClient":
+        from netlify_py.resources.sites.snippets import SnippetsClient
+
+        return SnippetsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def env(self) -> "EnvClient":
+        from netlify_py.resources.sites.env import EnvClient
+
+        return EnvClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def builds(self) -> "BuildsClient":
+        from netlify_py.resources.sites.builds import BuildsClient
+
+        return BuildsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def deployed_branches(self) -> "DeployedBranchesClient":
+        from netlify_py.resources.sites.deployed_branches import DeployedBranchesClient
+
+        return DeployedBranchesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def dns(self) -> "DnsClient":
+        from netlify_py.resources.sites.dns import DnsClient
+
+        return DnsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def files(self) -> "FilesClient":
+        from netlify_py.resources.sites.files import FilesClient
+
+        return FilesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def functions(self) -> "FunctionsClient":
+        from netlify_py.resources.sites.functions import FunctionsClient
+
+        return FunctionsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def metadata(self) -> "MetadataClient":
+        from netlify_py.resources.sites.metadata import MetadataClient
+
+        return MetadataClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def service_instances(self) -> "ServiceInstancesClient":
+        from netlify_py.resources.sites.service_instances import ServiceInstancesClient
+
+        return ServiceInstancesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ssl(self) -> "SslClient":
+        from netlify_py.resources.sites.ssl import SslClient
+
+        return SslClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def submissions(self) -> "SubmissionsClient":
+        from netlify_py.resources.sites.submissions import SubmissionsClient
+
+        return SubmissionsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def traffic_splits(self) -> "TrafficSplitsClient":
+        from netlify_py.resources.sites.traffic_splits import TrafficSplitsClient
+
+        return TrafficSplitsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def rollback(self) -> "RollbackClient":
+        from netlify_py.resources.sites.rollback import RollbackClient
+
+        return RollbackClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def unlink_repo(self) -> "UnlinkRepoClient":
+        from netlify_py.resources.sites.unlink_repo import UnlinkRepoClient
+
+        return UnlinkRepoClient(base_client=self._base_client)
 
     def delete(
         self, *, site_id: str, request_options: typing.Optional[RequestOptions] = None
@@ -201,6 +312,82 @@ class SitesClient:
             request_options=request_options or default_request_options(),
         )
 
+    def iter_list(
+        self,
+        *,
+        filter: typing.Union[
+            typing.Optional[typing_extensions.Literal["all", "guest", "owner"]],
+            type_utils.NotGiven,
+        ] = type_utils.NOT_GIVEN,
+        name: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        per_page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[models.Site]:
+        """
+        **Note:** Environment variable keys and values have moved from `build_settings.env` and `repo.env` to a new endpoint. Please use [getEnvVars](#tag/environmentVariables/operation/getEnvVars) to retrieve site environment variables.
+
+        GET /sites
+
+        Args:
+            filter: typing_extensions.Literal["all", "guest", "owner"]
+            name: str
+            per_page: int
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the items of every page, following the `Link` header
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        for item in client.sites.iter_list():
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(filter, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "filter",
+                to_encodable(
+                    item=filter,
+                    dump_with=typing_extensions.Literal["all", "guest", "owner"],
+                ),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(name, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "name",
+                to_encodable(item=name, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(per_page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "per_page",
+                to_encodable(item=per_page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.paginate(
+            method="GET",
+            path="/sites",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            cast_to=typing.List[models.Site],
+            request_options=request_options or default_request_options(),
+        )
+
     def get(
         self, *, site_id: str, request_options: typing.Optional[RequestOptions] = None
     ) -> models.Site:
@@ -306,6 +493,68 @@ class SitesClient:
             request_options=request_options or default_request_options(),
         )
 
+    def iter_list_for_account(
+        self,
+        *,
+        account_slug: str,
+        name: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        per_page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[models.Site]:
+        """
+        **Note:** Environment variable keys and values have moved from `build_settings.env` and `repo.env` to a new endpoint. Please use [getEnvVars](#tag/environmentVariables/operation/getEnvVars) to retrieve site environment variables.
+
+        GET /{account_slug}/sites
+
+        Args:
+            name: str
+            per_page: int
+            account_slug: str
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the items of every page, following the `Link` header
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        for item in client.sites.iter_list_for_account(account_slug="string"):
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(name, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "name",
+                to_encodable(item=name, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(per_page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "per_page",
+                to_encodable(item=per_page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.paginate(
+            method="GET",
+            path=f"/{account_slug}/sites",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            cast_to=typing.List[models.Site],
+            request_options=request_options or default_request_options(),
+        )
+
     def patch(
         self,
         *,
@@ -1014,31 +1263,138 @@ class SitesClient:
 class AsyncSitesClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.assets = AsyncAssetsClient(base_client=self._base_client)
-        self.build_hooks = AsyncBuildHooksClient(base_client=self._base_client)
-        self.deploys = AsyncDeploysClient(base_client=self._base_client)
-        self.dev_server_hooks = AsyncDevServerHooksClient(base_client=self._base_client)
-        self.dev_servers = AsyncDevServersClient(base_client=self._base_client)
-        self.forms = AsyncFormsClient(base_client=self._base_client)
-        self.services = AsyncServicesClient(base_client=self._base_client)
-        self.snippets = AsyncSnippetsClient(base_client=self._base_client)
-        self.env = AsyncEnvClient(base_client=self._base_client)
-        self.builds = AsyncBuildsClient(base_client=self._base_client)
-        self.deployed_branches = AsyncDeployedBranchesClient(
-            base_client=self._base_client
+
+    @functools.cached_property
+    def assets(self) -> "AsyncAssetsClient":
+        from netlify_py.resources.sites.assets import AsyncAssetsClient
+
+        return AsyncAssetsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def build_hooks(self) -> "AsyncBuildHooksClient":
+        from netlify_py.resources.sites.build_hooks import AsyncBuildHooksClient
+
+        return AsyncBuildHooksClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def deploys(self) -> "AsyncDeploysClient":
+        from netlify_py.resources.sites.deploys import AsyncDeploysClient
+
+        return AsyncDeploysClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def dev_server_hooks(self) -> "AsyncDevServerHooksClient":
+        from netlify_py.resources.sites.dev_server_hooks import (
+            AsyncDevServerHooksClient,
+        )
+
+        return AsyncDevServerHooksClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def dev_servers(self) -> "AsyncDevServersClient":
+        from netlify_py.resources.sites.dev_servers import AsyncDevServersClient
+
+        return AsyncDevServersClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def forms(self) -> "AsyncFormsClient":
+        from netlify_py.resources.sites.forms import AsyncFormsClient
+
+        return AsyncFormsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def services(self) -> "AsyncServicesClient":
+        from netlify_py.resources.sites.services import AsyncServicesClient
+
+        return AsyncServicesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def snippets(self) -> "AsyncSnippetsClient":
+        from netlify_py.resources.sites.snippets import AsyncSnippetsClient
+
+        return AsyncSnippetsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def env(self) -> "AsyncEnvClient":
+        from netlify_py.resources.sites.env import AsyncEnvClient
+
+        return AsyncEnvClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def builds(self) -> "AsyncBuildsClient":
+        from netlify_py.resources.sites.builds import AsyncBuildsClient
+
+        return AsyncBuildsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def deployed_branches(self) -> "AsyncDeployedBranchesClient":
+        from netlify_py.resources.sites.deployed_branches import (
+            AsyncDeployedBranchesClient,
         )
-        self.dns = AsyncDnsClient(base_client=self._base_client)
-        self.files = AsyncFilesClient(base_client=self._base_client)
-        self.functions = AsyncFunctionsClient(base_client=self._base_client)
-        self.metadata = AsyncMetadataClient(base_client=self._base_client)
-        self.service_instances = AsyncServiceInstancesClient(
-            base_client=self._base_client
+
+        return AsyncDeployedBranchesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def dns(self) -> "AsyncDnsClient":
+        from netlify_py.resources.sites.dns import AsyncDnsClient
+
+        return AsyncDnsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def files(self) -> "AsyncFilesClient":
+        from netlify_py.resources.sites.files import AsyncFilesClient
+
+        return AsyncFilesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def functions(self) -> "AsyncFunctionsClient":
+        from netlify_py.resources.sites.functions import AsyncFunctionsClient
+
+        return AsyncFunctionsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def metadata(self) -> "AsyncMetadataClient":
+        from netlify_py.resources.sites.metadata import AsyncMetadataClient
+
+        return AsyncMetadataClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def service_instances(self) -> "AsyncServiceInstancesClient":
+        from netlify_py.resources.sites.service_instances import (
+            AsyncServiceInstancesClient,
         )
-        self.ssl = AsyncSslClient(base_client=self._base_client)
-        self.submissions = AsyncSubmissionsClient(base_client=self._base_client)
-        self.traffic_splits = AsyncTrafficSplitsClient(base_client=self._base_client)
-        self.rollback = AsyncRollbackClient(base_client=self._base_client)
-        self.unlink_repo = AsyncUnlinkRepoClient(base_client=self._base_client)
+
+        return AsyncServiceInstancesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ssl(self) -> "AsyncSslClient":
+        from netlify_py.resources.sites.ssl import AsyncSslClient
+
+        return AsyncSslClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def submissions(self) -> "AsyncSubmissionsClient":
+        from netlify_py.resources.sites.submissions import AsyncSubmissionsClient
+
+        return AsyncSubmissionsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def traffic_splits(self) -> "AsyncTrafficSplitsClient":
+        from netlify_py.resources.sites.traffic_splits import AsyncTrafficSplitsClient
+
+        return AsyncTrafficSplitsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def rollback(self) -> "AsyncRollbackClient":
+        from netlify_py.resources.sites.rollback import AsyncRollbackClient
+
+        return AsyncRollbackClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def unlink_repo(self) -> "AsyncUnlinkRepoClient":
+        from netlify_py.resources.sites.unlink_repo import AsyncUnlinkRepoClient
+
+        return AsyncUnlinkRepoClient(base_client=self._base_client)
 
     async def delete(
         self, *, site_id: str, request_options: typing.Optional[RequestOptions] = None
@@ -1157,6 +1513,88 @@ class AsyncSitesClient:
             request_options=request_options or default_request_options(),
         )
 
+    def aiter_list(
+        self,
+        *,
+        filter: typing.Union[
+            typing.Optional[typing_extensions.Literal["all", "guest", "owner"]],
+            type_utils.NotGiven,
+        ] = type_utils.NOT_GIVEN,
+        name: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        per_page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        max_concurrency: int = 1,
+        ordered: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[models.Site]:
+        """
+        **Note:** Environment variable keys and values have moved from `build_settings.env` and `repo.env` to a new endpoint. Please use [getEnvVars](#tag/environmentVariables/operation/getEnvVars) to retrieve site environment variables.
+
+        GET /sites
+
+        Args:
+            filter: typing_extensions.Literal["all", "guest", "owner"]
+            name: str
+            per_page: int
+            max_concurrency: Maximum number of pages requested in parallel once the last page is known
+            ordered: Whether to yield pages in page order when requesting them in parallel
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the items of every page, following the `Link` header
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async for item in client.sites.aiter_list():
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(filter, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "filter",
+                to_encodable(
+                    item=filter,
+                    dump_with=typing_extensions.Literal["all", "guest", "owner"],
+                ),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(name, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "name",
+                to_encodable(item=name, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(per_page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "per_page",
+                to_encodable(item=per_page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.paginate(
+            method="GET",
+            path="/sites",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            cast_to=typing.List[models.Site],
+            request_options=request_options or default_request_options(),
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+
     async def get(
         self, *, site_id: str, request_options: typing.Optional[RequestOptions] = None
     ) -> models.Site:
@@ -1262,6 +1700,74 @@ class AsyncSitesClient:
             request_options=request_options or default_request_options(),
         )
 
+    def aiter_list_for_account(
+        self,
+        *,
+        account_slug: str,
+        name: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        per_page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        max_concurrency: int = 1,
+        ordered: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[models.Site]:
+        """
+        **Note:** Environment variable keys and values have moved from `build_settings.env` and `repo.env` to a new endpoint. Please use [getEnvVars](#tag/environmentVariables/operation/getEnvVars) to retrieve site environment variables.
+
+        GET /{account_slug}/sites
+
+        Args:
+            name: str
+            per_page: int
+            account_slug: str
+            max_concurrency: Maximum number of pages requested in parallel once the last page is known
+            ordered: Whether to yield pages in page order when requesting them in parallel
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the items of every page, following the `Link` header
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async for item in client.sites.aiter_list_for_account(account_slug="string"):
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(name, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "name",
+                to_encodable(item=name, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(per_page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "per_page",
+                to_encodable(item=per_page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.paginate(
+            method="GET",
+            path=f"/{account_slug}/sites",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            cast_to=typing.List[models.Site],
+            request_options=request_options or default_request_options(),
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+
     async def patch(
         self,
         *,
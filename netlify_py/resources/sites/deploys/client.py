@@ -1,8 +1,11 @@
+import functools
 import typing
 import typing_extensions
 
 from netlify_py.core import (
     AsyncBaseClient,
+    AsyncDeployBody,
+    DeployBody,
     QueryParams,
     RequestOptions,
     SyncBaseClient,
@@ -11,14 +14,24 @@ from netlify_py.core import (
     to_encodable,
     type_utils,
 )
-from netlify_py.resources.sites.deploys.restore import AsyncRestoreClient, RestoreClient
 from netlify_py.types import models, params
 
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.sites.deploys.restore import (
+        AsyncRestoreClient,
+        RestoreClient,
+    )
+
 
 class DeploysClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.restore = RestoreClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def restore(self) -> "RestoreClient":
+        from netlify_py.resources.sites.deploys.restore import RestoreClient
+
+        return RestoreClient(base_client=self._base_client)
 
     def delete(
         self,
@@ -212,6 +225,152 @@ class DeploysClient:
             request_options=request_options or default_request_options(),
         )
 
+    def iter_list(
+        self,
+        *,
+        site_id: str,
+        branch: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        deploy_previews: typing.Union[
+            typing.Optional[bool], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        latest_published: typing.Union[
+            typing.Optional[bool], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        per_page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        production: typing.Union[
+            typing.Optional[bool], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        state: typing.Union[
+            typing.Optional[
+                typing_extensions.Literal[
+                    "accepted",
+                    "building",
+                    "enqueued",
+                    "error",
+                    "new",
+                    "pending_review",
+                    "prepared",
+                    "preparing",
+                    "processed",
+                    "processing",
+                    "ready",
+                    "rejected",
+                    "retrying",
+                    "uploaded",
+                    "uploading",
+                ]
+            ],
+            type_utils.NotGiven,
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[models.Deploy]:
+        """
+        GET /sites/{site_id}/deploys
+
+        Args:
+            branch: str
+            deploy-previews: bool
+            latest-published: bool
+            per_page: int
+            production: bool
+            state: typing_extensions.Literal["accepted", "building", "enqueued", "error", "new", "pending_review", "prepared", "preparing", "processed", "processing", "ready", "rejected", "retrying", "uploaded", "uploading"]
+            site_id: str
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the items of every page, following the `Link` header
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        for item in client.sites.deploys.iter_list(site_id="string"):
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(branch, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "branch",
+                to_encodable(item=branch, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(deploy_previews, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "deploy-previews",
+                to_encodable(item=deploy_previews, dump_with=bool),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(latest_published, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "latest-published",
+                to_encodable(item=latest_published, dump_with=bool),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(per_page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "per_page",
+                to_encodable(item=per_page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(production, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "production",
+                to_encodable(item=production, dump_with=bool),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(state, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "state",
+                to_encodable(
+                    item=state,
+                    dump_with=typing_extensions.Literal[
+                        "accepted",
+                        "building",
+                        "enqueued",
+                        "error",
+                        "new",
+                        "pending_review",
+                        "prepared",
+                        "preparing",
+                        "processed",
+                        "processing",
+                        "ready",
+                        "rejected",
+                        "retrying",
+                        "uploaded",
+                        "uploading",
+                    ],
+                ),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.paginate(
+            method="GET",
+            path=f"/sites/{site_id}/deploys",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            cast_to=typing.List[models.Deploy],
+            request_options=request_options or default_request_options(),
+        )
+
     def get(
         self,
         *,
@@ -443,6 +602,61 @@ class DeploysClient:
             request_options=request_options or default_request_options(),
         )
 
+    def create_streamed(
+        self,
+        *,
+        site_id: str,
+        body: DeployBody,
+        title: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> models.Deploy:
+        """
+        POST /sites/{site_id}/deploys
+
+        Creates a deploy from a streamed body: the file and function digests
+        are encoded chunk by chunk while the request is sent, optionally gzip
+        compressed, without a model validation round trip.
+
+        Args:
+            body: DeployBody
+            title: str
+            site_id: str
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            OK
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        client.sites.deploys.create_streamed(site_id="string", body=DeployBody(files={"/index.html": "string"}))
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(title, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "title",
+                to_encodable(item=title, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.request(
+            method="POST",
+            path=f"/sites/{site_id}/deploys",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            headers=body.headers,
+            content=body,
+            cast_to=models.Deploy,
+            request_options=request_options or default_request_options(),
+        )
+
     def update(
         self,
         *,
@@ -533,7 +747,12 @@ class DeploysClient:
 class AsyncDeploysClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.restore = AsyncRestoreClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def restore(self) -> "AsyncRestoreClient":
+        from netlify_py.resources.sites.deploys.restore import AsyncRestoreClient
+
+        return AsyncRestoreClient(base_client=self._base_client)
 
     async def delete(
         self,
@@ -727,6 +946,158 @@ class AsyncDeploysClient:
             request_options=request_options or default_request_options(),
         )
 
+    def aiter_list(
+        self,
+        *,
+        site_id: str,
+        branch: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        deploy_previews: typing.Union[
+            typing.Optional[bool], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        latest_published: typing.Union[
+            typing.Optional[bool], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        per_page: typing.Union[
+            typing.Optional[int], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        production: typing.Union[
+            typing.Optional[bool], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        state: typing.Union[
+            typing.Optional[
+                typing_extensions.Literal[
+                    "accepted",
+                    "building",
+                    "enqueued",
+                    "error",
+                    "new",
+                    "pending_review",
+                    "prepared",
+                    "preparing",
+                    "processed",
+                    "processing",
+                    "ready",
+                    "rejected",
+                    "retrying",
+                    "uploaded",
+                    "uploading",
+                ]
+            ],
+            type_utils.NotGiven,
+        ] = type_utils.NOT_GIVEN,
+        max_concurrency: int = 1,
+        ordered: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[models.Deploy]:
+        """
+        GET /sites/{site_id}/deploys
+
+        Args:
+            branch: str
+            deploy-previews: bool
+            latest-published: bool
+            per_page: int
+            production: bool
+            state: typing_extensions.Literal["accepted", "building", "enqueued", "error", "new", "pending_review", "prepared", "preparing", "processed", "processing", "ready", "rejected", "retrying", "uploaded", "uploading"]
+            site_id: str
+            max_concurrency: Maximum number of pages requested in parallel once the last page is known
+            ordered: Whether to yield pages in page order when requesting them in parallel
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the items of every page, following the `Link` header
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async for item in client.sites.deploys.aiter_list(site_id="string"):
+            ...
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(branch, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "branch",
+                to_encodable(item=branch, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(deploy_previews, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "deploy-previews",
+                to_encodable(item=deploy_previews, dump_with=bool),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(latest_published, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "latest-published",
+                to_encodable(item=latest_published, dump_with=bool),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(per_page, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "per_page",
+                to_encodable(item=per_page, dump_with=int),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(production, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "production",
+                to_encodable(item=production, dump_with=bool),
+                style="form",
+                explode=True,
+            )
+        if not isinstance(state, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "state",
+                to_encodable(
+                    item=state,
+                    dump_with=typing_extensions.Literal[
+                        "accepted",
+                        "building",
+                        "enqueued",
+                        "error",
+                        "new",
+                        "pending_review",
+                        "prepared",
+                        "preparing",
+                        "processed",
+                        "processing",
+                        "ready",
+                        "rejected",
+                        "retrying",
+                        "uploaded",
+                        "uploading",
+                    ],
+                ),
+                style="form",
+                explode=True,
+            )
+        return self._base_client.paginate(
+            method="GET",
+            path=f"/sites/{site_id}/deploys",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            cast_to=typing.List[models.Deploy],
+            request_options=request_options or default_request_options(),
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+
     async def get(
         self,
         *,
@@ -958,6 +1329,61 @@ class AsyncDeploysClient:
             request_options=request_options or default_request_options(),
         )
 
+    async def create_streamed(
+        self,
+        *,
+        site_id: str,
+        body: typing.Union[DeployBody, AsyncDeployBody],
+        title: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> models.Deploy:
+        """
+        POST /sites/{site_id}/deploys
+
+        Creates a deploy from a streamed body: the file and function digests
+        are encoded chunk by chunk while the request is sent, optionally gzip
+        compressed, without a model validation round trip.
+
+        Args:
+            body: DeployBody (or AsyncDeployBody)
+            title: str
+            site_id: str
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            OK
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        await client.sites.deploys.create_streamed(site_id="string", body=DeployBody(files={"/index.html": "string"}))
+        ```
+        """
+        _query: QueryParams = {}
+        if not isinstance(title, type_utils.NotGiven):
+            encode_query_param(
+                _query,
+                "title",
+                to_encodable(item=title, dump_with=str),
+                style="form",
+                explode=True,
+            )
+        return await self._base_client.request(
+            method="POST",
+            path=f"/sites/{site_id}/deploys",
+            auth_names=["netlifyAuth"],
+            query_params=_query,
+            headers=body.headers,
+            content=body,
+            cast_to=models.Deploy,
+            request_options=request_options or default_request_options(),
+        )
+
     async def update(
         self,
         *,
@@ -2,6 +2,8 @@ import typing
 
 from netlify_py.core import (
     AsyncBaseClient,
+    Destination,
+    Download,
     RequestOptions,
     SyncBaseClient,
     default_request_options,
@@ -43,6 +45,37 @@ class FilesClient:
             request_options=request_options or default_request_options(),
         )
 
+    def stream_list(
+        self, *, site_id: str, request_options: typing.Optional[RequestOptions] = None
+    ) -> typing.Iterator[models.File]:
+        """
+        GET /sites/{site_id}/files
+
+        Args:
+            site_id: str
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the files, each validated as it is downloaded
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        for item in client.sites.files.stream_list(site_id="string"):
+            ...
+        ```
+        """
+        return self._base_client.stream_items(
+            method="GET",
+            path=f"/sites/{site_id}/files",
+            auth_names=["netlifyAuth"],
+            cast_to=typing.List[models.File],
+            request_options=request_options or default_request_options(),
+        )
+
     def get(
         self,
         *,
@@ -78,6 +111,47 @@ class FilesClient:
             request_options=request_options or default_request_options(),
         )
 
+    def download(
+        self,
+        *,
+        file_path: str,
+        site_id: str,
+        destination: Destination,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> Download:
+        """
+        GET /sites/{site_id}/files/{file_path}
+
+        Downloads the raw content of a file to `destination`, a path or a
+        writable binary buffer, chunk by chunk. An interrupted download is
+        resumed with a range request.
+
+        Args:
+            file_path: str
+            site_id: str
+            destination: File path, or a writable binary buffer
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            The completed download
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        client.sites.files.download(file_path="string", site_id="string", destination="string")
+        ```
+        """
+        return self._base_client.download(
+            path=f"/sites/{site_id}/files/{file_path}",
+            destination=destination,
+            auth_names=["netlifyAuth"],
+            headers={"accept": "application/vnd.bitballoon.v1.raw"},
+            request_options=request_options or default_request_options(),
+        )
+
 
 class AsyncFilesClient:
     def __init__(self, *, base_client: AsyncBaseClient):
@@ -113,6 +187,37 @@ class AsyncFilesClient:
             request_options=request_options or default_request_options(),
         )
 
+    def astream_list(
+        self, *, site_id: str, request_options: typing.Optional[RequestOptions] = None
+    ) -> typing.AsyncIterator[models.File]:
+        """
+        GET /sites/{site_id}/files
+
+        Args:
+            site_id: str
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            Iterator over the files, each validated as it is downloaded
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        async for item in client.sites.files.astream_list(site_id="string"):
+            ...
+        ```
+        """
+        return self._base_client.stream_items(
+            method="GET",
+            path=f"/sites/{site_id}/files",
+            auth_names=["netlifyAuth"],
+            cast_to=typing.List[models.File],
+            request_options=request_options or default_request_options(),
+        )
+
     async def get(
         self,
         *,
@@ -147,3 +252,44 @@ class AsyncFilesClient:
             cast_to=models.File,
             request_options=request_options or default_request_options(),
         )
+
+    async def download(
+        self,
+        *,
+        file_path: str,
+        site_id: str,
+        destination: Destination,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> Download:
+        """
+        GET /sites/{site_id}/files/{file_path}
+
+        Downloads the raw content of a file to `destination`, a path or a
+        writable binary buffer, chunk by chunk. An interrupted download is
+        resumed with a range request.
+
+        Args:
+            file_path: str
+            site_id: str
+            destination: File path, or a writable binary buffer
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            The completed download
+
+        Raises:
+            ApiError: A custom exception class that provides additional context
+                for API errors, including the HTTP status code and response body.
+
+        Examples:
+        ```py
+        await client.sites.files.download(file_path="string", site_id="string", destination="string")
+        ```
+        """
+        return await self._base_client.download(
+            path=f"/sites/{site_id}/files/{file_path}",
+            destination=destination,
+            auth_names=["netlifyAuth"],
+            headers={"accept": "application/vnd.bitballoon.v1.raw"},
+            request_options=request_options or default_request_options(),
+        )
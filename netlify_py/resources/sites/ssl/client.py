@@ -1,3 +1,4 @@
+import functools
 import typing
 
 from netlify_py.core import (
@@ -10,17 +11,24 @@ from netlify_py.core import (
     to_encodable,
     type_utils,
 )
-from netlify_py.resources.sites.ssl.certificates import (
-    AsyncCertificatesClient,
-    CertificatesClient,
-)
 from netlify_py.types import models
 
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.sites.ssl.certificates import (
+        AsyncCertificatesClient,
+        CertificatesClient,
+    )
+
 
 class SslClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.certificates = CertificatesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def certificates(self) -> "CertificatesClient":
+        from netlify_py.resources.sites.ssl.certificates import CertificatesClient
+
+        return CertificatesClient(base_client=self._base_client)
 
     def list(
         self, *, site_id: str, request_options: typing.Optional[RequestOptions] = None
@@ -127,7 +135,12 @@ class SslClient:
 class AsyncSslClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.certificates = AsyncCertificatesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def certificates(self) -> "AsyncCertificatesClient":
+        from netlify_py.resources.sites.ssl.certificates import AsyncCertificatesClient
+
+        return AsyncCertificatesClient(base_client=self._base_client)
 
     async def list(
         self, *, site_id: str, request_options: typing.Optional[RequestOptions] = None
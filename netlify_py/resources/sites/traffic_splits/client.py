@@ -1,3 +1,4 @@
+import functools
 import typing
 
 from netlify_py.core import (
@@ -8,22 +9,34 @@ from netlify_py.core import (
     to_encodable,
     type_utils,
 )
-from netlify_py.resources.sites.traffic_splits.publish import (
-    AsyncPublishClient,
-    PublishClient,
-)
-from netlify_py.resources.sites.traffic_splits.unpublish import (
-    AsyncUnpublishClient,
-    UnpublishClient,
-)
 from netlify_py.types import models, params
 
+if typing.TYPE_CHECKING:
+    from netlify_py.resources.sites.traffic_splits.publish import (
+        AsyncPublishClient,
+        PublishClient,
+    )
+    from netlify_py.resources.sites.traffic_splits.unpublish import (
+        AsyncUnpublishClient,
+        UnpublishClient,
+    )
+
 
 class TrafficSplitsClient:
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.publish = PublishClient(base_client=self._base_client)
-        self.unpublish = UnpublishClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def publish(self) -> "PublishClient":
+        from netlify_py.resources.sites.traffic_splits.publish import PublishClient
+
+        return PublishClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def unpublish(self) -> "UnpublishClient":
+        from netlify_py.resources.sites.traffic_splits.unpublish import UnpublishClient
+
+        return UnpublishClient(base_client=self._base_client)
 
     def list(
         self, *, site_id: str, request_options: typing.Optional[RequestOptions] = None
@@ -180,8 +193,20 @@ class TrafficSplitsClient:
 class AsyncTrafficSplitsClient:
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.publish = AsyncPublishClient(base_client=self._base_client)
-        self.unpublish = AsyncUnpublishClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def publish(self) -> "AsyncPublishClient":
+        from netlify_py.resources.sites.traffic_splits.publish import AsyncPublishClient
+
+        return AsyncPublishClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def unpublish(self) -> "AsyncUnpublishClient":
+        from netlify_py.resources.sites.traffic_splits.unpublish import (
+            AsyncUnpublishClient,
+        )
+
+        return AsyncUnpublishClient(base_client=self._base_client)
 
     async def list(
         self, *, site_id: str, request_options: typing.Optional[RequestOptions] = None
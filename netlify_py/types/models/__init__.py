@@ -1,55 +1,132 @@
-from .access_token import AccessToken
-from .account_membership import AccountMembership
-from .account_membership_capabilities import AccountMembershipCapabilities
-from .account_type import AccountType
-from .account_usage_capability import AccountUsageCapability
-from .asset import Asset
-from .asset_form import AssetForm
-from .asset_form_fields import AssetFormFields
-from .asset_public_signature import AssetPublicSignature
-from .asset_signature import AssetSignature
-from .audit_log import AuditLog
-from .audit_log_payload import AuditLogPayload
-from .build import Build
-from .build_hook import BuildHook
-from .build_status import BuildStatus
-from .build_status_minutes import BuildStatusMinutes
-from .deploy import Deploy
-from .deploy_key import DeployKey
-from .deployed_branch import DeployedBranch
-from .dev_server import DevServer
-from .dev_server_hook import DevServerHook
-from .dns_record import DnsRecord
-from .dns_zone import DnsZone
-from .env_var import EnvVar
-from .env_var_user import EnvVarUser
-from .env_var_value import EnvVarValue
-from .file import File
-from .form import Form
-from .function import Function
-from .function_schedule import FunctionSchedule
-from .hook import Hook
-from .hook_type import HookType
-from .member import Member
-from .payment_method import PaymentMethod
-from .payment_method_data import PaymentMethodData
-from .repo_info import RepoInfo
-from .repo_info_env import RepoInfoEnv
-from .service import Service
-from .service_instance import ServiceInstance
-from .site import Site
-from .site_capabilities import SiteCapabilities
-from .site_default_hooks_data import SiteDefaultHooksData
-from .site_function import SiteFunction
-from .site_processing_settings import SiteProcessingSettings
-from .site_processing_settings_html import SiteProcessingSettingsHtml
-from .sni_certificate import SniCertificate
-from .snippet import Snippet
-from .split_test import SplitTest
-from .submission import Submission
-from .ticket import Ticket
-from .user import User
-from .user_onboarding_progress import UserOnboardingProgress
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .access_token import AccessToken
+    from .account_membership import AccountMembership
+    from .account_membership_capabilities import AccountMembershipCapabilities
+    from .account_type import AccountType
+    from .account_usage_capability import AccountUsageCapability
+    from .asset import Asset
+    from .asset_form import AssetForm
+    from .asset_form_fields import AssetFormFields
+    from .asset_public_signature import AssetPublicSignature
+    from .asset_signature import AssetSignature
+    from .audit_log import AuditLog
+    from .audit_log_payload import AuditLogPayload
+    from .build import Build
+    from .build_hook import BuildHook
+    from .build_status import BuildStatus
+    from .build_status_minutes import BuildStatusMinutes
+    from .deploy import Deploy
+    from .deploy_key import DeployKey
+    from .deployed_branch import DeployedBranch
+    from .dev_server import DevServer
+    from .dev_server_hook import DevServerHook
+    from .dns_record import DnsRecord
+    from .dns_zone import DnsZone
+    from .env_var import EnvVar
+    from .env_var_user import EnvVarUser
+    from .env_var_value import EnvVarValue
+    from .file import File
+    from .form import Form
+    from .function import Function
+    from .function_schedule import FunctionSchedule
+    from .hook import Hook
+    from .hook_type import HookType
+    from .member import Member
+    from .payment_method import PaymentMethod
+    from .payment_method_data import PaymentMethodData
+    from .repo_info import RepoInfo
+    from .repo_info_env import RepoInfoEnv
+    from .service import Service
+    from .service_instance import ServiceInstance
+    from .site import Site
+    from .site_capabilities import SiteCapabilities
+    from .site_default_hooks_data import SiteDefaultHooksData
+    from .site_function import SiteFunction
+    from .site_processing_settings import SiteProcessingSettings
+    from .site_processing_settings_html import SiteProcessingSettingsHtml
+    from .sni_certificate import SniCertificate
+    from .snippet import Snippet
+    from .split_test import SplitTest
+    from .submission import Submission
+    from .ticket import Ticket
+    from .user import User
+    from .user_onboarding_progress import UserOnboardingProgress
+
+"""
+Names are imported from their submodule on first access (PEP 562), so only
+the models that are actually used have their Pydantic schemas built.
+"""
+
+_LAZY_IMPORTS: typing.Dict[str, str] = {
+    "AccessToken": ".access_token",
+    "AccountMembership": ".account_membership",
+    "AccountMembershipCapabilities": ".account_membership_capabilities",
+    "AccountType": ".account_type",
+    "AccountUsageCapability": ".account_usage_capability",
+    "Asset": ".asset",
+    "AssetForm": ".asset_form",
+    "AssetFormFields": ".asset_form_fields",
+    "AssetPublicSignature": ".asset_public_signature",
+    "AssetSignature": ".asset_signature",
+    "AuditLog": ".audit_log",
+    "AuditLogPayload": ".audit_log_payload",
+    "Build": ".build",
+    "BuildHook": ".build_hook",
+    "BuildStatus": ".build_status",
+    "BuildStatusMinutes": ".build_status_minutes",
+    "Deploy": ".deploy",
+    "DeployKey": ".deploy_key",
+    "DeployedBranch": ".deployed_branch",
+    "DevServer": ".dev_server",
+    "DevServerHook": ".dev_server_hook",
+    "DnsRecord": ".dns_record",
+    "DnsZone": ".dns_zone",
+    "EnvVar": ".env_var",
+    "EnvVarUser": ".env_var_user",
+    "EnvVarValue": ".env_var_value",
+    "File": ".file",
+    "Form": ".form",
+    "Function": ".function",
+    "FunctionSchedule": ".function_schedule",
+    "Hook": ".hook",
+    "HookType": ".hook_type",
+    "Member": ".member",
+    "PaymentMethod": ".payment_method",
+    "PaymentMethodData": ".payment_method_data",
+    "RepoInfo": ".repo_info",
+    "RepoInfoEnv": ".repo_info_env",
+    "Service": ".service",
+    "ServiceInstance": ".service_instance",
+    "Site": ".site",
+    "SiteCapabilities": ".site_capabilities",
+    "SiteDefaultHooksData": ".site_default_hooks_data",
+    "SiteFunction": ".site_function",
+    "SiteProcessingSettings": ".site_processing_settings",
+    "SiteProcessingSettingsHtml": ".site_processing_settings_html",
+    "SniCertificate": ".sni_certificate",
+    "Snippet": ".snippet",
+    "SplitTest": ".split_test",
+    "Submission": ".submission",
+    "Ticket": ".ticket",
+    "User": ".user",
+    "UserOnboardingProgress": ".user_onboarding_progress",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
 
 __all__ = [
@@ -1,88 +1,187 @@
-from .account_add_member_setup import (
-    AccountAddMemberSetup,
-    _SerializerAccountAddMemberSetup,
-)
-from .account_setup import AccountSetup, _SerializerAccountSetup
-from .account_update_member_setup import (
-    AccountUpdateMemberSetup,
-    _SerializerAccountUpdateMemberSetup,
-)
-from .account_update_setup import AccountUpdateSetup, _SerializerAccountUpdateSetup
-from .accounts_env_vars_create_body_item import (
-    AccountsEnvVarsCreateBodyItem,
-    _SerializerAccountsEnvVarsCreateBodyItem,
-)
-from .accounts_env_vars_set_body import (
-    AccountsEnvVarsSetBody,
-    _SerializerAccountsEnvVarsSetBody,
-)
-from .accounts_env_vars_update_body import (
-    AccountsEnvVarsUpdateBody,
-    _SerializerAccountsEnvVarsUpdateBody,
-)
-from .build_hook_setup import BuildHookSetup, _SerializerBuildHookSetup
-from .build_setup import BuildSetup, _SerializerBuildSetup
-from .deploy import Deploy, _SerializerDeploy
-from .deploy_files import DeployFiles, _SerializerDeployFiles
-from .deploy_files_functions_config import (
-    DeployFilesFunctionsConfig,
-    _SerializerDeployFilesFunctionsConfig,
-)
-from .dev_server_hook_setup import DevServerHookSetup, _SerializerDevServerHookSetup
-from .dns_record_create import DnsRecordCreate, _SerializerDnsRecordCreate
-from .dns_zone_setup import DnsZoneSetup, _SerializerDnsZoneSetup
-from .env_var_value import EnvVarValue, _SerializerEnvVarValue
-from .excluded_function_route import (
-    ExcludedFunctionRoute,
-    _SerializerExcludedFunctionRoute,
-)
-from .function_config import FunctionConfig, _SerializerFunctionConfig
-from .function_route import FunctionRoute, _SerializerFunctionRoute
-from .function_schedule import FunctionSchedule, _SerializerFunctionSchedule
-from .hook import Hook, _SerializerHook
-from .purge import Purge, _SerializerPurge
-from .repo_info import RepoInfo, _SerializerRepoInfo
-from .repo_info_env import RepoInfoEnv, _SerializerRepoInfoEnv
-from .site_setup import SiteSetup, _SerializerSiteSetup
-from .site_setup_capabilities import (
-    SiteSetupCapabilities,
-    _SerializerSiteSetupCapabilities,
-)
-from .site_setup_default_hooks_data import (
-    SiteSetupDefaultHooksData,
-    _SerializerSiteSetupDefaultHooksData,
-)
-from .site_setup_processing_settings import (
-    SiteSetupProcessingSettings,
-    _SerializerSiteSetupProcessingSettings,
-)
-from .site_setup_processing_settings_html import (
-    SiteSetupProcessingSettingsHtml,
-    _SerializerSiteSetupProcessingSettingsHtml,
-)
-from .snippet import Snippet, _SerializerSnippet
-from .split_test_setup import SplitTestSetup, _SerializerSplitTestSetup
-from .traffic_rules_aggregate_config import (
-    TrafficRulesAggregateConfig,
-    _SerializerTrafficRulesAggregateConfig,
-)
-from .traffic_rules_aggregate_config_keys_item import (
-    TrafficRulesAggregateConfigKeysItem,
-    _SerializerTrafficRulesAggregateConfigKeysItem,
-)
-from .traffic_rules_config import TrafficRulesConfig, _SerializerTrafficRulesConfig
-from .traffic_rules_config_action import (
-    TrafficRulesConfigAction,
-    _SerializerTrafficRulesConfigAction,
-)
-from .traffic_rules_config_action_config import (
-    TrafficRulesConfigActionConfig,
-    _SerializerTrafficRulesConfigActionConfig,
-)
-from .traffic_rules_rate_limit_config import (
-    TrafficRulesRateLimitConfig,
-    _SerializerTrafficRulesRateLimitConfig,
-)
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .account_add_member_setup import (
+        AccountAddMemberSetup,
+        _SerializerAccountAddMemberSetup,
+    )
+    from .account_setup import AccountSetup, _SerializerAccountSetup
+    from .account_update_member_setup import (
+        AccountUpdateMemberSetup,
+        _SerializerAccountUpdateMemberSetup,
+    )
+    from .account_update_setup import AccountUpdateSetup, _SerializerAccountUpdateSetup
+    from .accounts_env_vars_create_body_item import (
+        AccountsEnvVarsCreateBodyItem,
+        _SerializerAccountsEnvVarsCreateBodyItem,
+    )
+    from .accounts_env_vars_set_body import (
+        AccountsEnvVarsSetBody,
+        _SerializerAccountsEnvVarsSetBody,
+    )
+    from .accounts_env_vars_update_body import (
+        AccountsEnvVarsUpdateBody,
+        _SerializerAccountsEnvVarsUpdateBody,
+    )
+    from .build_hook_setup import BuildHookSetup, _SerializerBuildHookSetup
+    from .build_setup import BuildSetup, _SerializerBuildSetup
+    from .deploy import Deploy, _SerializerDeploy
+    from .deploy_files import DeployFiles, _SerializerDeployFiles
+    from .deploy_files_functions_config import (
+        DeployFilesFunctionsConfig,
+        _SerializerDeployFilesFunctionsConfig,
+    )
+    from .dev_server_hook_setup import DevServerHookSetup, _SerializerDevServerHookSetup
+    from .dns_record_create import DnsRecordCreate, _SerializerDnsRecordCreate
+    from .dns_zone_setup import DnsZoneSetup, _SerializerDnsZoneSetup
+    from .env_var_value import EnvVarValue, _SerializerEnvVarValue
+    from .excluded_function_route import (
+        ExcludedFunctionRoute,
+        _SerializerExcludedFunctionRoute,
+    )
+    from .function_config import FunctionConfig, _SerializerFunctionConfig
+    from .function_route import FunctionRoute, _SerializerFunctionRoute
+    from .function_schedule import FunctionSchedule, _SerializerFunctionSchedule
+    from .hook import Hook, _SerializerHook
+    from .purge import Purge, _SerializerPurge
+    from .repo_info import RepoInfo, _SerializerRepoInfo
+    from .repo_info_env import RepoInfoEnv, _SerializerRepoInfoEnv
+    from .site_setup import SiteSetup, _SerializerSiteSetup
+    from .site_setup_capabilities import (
+        SiteSetupCapabilities,
+        _SerializerSiteSetupCapabilities,
+    )
+    from .site_setup_default_hooks_data import (
+        SiteSetupDefaultHooksData,
+        _SerializerSiteSetupDefaultHooksData,
+    )
+    from .site_setup_processing_settings import (
+        SiteSetupProcessingSettings,
+        _SerializerSiteSetupProcessingSettings,
+    )
+    from .site_setup_processing_settings_html import (
+        SiteSetupProcessingSettingsHtml,
+        _SerializerSiteSetupProcessingSettingsHtml,
+    )
+    from .snippet import Snippet, _SerializerSnippet
+    from .split_test_setup import SplitTestSetup, _SerializerSplitTestSetup
+    from .traffic_rules_aggregate_config import (
+        TrafficRulesAggregateConfig,
+        _SerializerTrafficRulesAggregateConfig,
+    )
+    from .traffic_rules_aggregate_config_keys_item import (
+        TrafficRulesAggregateConfigKeysItem,
+        _SerializerTrafficRulesAggregateConfigKeysItem,
+    )
+    from .traffic_rules_config import TrafficRulesConfig, _SerializerTrafficRulesConfig
+    from .traffic_rules_config_action import (
+        TrafficRulesConfigAction,
+        _SerializerTrafficRulesConfigAction,
+    )
+    from .traffic_rules_config_action_config import (
+        TrafficRulesConfigActionConfig,
+        _SerializerTrafficRulesConfigActionConfig,
+    )
+    from .traffic_rules_rate_limit_config import (
+        TrafficRulesRateLimitConfig,
+        _SerializerTrafficRulesRateLimitConfig,
+    )
+
+"""
+Names are imported from their submodule on first access (PEP 562), so only
+the params that are actually used have their Pydantic schemas built.
+"""
+
+_LAZY_IMPORTS: typing.Dict[str, str] = {
+    "AccountAddMemberSetup": ".account_add_member_setup",
+    "_SerializerAccountAddMemberSetup": ".account_add_member_setup",
+    "AccountSetup": ".account_setup",
+    "_SerializerAccountSetup": ".account_setup",
+    "AccountUpdateMemberSetup": ".account_update_member_setup",
+    "_SerializerAccountUpdateMemberSetup": ".account_update_member_setup",
+    "AccountUpdateSetup": ".account_update_setup",
+    "_SerializerAccountUpdateSetup": ".account_update_setup",
+    "AccountsEnvVarsCreateBodyItem": ".accounts_env_vars_create_body_item",
+    "_SerializerAccountsEnvVarsCreateBodyItem": ".accounts_env_vars_create_body_item",
+    "AccountsEnvVarsSetBody": ".accounts_env_vars_set_body",
+    "_SerializerAccountsEnvVarsSetBody": ".accounts_env_vars_set_body",
+    "AccountsEnvVarsUpdateBody": ".accounts_env_vars_update_body",
+    "_SerializerAccountsEnvVarsUpdateBody": ".accounts_env_vars_update_body",
+    "BuildHookSetup": ".build_hook_setup",
+    "_SerializerBuildHookSetup": ".build_hook_setup",
+    "BuildSetup": ".build_setup",
+    "_SerializerBuildSetup": ".build_setup",
+    "Deploy": ".deploy",
+    "_SerializerDeploy": ".deploy",
+    "DeployFiles": ".deploy_files",
+    "_SerializerDeployFiles": ".deploy_files",
+    "DeployFilesFunctionsConfig": ".deploy_files_functions_config",
+    "_SerializerDeployFilesFunctionsConfig": ".deploy_files_functions_config",
+    "DevServerHookSetup": ".dev_server_hook_setup",
+    "_SerializerDevServerHookSetup": ".dev_server_hook_setup",
+    "DnsRecordCreate": ".dns_record_create",
+    "_SerializerDnsRecordCreate": ".dns_record_create",
+    "DnsZoneSetup": ".dns_zone_setup",
+    "_SerializerDnsZoneSetup": ".dns_zone_setup",
+    "EnvVarValue": ".env_var_value",
+    "_SerializerEnvVarValue": ".env_var_value",
+    "ExcludedFunctionRoute": ".excluded_function_route",
+    "_SerializerExcludedFunctionRoute": ".excluded_function_route",
+    "FunctionConfig": ".function_config",
+    "_SerializerFunctionConfig": ".function_config",
+    "FunctionRoute": ".function_route",
+    "_SerializerFunctionRoute": ".function_route",
+    "FunctionSchedule": ".function_schedule",
+    "_SerializerFunctionSchedule": ".function_schedule",
+    "Hook": ".hook",
+    "_SerializerHook": ".hook",
+    "Purge": ".purge",
+    "_SerializerPurge": ".purge",
+    "RepoInfo": ".repo_info",
+    "_SerializerRepoInfo": ".repo_info",
+    "RepoInfoEnv": ".repo_info_env",
+    "_SerializerRepoInfoEnv": ".repo_info_env",
+    "SiteSetup": ".site_setup",
+    "_SerializerSiteSetup": ".site_setup",
+    "SiteSetupCapabilities": ".site_setup_capabilities",
+    "_SerializerSiteSetupCapabilities": ".site_setup_capabilities",
+    "SiteSetupDefaultHooksData": ".site_setup_default_hooks_data",
+    "_SerializerSiteSetupDefaultHooksData": ".site_setup_default_hooks_data",
+    "SiteSetupProcessingSettings": ".site_setup_processing_settings",
+    "_SerializerSiteSetupProcessingSettings": ".site_setup_processing_settings",
+    "SiteSetupProcessingSettingsHtml": ".site_setup_processing_settings_html",
+    "_SerializerSiteSetupProcessingSettingsHtml": ".site_setup_processing_settings_html",
+    "Snippet": ".snippet",
+    "_SerializerSnippet": ".snippet",
+    "SplitTestSetup": ".split_test_setup",
+    "_SerializerSplitTestSetup": ".split_test_setup",
+    "TrafficRulesAggregateConfig": ".traffic_rules_aggregate_config",
+    "_SerializerTrafficRulesAggregateConfig": ".traffic_rules_aggregate_config",
+    "TrafficRulesAggregateConfigKeysItem": ".traffic_rules_aggregate_config_keys_item",
+    "_SerializerTrafficRulesAggregateConfigKeysItem": ".traffic_rules_aggregate_config_keys_item",
+    "TrafficRulesConfig": ".traffic_rules_config",
+    "_SerializerTrafficRulesConfig": ".traffic_rules_config",
+    "TrafficRulesConfigAction": ".traffic_rules_config_action",
+    "_SerializerTrafficRulesConfigAction": ".traffic_rules_config_action",
+    "TrafficRulesConfigActionConfig": ".traffic_rules_config_action_config",
+    "_SerializerTrafficRulesConfigActionConfig": ".traffic_rules_config_action_config",
+    "TrafficRulesRateLimitConfig": ".traffic_rules_rate_limit_config",
+    "_SerializerTrafficRulesRateLimitConfig": ".traffic_rules_rate_limit_config",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
 
 __all__ = [
@@ -64,3 +64,64 @@ async def test_await_list_200_generated_success():
     except pydantic.ValidationError:
         is_json = False
     assert is_json, "failed response type check"
+
+
+def test_iter_list_200_generated_success():
+    """Tests paginated GET requests to the /accounts/{account_id}/audit endpoint.
+
+    Operation: iter_list
+    Test Case ID: generated_success
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : typing.List[models.AuditLog]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Every page is requested until the `Link` header has no next page
+    - Response data matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests iterating over all pages with example data
+    client = Client(token="API_TOKEN", environment=Environment.MOCK_SERVER)
+    response = list(client.accounts.audit.iter_list(account_id="string"))
+    try:
+        pydantic.TypeAdapter(typing.List[models.AuditLog]).validate_python(response)
+        is_json = True
+    except pydantic.ValidationError:
+        is_json = False
+    assert is_json, "failed response type check"
+
+
+@pytest.mark.asyncio
+async def test_await_iter_list_200_generated_success():
+    """Tests paginated GET requests to the /accounts/{account_id}/audit endpoint.
+
+    Operation: iter_list
+    Test Case ID: generated_success
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : typing.List[models.AuditLog]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Every page is requested until the `Link` header has no next page
+    - Response data matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests iterating over all pages asynchronously with example data
+    client = AsyncClient(token="API_TOKEN", environment=Environment.MOCK_SERVER)
+    response = [
+        item async for item in client.accounts.audit.aiter_list(account_id="string")
+    ]
+    try:
+        pydantic.TypeAdapter(typing.List[models.AuditLog]).validate_python(response)
+        is_json = True
+    except pydantic.ValidationError:
+        is_json = False
+    assert is_json, "failed response type check"
@@ -0,0 +1,126 @@
+import asyncio
+import concurrent.futures
+import datetime
+import time
+
+import httpx
+import pytest
+
+from netlify_py.core import AsyncBaseClient, AuthBearer, OAuth2, TokenCache
+
+
+def _oauth2(**kwargs) -> OAuth2:
+    return OAuth2(
+        token_url="https://auth.netlify.test/oauth/token",
+        access_token_pointer="/access_token",
+        expires_in_pointer="/expires_in",
+        credentials_location="request_body",
+        body_content="form",
+        request_mutator=AuthBearer(val=None),
+        grant_type="client_credentials",
+        client_id="client-id",
+        client_secret="client-secret",
+        **kwargs,
+    )
+
+
+def _expiring_in(seconds: float) -> datetime.datetime:
+    return datetime.datetime.now() + datetime.timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def token_requests(monkeypatch):
+    """Replaces the token endpoint, counting token requests."""
+    requests: list = []
+
+    def refresh(self):
+        time.sleep(0.05)
+        requests.append("sync")
+        return (f"token-{len(requests)}", _expiring_in(3600))
+
+    async def arefresh(self):
+        await asyncio.sleep(0.05)
+        requests.append("async")
+        return (f"token-{len(requests)}", _expiring_in(3600))
+
+    monkeypatch.setattr(OAuth2, "_refresh", refresh)
+    monkeypatch.setattr(OAuth2, "_arefresh", arefresh)
+    return requests
+
+
+def test_parse_token_response():
+    auth = _oauth2()
+    access_token, expires_at = auth._parse_token(
+        httpx.Response(
+            200,
+            json={"access_token": "abc", "expires_in": 3600},
+            request=httpx.Request("POST", auth.token_url),
+        )
+    )
+    assert access_token == "abc"
+    assert _expiring_in(3400) < expires_at < _expiring_in(3600)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_token_request(token_requests):
+    seen: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["authorization"])
+        return httpx.Response(200, json={})
+
+    client = AsyncBaseClient(
+        base_url="https://api.netlify.test",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    client.register_auth("oauth", _oauth2())
+    await asyncio.gather(
+        *(
+            client.request(
+                method="GET", path="/user", cast_to=dict, auth_names=["oauth"]
+            )
+            for _ in range(20)
+        )
+    )
+    assert token_requests == ["async"]
+    assert seen == ["Bearer token-1"] * 20
+
+
+@pytest.mark.asyncio
+async def test_token_is_refreshed_in_the_background(token_requests):
+    auth = _oauth2(access_token="old", expires_at=_expiring_in(60))
+    await auth.prepare_async()
+    # the still valid token is used while the refresh is in flight
+    assert auth.access_token == "old"
+    assert token_requests == []
+
+    await asyncio.sleep(0.1)
+    await auth.prepare_async()
+    assert auth.access_token == "token-1"
+    assert token_requests == ["async"]
+
+
+@pytest.mark.asyncio
+async def test_providers_share_a_token_cache(token_requests):
+    cache = TokenCache()
+    first, second = _oauth2(token_cache=cache), _oauth2(token_cache=cache)
+    await asyncio.gather(first.prepare_async(), second.prepare_async())
+    assert first.access_token == second.access_token == "token-1"
+    assert token_requests == ["async"]
+
+    other_credentials = _oauth2(token_cache=cache, scope=["admin"])
+    await other_credentials.prepare_async()
+    assert token_requests == ["async", "async"]
+
+
+def test_threads_share_one_token_request(token_requests):
+    auth = _oauth2()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        headers = list(
+            pool.map(
+                lambda _: auth.add_to_request({"method": "GET", "url": "/"}),
+                range(8),
+            )
+        )
+    assert token_requests == ["sync"]
+    assert {cfg["headers"]["Authorization"] for cfg in headers} == {"Bearer token-1"}
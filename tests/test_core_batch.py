@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from netlify_py import ApiError, AsyncClient, Client, RateLimiter
+from netlify_py.core import base_client
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    site_id = request.url.path.split("/")[-2]
+    if site_id == "missing":
+        return httpx.Response(404, json={})
+    return httpx.Response(200, json=[{"key": site_id}])
+
+
+def test_batch_returns_ordered_results_and_captures_errors():
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    site_ids = [f"site-{i}" for i in range(50)]
+    site_ids[7] = "missing"
+    progress: list = []
+    lock = threading.Lock()
+
+    def on_progress(done, total, result):
+        with lock:
+            progress.append((done, total))
+
+    results = client.batch(
+        [
+            lambda site_id=site_id: client.sites.env.list(site_id=site_id)
+            for site_id in site_ids
+        ],
+        max_workers=8,
+        on_progress=on_progress,
+    )
+    assert [r.index for r in results] == list(range(50))
+    assert results[0].unwrap()[0].key == "site-0"
+    assert not results[7].ok
+    assert isinstance(results[7].error, ApiError)
+    with pytest.raises(ApiError):
+        results[7].unwrap()
+    assert sorted(progress) == [(done, 50) for done in range(1, 51)]
+
+
+def test_batch_calls_draw_from_the_rate_limiter(monkeypatch):
+    slept: list = []
+    monkeypatch.setattr(base_client.time, "sleep", slept.append)
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        rate_limiter=RateLimiter(limit=5, period=1),
+    )
+    client.batch([lambda: client.sites.env.list(site_id="site-1")] * 10)
+    assert len(slept) == 5
+
+
+@pytest.mark.asyncio
+async def test_async_batch_bounds_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return handler(request)
+
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler)),
+    )
+    site_ids = ["missing" if i == 3 else f"site-{i}" for i in range(40)]
+    results = await client.batch(
+        [
+            lambda site_id=site_id: client.sites.env.list(site_id=site_id)
+            for site_id in site_ids
+        ],
+        max_concurrency=4,
+    )
+    assert peak == 4
+    assert [r.ok for r in results].count(False) == 1
+    assert results[39].unwrap()[0].key == "site-39"
@@ -0,0 +1,107 @@
+import asyncio
+
+import httpx
+import pytest
+
+from netlify_py import ApiError, AsyncClient
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+
+class Server:
+    """Answers every request once `release` is set"""
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.requests: list = []
+        self.release = asyncio.Event()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await self.release.wait()
+        return httpx.Response(
+            self.status_code, json={"id": request.url.path.rsplit("/", 1)[1]}
+        )
+
+
+def make_client(server: Server, token: str = "API_TOKEN", **kwargs) -> AsyncClient:
+    return AsyncClient(
+        token=token,
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handler)),
+        **kwargs,
+    )
+
+
+async def gather_released(server: Server, *calls):
+    tasks = [asyncio.ensure_future(call) for call in calls]
+    await asyncio.sleep(0.01)
+    server.release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_share_one_request():
+    server = Server()
+    client = make_client(server, coalesce=True)
+    sites = await gather_released(
+        server, *(client.sites.get(site_id="site-1") for _ in range(200))
+    )
+    assert len(server.requests) == 1
+    assert {site.id for site in sites} == {"site-1"}
+    # every caller gets its own model
+    assert sites[0] is not sites[1]
+
+    await client.sites.get(site_id="site-1")
+    assert len(server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_requests_differing_in_url_or_credentials_are_not_shared():
+    server = Server()
+    alice = make_client(server, token="alice", coalesce=True)
+    bob = make_client(server, token="bob", coalesce=True)
+    await gather_released(
+        server,
+        alice.sites.get(site_id="site-1"),
+        alice.sites.get(site_id="site-2"),
+        bob.sites.get(site_id="site-1"),
+        alice.sites.patch(site_id="site-1"),
+        alice.sites.patch(site_id="site-1"),
+    )
+    assert len(server.requests) == 5
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller():
+    server = Server(status_code=404)
+    client = make_client(server, coalesce=True)
+    errors = await gather_released(
+        server, *(client.sites.get(site_id="site-1") for _ in range(3))
+    )
+    assert len(server.requests) == 1
+    assert all(isinstance(error, ApiError) for error in errors)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_request():
+    server = Server()
+    client = make_client(server, coalesce=True)
+    first = asyncio.ensure_future(client.sites.get(site_id="site-1"))
+    second = asyncio.ensure_future(client.sites.get(site_id="site-1"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    server.release.set()
+    assert (await second).id == "site-1"
+    assert first.cancelled()
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_coalescing_is_off_by_default():
+    server = Server()
+    client = make_client(server)
+    await gather_released(
+        server, *(client.sites.get(site_id="site-1") for _ in range(3))
+    )
+    assert len(server.requests) == 3
@@ -0,0 +1,64 @@
+import httpx
+import pytest
+
+from netlify_py import AsyncClient, Client, ConnectionProfile
+from netlify_py.core import connection
+
+
+def test_presets_tune_pool_and_timeouts():
+    bulk = ConnectionProfile.bulk_upload()
+    assert bulk.limits.max_keepalive_connections == 100
+    assert bulk.timeout.write == 300
+    assert bulk.timeout.pool is None
+
+    interactive = ConnectionProfile.interactive()
+    assert interactive.limits.max_connections == 10
+    assert interactive.timeout.connect == 3
+    assert interactive.httpx_options()["http2"] is False
+
+
+def test_http2_when_available(monkeypatch):
+    monkeypatch.setattr(connection, "http2_available", lambda: False)
+    assert ConnectionProfile(http2=None).use_http2() is False
+    with pytest.raises(ImportError, match="h2"):
+        ConnectionProfile(http2=True).use_http2()
+
+    monkeypatch.setattr(connection, "http2_available", lambda: True)
+    assert ConnectionProfile(http2=None).use_http2() is True
+
+
+def test_clients_are_built_from_profile():
+    profile = ConnectionProfile(
+        max_connections=7, connect_timeout=1, read_timeout=2, http2=False
+    )
+    client = Client(token="API_TOKEN", connection=profile)
+    httpx_client = client._base_client.httpx_client
+    assert httpx_client.timeout == httpx.Timeout(connect=1, read=2, write=60, pool=60)
+    assert httpx_client._transport._pool._max_connections == 7
+
+    async_client = AsyncClient(token="API_TOKEN", timeout=httpx.Timeout(5, read=30))
+    assert async_client._base_client.httpx_client.timeout.read == 30
+
+
+def test_explicit_timeout_overrides_profile():
+    profile = ConnectionProfile(connect_timeout=1, http2=False)
+    client = Client(token="API_TOKEN", connection=profile, timeout=5)
+    assert client._base_client.httpx_client.timeout == httpx.Timeout(5)
+    assert Client(token="API_TOKEN")._base_client.httpx_client.timeout == (
+        httpx.Timeout(60)
+    )
+
+
+def test_profile_cannot_be_combined_with_httpx_client():
+    with pytest.raises(ValueError, match="httpx_client"):
+        Client(
+            token="API_TOKEN",
+            connection=ConnectionProfile.interactive(),
+            httpx_client=httpx.Client(),
+        )
+    with pytest.raises(ValueError, match="httpx_client"):
+        AsyncClient(
+            token="API_TOKEN",
+            connection=ConnectionProfile.interactive(),
+            httpx_client=httpx.AsyncClient(),
+        )
@@ -0,0 +1,130 @@
+import gzip
+import json
+
+import httpx
+import pytest
+
+from netlify_py import ApiError, AsyncClient, Client, RetryPolicy
+from netlify_py.core import AsyncDeployBody, DeployBody
+
+BASE_URL = "https://api.netlify.test/api/v1"
+SHA = "0" * 40
+
+
+def _handler(requests: list, responses: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    return handler
+
+
+def _client(requests: list, responses: list) -> Client:
+    return Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(_handler(requests, responses))
+        ),
+        retry=RetryPolicy(max_retries=2, backoff_factor=0),
+    )
+
+
+def _json(body: bytes) -> dict:
+    return json.loads(body)
+
+
+def test_body_encodes_files_functions_and_fields():
+    files = {f"/dir/{i}.html": SHA for i in range(3000)}
+    files['/quote"d/ünïcode.html'] = SHA
+    body = DeployBody(
+        files=files,
+        functions=[("hello", "f" * 64)],
+        draft=True,
+        async_=True,
+        branch=None,
+        chunk_size=1024,
+    )
+    chunks = list(body)
+    assert len(chunks) > 1
+    assert _json(b"".join(chunks)) == {
+        "files": files,
+        "functions": {"hello": "f" * 64},
+        "draft": True,
+        "async": True,
+    }
+
+
+def test_empty_files():
+    assert _json(b"".join(DeployBody(files={}))) == {"files": {}}
+
+
+def test_compressed_body_is_gzip():
+    files = {f"/{i}.js": SHA for i in range(5000)}
+    body = DeployBody(files=files, compress=True)
+    assert body.headers["content-encoding"] == "gzip"
+    data = b"".join(body)
+    assert _json(gzip.decompress(data)) == {"files": files}
+    assert len(data) < len(b"".join(DeployBody(files=files)))
+
+
+def test_iterator_body_is_not_replayable():
+    assert DeployBody(files={"/a": SHA}).replayable
+    assert not DeployBody(files=iter([("/a", SHA)])).replayable
+    assert not AsyncDeployBody(DeployBody(files=iter([("/a", SHA)]))).replayable
+
+
+def test_create_streamed_sends_body_and_retries_replayable_body():
+    requests: list = []
+    client = _client(
+        requests,
+        [
+            httpx.Response(429, headers={"retry-after": "0"}),
+            httpx.Response(200, json={"id": "deploy-1"}),
+        ],
+    )
+    body = DeployBody(files={"/index.html": SHA}, draft=True, compress=True)
+    deploy = client.sites.deploys.create_streamed(
+        site_id="site-1", body=body, title="release"
+    )
+    assert deploy.id == "deploy-1"
+    assert len(requests) == 2
+    request = requests[-1]
+    assert request.url.params["title"] == "release"
+    assert request.headers["content-type"] == "application/json"
+    assert request.headers["content-encoding"] == "gzip"
+    assert _json(gzip.decompress(request.read())) == {
+        "files": {"/index.html": SHA},
+        "draft": True,
+    }
+
+
+def test_create_streamed_does_not_retry_iterator_body():
+    requests: list = []
+    client = _client(requests, [httpx.Response(429, headers={"retry-after": "0"})])
+    body = DeployBody(files=iter([("/index.html", SHA)]))
+    with pytest.raises(ApiError):
+        client.sites.deploys.create_streamed(site_id="site-1", body=body)
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_create_streamed():
+    requests: list = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(await request.aread())
+        return httpx.Response(200, json={"id": "deploy-1"})
+
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    for body in (
+        DeployBody(files={"/index.html": SHA}),
+        AsyncDeployBody(DeployBody(files={"/index.html": SHA})),
+    ):
+        deploy = await client.sites.deploys.create_streamed(site_id="site-1", body=body)
+        assert deploy.id == "deploy-1"
+    assert [_json(body) for body in requests] == [{"files": {"/index.html": SHA}}] * 2
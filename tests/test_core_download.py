@@ -0,0 +1,188 @@
+import io
+
+import httpx
+import pytest
+
+from netlify_py import AsyncClient, Client
+from netlify_py.core import ApiError, AuthBearer
+
+BASE_URL = "https://api.netlify.test/api/v1"
+CONTENT = bytes(range(256)) * 64
+
+
+class Server:
+    """Serves CONTENT with range support, breaking off the first transfer
+    after `break_at` bytes and answering the first range request `shift`
+    bytes past the requested start"""
+
+    def __init__(self, break_at=None, ranges=True, shift=0):
+        self.break_at = break_at
+        self.ranges = ranges
+        self.shift = shift
+        self.requests = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if "missing" in request.url.path:
+            return httpx.Response(404, json={"message": "not found"})
+        start = 0
+        headers = {"etag": '"v1"', "content-type": "application/octet-stream"}
+        range_header = request.headers.get("range")
+        if range_header and self.ranges:
+            start = int(range_header[len("bytes=") : -1]) + self.shift
+            self.shift = 0
+            if start >= len(CONTENT):
+                headers["content-range"] = f"bytes */{len(CONTENT)}"
+                return httpx.Response(416, headers=headers)
+            headers["content-range"] = (
+                f"bytes {start}-{len(CONTENT) - 1}/{len(CONTENT)}"
+            )
+        body = CONTENT[start:]
+        break_at, self.break_at = self.break_at, None
+        stream = Broken(body, break_at)
+        return httpx.Response(206 if start else 200, headers=headers, stream=stream)
+
+
+class Broken(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, body, break_at):
+        self.body = body
+        self.break_at = break_at
+
+    def __iter__(self):
+        if self.break_at is None:
+            yield self.body
+            return
+        yield self.body[: self.break_at]
+        raise httpx.ReadError("connection reset")
+
+    async def __aiter__(self):
+        for chunk in self:
+            yield chunk
+
+
+def make_client(server: Server) -> Client:
+    return Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(server.handle)),
+    )
+
+
+def test_download_resumes_a_broken_transfer(tmp_path):
+    server = Server(break_at=1000)
+    target = tmp_path / "out" / "file.bin"
+    download = make_client(server).sites.files.download(
+        file_path="file.bin", site_id="site-1", destination=target
+    )
+    assert target.read_bytes() == CONTENT
+    assert not (tmp_path / "out" / "file.bin.part").exists()
+    assert (download.size, download.resumed) == (len(CONTENT), 1)
+    first, second = server.requests
+    assert first.headers["accept"] == "application/vnd.bitballoon.v1.raw"
+    assert "range" not in first.headers
+    assert second.headers["range"] == "bytes=1000-"
+    assert second.headers["if-range"] == '"v1"'
+
+
+def test_download_resumes_a_partial_file(tmp_path):
+    target = tmp_path / "file.bin"
+    (tmp_path / "file.bin.part").write_bytes(CONTENT[:5000])
+    make_client(Server()).sites.files.download(
+        file_path="file.bin", site_id="site-1", destination=target
+    )
+    assert target.read_bytes() == CONTENT
+
+    # a complete partial file is answered with 416
+    (tmp_path / "file.bin.part").write_bytes(CONTENT)
+    make_client(Server()).sites.files.download(
+        file_path="file.bin", site_id="site-1", destination=target
+    )
+    assert target.read_bytes() == CONTENT
+
+
+def test_download_restarts_when_ranges_are_ignored(tmp_path):
+    (tmp_path / "file.bin.part").write_bytes(b"stale")
+    buffer = io.BytesIO()
+    client = make_client(Server(break_at=100, ranges=False))
+    client.sites.files.download(
+        file_path="file.bin", site_id="site-1", destination=buffer
+    )
+    assert buffer.getvalue() == CONTENT
+
+    target = tmp_path / "file.bin"
+    client.sites.files.download(
+        file_path="file.bin", site_id="site-1", destination=target
+    )
+    assert target.read_bytes() == CONTENT
+
+
+def test_download_restarts_on_a_mismatched_range(tmp_path):
+    (tmp_path / "file.bin.part").write_bytes(CONTENT[:30])
+    server = Server(shift=20)
+    download = make_client(server).sites.files.download(
+        file_path="file.bin", site_id="site-1", destination=tmp_path / "file.bin"
+    )
+    assert (tmp_path / "file.bin").read_bytes() == CONTENT
+    assert (download.size, download.resumed) == (len(CONTENT), 0)
+    first, second = server.requests
+    assert first.headers["range"] == "bytes=30-"
+    assert "range" not in second.headers
+
+
+def test_download_errors(tmp_path):
+    client = make_client(Server())
+    with pytest.raises(ApiError):
+        client.sites.files.download(
+            file_path="missing", site_id="site-1", destination=tmp_path / "missing"
+        )
+    assert list(tmp_path.iterdir()) == []
+
+    server = Server(break_at=10)
+    client = make_client(server)
+    with pytest.raises(httpx.ReadError):
+        client._base_client.download(
+            path="/sites/site-1/files/file.bin",
+            destination=tmp_path / "file.bin",
+            max_resumes=0,
+        )
+    assert (tmp_path / "file.bin.part").read_bytes() == CONTENT[:10]
+
+
+@pytest.mark.asyncio
+async def test_async_download_resumes_a_broken_transfer(tmp_path, monkeypatch):
+    prepared = []
+
+    async def prepare_async(self) -> None:
+        prepared.append(self)
+
+    # every request of the download, resumed ones included, refreshes auth
+    monkeypatch.setattr(AuthBearer, "prepare_async", prepare_async)
+    server = Server(break_at=1000)
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handle)),
+    )
+    download = await client.sites.files.download(
+        file_path="file.bin", site_id="site-1", destination=tmp_path / "file.bin"
+    )
+    assert (tmp_path / "file.bin").read_bytes() == CONTENT
+    assert download.resumed == 1
+    assert len(prepared) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_download_restarts_on_a_mismatched_range(tmp_path):
+    (tmp_path / "file.bin.part").write_bytes(CONTENT[:30])
+    server = Server(shift=20)
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handle)),
+    )
+    download = await client.sites.files.download(
+        file_path="file.bin", site_id="site-1", destination=tmp_path / "file.bin"
+    )
+    assert (tmp_path / "file.bin").read_bytes() == CONTENT
+    assert download.size == len(CONTENT)
+    assert "range" not in server.requests[-1].headers
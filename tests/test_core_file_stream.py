@@ -0,0 +1,95 @@
+import io
+import os
+import threading
+
+import httpx
+import pytest
+
+from netlify_py import AsyncClient, Client
+from netlify_py.core import FileStream
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+
+def _echo(request: httpx.Request) -> httpx.Response:
+    body = request.read()
+    return httpx.Response(
+        200,
+        json={
+            "id": request.url.params.get("size"),
+            "size": len(body),
+            "path": request.headers.get("content-length"),
+        },
+    )
+
+
+def test_file_stream_chunks_buffers_without_copying():
+    """Buffers are streamed as memoryview slices of the original object."""
+    data = bytearray(b"a" * 10)
+    chunks = list(FileStream(data, chunk_size=4))
+    assert [bytes(c) for c in chunks] == [b"aaaa", b"aaaa", b"aa"]
+    assert all(isinstance(c, memoryview) for c in chunks)
+
+
+def test_upload_streams_file_and_fills_size():
+    """`size` and Content-Length are derived from the file without reading it."""
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_echo)),
+    )
+    data = io.BytesIO(b"skip" + b"x" * 1000)
+    data.seek(4)
+    response = client.deploys.files.upload(data=data, deploy_id="d", path="a.js")
+    assert (response.id, response.size, response.path) == ("1000", 1000, "1000")
+
+
+def test_upload_from_pipe_is_sent_chunked_without_size():
+    """Pipes report no size, so neither `size` nor Content-Length is set."""
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_echo)),
+    )
+    read_fd, write_fd = os.pipe()
+
+    def write() -> None:
+        with os.fdopen(write_fd, "wb") as writer:
+            writer.write(b"p" * 100_000)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    with os.fdopen(read_fd, "rb") as reader:
+        response = client.deploys.files.upload(data=reader, deploy_id="d", path="a.js")
+    writer.join()
+    assert (response.id, response.size, response.path) == (None, 100_000, None)
+
+
+@pytest.mark.parametrize("text_file", ["file", "stringio"])
+def test_upload_encodes_text_streams(tmp_path, text_file):
+    """Text streams are sent UTF-8 encoded, chunked, without a size."""
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_echo)),
+    )
+    path = tmp_path / "hello.txt"
+    path.write_text("héllo", encoding="utf-8")
+    data = open(path, encoding="utf-8") if text_file == "file" else io.StringIO("héllo")
+    with data:
+        response = client.deploys.files.upload(data=data, deploy_id="d", path="a.txt")
+    assert (response.id, response.size, response.path) == (None, 6, None)
+
+
+@pytest.mark.asyncio
+async def test_await_upload_streams_buffer():
+    """Async uploads stream buffers with an explicit Content-Length."""
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_echo)),
+    )
+    response = await client.deploys.functions.upload(
+        data=memoryview(b"z" * 700_000), deploy_id="d", name="fn"
+    )
+    assert response.id == "700000"
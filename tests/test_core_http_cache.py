@@ -0,0 +1,190 @@
+import gzip
+import json
+import time
+
+import httpx
+import pytest
+
+from netlify_py import (
+    ApiError,
+    AsyncClient,
+    Client,
+    HttpCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from netlify_py.core import CachedResponse
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+
+class Server:
+    """Serves a site with an ETag, answering 304 when it is unchanged"""
+
+    def __init__(self, compress: bool = False) -> None:
+        self.name = "site"
+        self.compress = compress
+        self.requests: list = []
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.name}"'
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers={"etag": self.etag})
+        if self.compress:
+            body = gzip.compress(
+                json.dumps({"id": "site-1", "name": self.name}).encode()
+            )
+            headers = {
+                "etag": self.etag,
+                "content-type": "application/json",
+                "content-encoding": "gzip",
+            }
+            return httpx.Response(200, content=body, headers=headers)
+        return httpx.Response(
+            200, json={"id": "site-1", "name": self.name}, headers={"etag": self.etag}
+        )
+
+
+def make_client(server: Server, cache: HttpCache, token: str = "API_TOKEN") -> Client:
+    return Client(
+        token=token,
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(server.handler)),
+        http_cache=cache,
+    )
+
+
+def test_not_modified_response_is_served_from_cache():
+    server = Server()
+    cache = HttpCache()
+    client = make_client(server, cache)
+
+    first = client.sites.get(site_id="site-1")
+    second = client.sites.get(site_id="site-1")
+    assert second.name == "site"
+    # the parsed model is reused, not validated again
+    assert second is first
+    assert "if-none-match" not in server.requests[0].headers
+    assert server.requests[1].headers["if-none-match"] == '"site"'
+    assert (cache.stats.lookups, cache.stats.hits, cache.stats.misses) == (2, 1, 1)
+    assert cache.stats.hit_ratio == 0.5
+
+    server.name = "renamed"
+    assert client.sites.get(site_id="site-1").name == "renamed"
+    assert cache.stats.misses == 2
+    assert client.sites.get(site_id="site-1").name == "renamed"
+    assert cache.stats.hits == 2
+
+
+def test_cache_is_keyed_by_credentials_and_params():
+    server = Server()
+    cache = HttpCache()
+    make_client(server, cache, token="alice").sites.get(site_id="site-1")
+    make_client(server, cache, token="bob").sites.get(site_id="site-1")
+    assert "if-none-match" not in server.requests[1].headers
+
+    assert cache.stats.hits == 0
+
+    def key(**params: str) -> str:
+        return cache.key(
+            {"method": "GET", "url": f"{BASE_URL}/sites", "params": params}
+        )
+
+    assert key(name="a") != key(name="b")
+    assert key(name="a", page="2") == key(page="2", name="a")
+
+
+def test_only_successful_get_responses_are_cached():
+    calls: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.method == "GET":
+            return httpx.Response(404, json={}, headers={"etag": '"gone"'})
+        return httpx.Response(200, json={"id": "site-1"}, headers={"etag": '"x"'})
+
+    cache = HttpCache()
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        http_cache=cache,
+    )
+    client.sites.patch(site_id="site-1", name="new")
+    for _ in range(2):
+        with pytest.raises(ApiError):
+            client.sites.get(site_id="site-1")
+    assert all("if-none-match" not in request.headers for request in calls)
+    assert len(cache.backend) == 0  # type: ignore[arg-type]
+
+
+def test_memory_backend_evicts_least_recently_used_and_expired_entries():
+    backend = MemoryCacheBackend(max_entries=2, ttl=60)
+
+    def entry(stored_at: float) -> CachedResponse:
+        return CachedResponse(
+            status_code=200, headers={"etag": '"x"'}, content=b"", stored_at=stored_at
+        )
+
+    backend.set("a", entry(time.time()))
+    backend.set("b", entry(time.time()))
+    assert backend.get("a") is not None
+    backend.set("c", entry(time.time()))
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+
+    backend.set("old", entry(time.time() - 120))
+    assert backend.get("old") is None
+
+
+def test_sqlite_backend_persists_responses(tmp_path):
+    server = Server()
+    database = tmp_path / "cache.db"
+    make_client(server, HttpCache(SQLiteCacheBackend(database))).sites.get(
+        site_id="site-1"
+    )
+
+    cache = HttpCache(SQLiteCacheBackend(database))
+    site = make_client(server, cache).sites.get(site_id="site-1")
+    assert site.name == "site"
+    assert server.requests[1].headers["if-none-match"] == '"site"'
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.parametrize(
+    "backend", [MemoryCacheBackend, SQLiteCacheBackend], ids=["memory", "sqlite"]
+)
+def test_gzip_response_is_served_from_cache_after_not_modified(tmp_path, backend):
+    server = Server(compress=True)
+    store = backend() if backend is MemoryCacheBackend else backend(tmp_path / "c.db")
+    cache = HttpCache(store)
+    client = make_client(server, cache)
+
+    assert client.sites.get(site_id="site-1").name == "site"
+    site = client.sites.get(site_id="site-1")
+    assert site.name == "site"
+    assert cache.stats.hits == 1
+    # not parsed as a dict yet: the stored body is decoded again
+    data = client.sites.get(site_id="site-1", request_options={"response_mode": "dict"})
+    assert data == {"id": "site-1", "name": "site"}
+    assert cache.stats.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_serves_not_modified_responses_from_cache():
+    server = Server()
+    cache = HttpCache()
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handler)),
+        http_cache=cache,
+    )
+    await client.sites.get(site_id="site-1")
+    site = await client.sites.get(site_id="site-1")
+    assert site.name == "site"
+    assert cache.stats.hits == 1
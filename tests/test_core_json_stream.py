@@ -0,0 +1,88 @@
+import json
+
+import httpx
+import pytest
+
+from netlify_py import AsyncClient, Client
+from netlify_py.core import ApiError, JsonArrayDecoder, Projection
+from netlify_py.types import models
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+FILES = [
+    {"id": "/index.html", "path": "/index.html", "sha": "a", "size": 10},
+    {"id": '/odd "]}[{,\\.txt', "path": "/odd.txt", "sha": "b", "size": 20},
+    {"id": "/é.css", "path": "/é.css", "sha": "c", "size": 30},
+]
+BODY = json.dumps(FILES, ensure_ascii=False).encode()
+
+
+def decode(body: bytes, chunk_size: int) -> list:
+    decoder = JsonArrayDecoder()
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items.extend(decoder.feed(body[i : i + chunk_size]))
+    decoder.flush()
+    return [json.loads(item) for item in items]
+
+
+def test_decoder_splits_items_across_any_chunking():
+    for chunk_size in range(1, len(BODY) + 1):
+        assert decode(BODY, chunk_size) == FILES
+    assert decode(b" [ ] ", 1) == []
+    assert decode(b"[1, [2], {}]", 2) == [1, [2], {}]
+
+
+@pytest.mark.parametrize("body", [b'{"id": 1}', b"[1, 2", b"[1,,2]"])
+def test_decoder_rejects_invalid_arrays(body):
+    with pytest.raises(ValueError):
+        decode(body, 3)
+
+
+class ChunkedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __iter__(self):
+        for i in range(0, len(BODY), 7):
+            yield BODY[i : i + 7]
+
+    async def __aiter__(self):
+        for chunk in self:
+            yield chunk
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if "missing" in request.url.path:
+        return httpx.Response(404, json={"code": 404, "message": "Not Found"})
+    return httpx.Response(
+        200, headers={"content-type": "application/json"}, stream=ChunkedStream()
+    )
+
+
+def test_stream_list_yields_validated_items():
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    files = client.sites.files.stream_list(site_id="site-1")
+    first = next(files)
+    assert isinstance(first, models.File) and first.path == "/index.html"
+    assert [f.size for f in files] == [20, 30]
+
+    projected = client.sites.files.stream_list(
+        site_id="site-1", request_options={"fields": ["path"]}
+    )
+    assert all(isinstance(f, Projection) for f in projected)
+
+    with pytest.raises(ApiError):
+        list(client.sites.files.stream_list(site_id="missing"))
+
+
+@pytest.mark.asyncio
+async def test_async_stream_list_yields_validated_items():
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    files = [f async for f in client.sites.files.astream_list(site_id="site-1")]
+    assert files == [models.File.model_validate(f) for f in FILES]
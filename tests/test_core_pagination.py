@@ -0,0 +1,95 @@
+import asyncio
+import httpx
+import pytest
+
+from netlify_py import AsyncClient, Client
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+
+def _handler(total_pages: int, requested: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        requested.append(page)
+        links = [f'<{BASE_URL}/sites?page={total_pages}&per_page=2>; rel="last"']
+        if page < total_pages:
+            links.append(f'<{BASE_URL}/sites?page={page + 1}&per_page=2>; rel="next"')
+        return httpx.Response(
+            200,
+            json=[{"id": f"{page}-{i}"} for i in range(2)],
+            headers={"link": ", ".join(links)},
+        )
+
+    return handler
+
+
+def test_iter_list_follows_link_header():
+    """Every page advertised through `rel="next"` is requested in order."""
+    requested: list = []
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(_handler(3, requested))
+        ),
+    )
+    sites = list(client.sites.iter_list(per_page=2))
+    assert [s.id for s in sites] == ["1-0", "1-1", "2-0", "2-1", "3-0", "3-1"]
+    assert requested == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_aiter_list_stops_prefetch_on_break():
+    """Breaking out of the async iterator does not request further pages."""
+    requested: list = []
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(_handler(10, requested))
+        ),
+    )
+    pages = client.sites.aiter_list(per_page=2)
+    ids = []
+    async for site in pages:
+        ids.append(site.id)
+        if len(ids) == 3:
+            break
+    await pages.aclose()  # type: ignore[attr-defined]
+    assert ids == ["1-0", "1-1", "2-0"]
+    assert max(requested) <= 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_aiter_list_fans_out_with_bounded_concurrency(ordered: bool):
+    """Pages after the first are fetched in parallel, never above the cap."""
+    requested: list = []
+    in_flight = {"now": 0, "max": 0}
+    inner = _handler(8, requested)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01 * (8 - int(request.url.params["page"])))
+        in_flight["now"] -= 1
+        return inner(request)
+
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    ids = [
+        site.id
+        async for site in client.sites.aiter_list(
+            per_page=2, max_concurrency=3, ordered=ordered
+        )
+    ]
+    expected = [f"{page}-{i}" for page in range(1, 9) for i in range(2)]
+    assert sorted(requested) == list(range(1, 9))
+    assert in_flight["max"] <= 3
+    if ordered:
+        assert ids == expected
+    else:
+        assert sorted(ids) == sorted(expected)
@@ -0,0 +1,87 @@
+import httpx
+import pytest
+
+from netlify_py import AsyncClient, Client
+from netlify_py.core import Projection, project, projection_type
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+SITES = [
+    {
+        "id": "site-1",
+        "name": "one",
+        "url": "https://one.netlify.app",
+        "published_deploy": {"id": "deploy-1", "state": "ready"},
+    },
+    {"id": "site-2", "name": "two", "published_deploy": None},
+]
+FIELDS = ["id", "name", "published_deploy.id"]
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=SITES)
+
+
+def test_project_keeps_requested_fields():
+    one, two = project(SITES, FIELDS)
+    assert isinstance(one, Projection)
+    assert (one.id, one.name, one.published_deploy.id) == ("site-1", "one", "deploy-1")
+    assert two.published_deploy is None
+    assert one.to_dict() == {
+        "id": "site-1",
+        "name": "one",
+        "published_deploy": {"id": "deploy-1"},
+    }
+    # only the requested fields are held, in slots
+    assert not hasattr(one, "__dict__")
+    with pytest.raises(AttributeError):
+        one.url
+    assert project({"name": "x"}, ["id"]).id is None
+    assert type(one) is projection_type(FIELDS)
+
+
+def test_invalid_fields_are_rejected():
+    with pytest.raises(ValueError):
+        projection_type(["published_deploy."])
+
+
+@pytest.mark.parametrize("field", ["to_dict", "from_json", "_fields", "a.__class__"])
+def test_reserved_fields_are_rejected(field):
+    with pytest.raises(ValueError, match="reserved"):
+        projection_type([field])
+
+
+def test_overlapping_fields_keep_the_whole_value():
+    site = SITES[0]
+    for fields in (
+        ["published_deploy", "published_deploy.id"],
+        ["published_deploy.id", "published_deploy"],
+    ):
+        one = project(site, fields)
+        assert one.published_deploy == {"id": "deploy-1", "state": "ready"}
+    two = project(site, ["published_deploy.id", "published_deploy.state"])
+    assert two.to_dict() == {"published_deploy": {"id": "deploy-1", "state": "ready"}}
+
+
+def test_fields_request_option():
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    sites = client.sites.list(request_options={"fields": FIELDS})
+    assert [site.to_dict() for site in sites] == [
+        site.to_dict() for site in project(SITES, FIELDS)
+    ]
+    assert sites[0].published_deploy.id == "deploy-1"
+
+
+@pytest.mark.asyncio
+async def test_async_fields_request_option():
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    sites = await client.sites.list(request_options={"fields": ["name"]})
+    assert [site.name for site in sites] == ["one", "two"]
@@ -0,0 +1,93 @@
+import concurrent.futures
+import time
+
+import httpx
+import pytest
+
+from netlify_py import AsyncClient, Client, RateLimiter, TokenBucket
+from netlify_py.core import base_client
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+
+def test_token_bucket_spaces_requests_beyond_the_burst():
+    bucket = TokenBucket(limit=2, period=2)
+    delays = [bucket.reserve() for _ in range(4)]
+    assert delays[:2] == [0, 0]
+    assert delays[2] == pytest.approx(1, abs=0.05)
+    assert delays[3] == pytest.approx(2, abs=0.05)
+
+
+def test_token_bucket_is_shared_between_threads():
+    bucket = TokenBucket(limit=10, period=1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=64) as pool:
+        delays = sorted(pool.map(lambda _: bucket.reserve(), range(64)))
+    assert delays[:10] == [0] * 10
+    # the remaining 54 requests are spread at the refill rate of 10/s
+    assert delays[-1] == pytest.approx(5.4, abs=0.1)
+
+
+def test_token_bucket_follows_response_headers():
+    bucket = TokenBucket(limit=500, period=60)
+    bucket.observe(
+        httpx.Headers({"x-ratelimit-limit": "60", "x-ratelimit-remaining": "1"})
+    )
+    assert bucket.limit == 60
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(1, abs=0.05)
+
+    reset = str(int(time.time()) + 30)
+    bucket.observe(
+        httpx.Headers(
+            {
+                "x-ratelimit-limit": "60",
+                "x-ratelimit-remaining": "0",
+                "x-ratelimit-reset": reset,
+            }
+        )
+    )
+    assert 28 < bucket.reserve() <= 31
+
+
+def test_client_draws_from_default_and_route_buckets(monkeypatch):
+    slept: list = []
+    monkeypatch.setattr(base_client.time, "sleep", slept.append)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={}, headers={"x-ratelimit-remaining": "1000"})
+
+    uploads = TokenBucket(limit=1, period=10)
+    limiter = RateLimiter(limit=100, routes={"PUT /deploys/*/files/*": uploads})
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        rate_limiter=limiter,
+    )
+    client.sites.get(site_id="site-1")
+    client.deploys.files.upload(deploy_id="deploy-1", path="a.js", data=b"a")
+    assert slept == []
+
+    client.deploys.files.upload(deploy_id="deploy-1", path="b.js", data=b"b")
+    assert slept == [pytest.approx(10, abs=0.1)]
+
+
+@pytest.mark.asyncio
+async def test_async_client_waits_for_rate_limit(monkeypatch):
+    slept: list = []
+
+    async def sleep(delay: float) -> None:
+        slept.append(delay)
+
+    monkeypatch.setattr(base_client.asyncio, "sleep", sleep)
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+        ),
+        rate_limiter=RateLimiter(limit=1, period=5),
+    )
+    await client.sites.get(site_id="site-1")
+    await client.sites.get(site_id="site-1")
+    assert slept == [pytest.approx(5, abs=0.1)]
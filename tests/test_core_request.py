@@ -0,0 +1,40 @@
+import typing
+
+from netlify_py.core import to_encodable, type_utils
+from netlify_py.types import params
+
+
+def test_to_encodable_omits_not_given_and_dumps_by_alias():
+    """Omitted values are dropped and nested serializers are dumped by alias."""
+    encoded = to_encodable(
+        item={
+            "async_": True,
+            "branch": type_utils.NOT_GIVEN,
+            "files": {"/index.html": "abc"},
+            "function_schedules": [{"cron": "@daily", "name": "nightly"}],
+        },
+        dump_with=params._SerializerDeployFiles,
+    )
+    assert encoded == {
+        "async": True,
+        "files": {"/index.html": "abc"},
+        "function_schedules": [{"cron": "@daily", "name": "nightly"}],
+    }
+
+
+def test_to_encodable_scalars():
+    """Scalars are validated against the dump type."""
+    assert to_encodable(item=2, dump_with=int) == 2
+    assert to_encodable(item=None, dump_with=typing.Optional[str]) is None
+
+
+def test_to_encodable_omits_nested_not_given():
+    """NotGiven values below the top level are still dropped."""
+    encoded = to_encodable(
+        item={
+            "function_schedules": [{"cron": "@daily", "name": type_utils.NOT_GIVEN}],
+            "draft": type_utils.NOT_GIVEN,
+        },
+        dump_with=params._SerializerDeployFiles,
+    )
+    assert encoded == {"function_schedules": [{"cron": "@daily"}]}
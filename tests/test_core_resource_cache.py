@@ -0,0 +1,116 @@
+import httpx
+import pytest
+
+from netlify_py import AsyncClient, CacheRule, Client, ResourceCache
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+
+class Server:
+    def __init__(self) -> None:
+        self.requests: list = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(f"{request.method} {request.url.path}")
+        if request.url.path.endswith("/hooks/types"):
+            return httpx.Response(200, json=[{"name": "url"}])
+        if request.url.path.endswith("/user"):
+            return httpx.Response(200, json={"id": "user-1"})
+        return httpx.Response(200, json={"id": "x"})
+
+
+def make_client(server: Server, cache: ResourceCache, token: str = "API_TOKEN"):
+    return Client(
+        token=token,
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(server.handler)),
+        resource_cache=cache,
+    )
+
+
+def test_read_mostly_resources_are_served_from_cache():
+    server = Server()
+    cache = ResourceCache()
+    client = make_client(server, cache)
+
+    types = client.hooks.types.list()
+    assert client.hooks.types.list() is types
+    assert client.user.list().id == "user-1"
+    client.user.list()
+    client.sites.get(site_id="site-1")
+    client.sites.get(site_id="site-1")
+    assert server.requests == [
+        "GET /api/v1/hooks/types",
+        "GET /api/v1/user",
+        "GET /api/v1/sites/site-1",
+        "GET /api/v1/sites/site-1",
+    ]
+    assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+
+
+def test_cache_is_keyed_by_credentials():
+    server = Server()
+    cache = ResourceCache()
+    make_client(server, cache, token="alice").user.list()
+    make_client(server, cache, token="bob").user.list()
+    assert len(server.requests) == 2
+
+
+def test_mutations_invalidate_related_resources():
+    server = Server()
+    cache = ResourceCache(rules=[CacheRule("GET /sites/*", ttl=60)])
+    client = make_client(server, cache)
+
+    client.sites.get(site_id="site-1")
+    client.sites.patch(site_id="site-1", name="renamed")
+    client.sites.get(site_id="site-1")
+    client.sites.get(site_id="site-1")
+    assert server.requests.count("GET /api/v1/sites/site-1") == 2
+
+    cache = ResourceCache()
+    client = make_client(server, cache)
+    client.hooks.types.list()
+    client.user.list()
+    client.hooks.create(site_id_query="site-1")
+    assert len(cache) == 1
+    client.hooks.types.list()
+    assert server.requests.count("GET /api/v1/hooks/types") == 2
+
+
+def test_explicit_invalidation_and_expiry():
+    server = Server()
+    cache = ResourceCache(
+        rules=[CacheRule("GET /user", ttl=0), CacheRule("GET /hooks/types", ttl=60)]
+    )
+    client = make_client(server, cache)
+    client.user.list()
+    client.user.list()
+    assert server.requests.count("GET /api/v1/user") == 2
+
+    client.hooks.types.list()
+    assert cache.invalidate("GET /hooks/*") == 1
+    client.hooks.types.list()
+    assert server.requests.count("GET /api/v1/hooks/types") == 2
+
+
+def test_least_recently_used_values_are_evicted():
+    server = Server()
+    cache = ResourceCache(rules=[CacheRule("GET /sites/*", ttl=60)], max_entries=2)
+    client = make_client(server, cache)
+    for site_id in ["a", "b", "a", "c", "a", "b"]:
+        client.sites.get(site_id=site_id)
+    assert [r.rsplit("/", 1)[1] for r in server.requests] == ["a", "b", "c", "b"]
+
+
+@pytest.mark.asyncio
+async def test_async_client_serves_resources_from_cache():
+    server = Server()
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handler)),
+        resource_cache=ResourceCache(),
+    )
+    await client.hooks.types.list()
+    await client.hooks.types.list()
+    assert server.requests == ["GET /api/v1/hooks/types"]
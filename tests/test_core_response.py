@@ -0,0 +1,70 @@
+import json
+import typing
+
+import httpx
+
+from netlify_py import Client
+from netlify_py.core import (
+    BinaryResponse,
+    JsonDecoder,
+    OrjsonDecoder,
+    PydanticJsonDecoder,
+    from_encodable,
+    get_validator,
+    orjson_available,
+)
+from netlify_py.types import models
+
+
+def test_get_validator_is_cached():
+    """Validators are compiled once per `cast_to` and reused."""
+    cast_to = typing.List[models.Site]
+    assert get_validator(cast_to) is get_validator(cast_to)
+
+
+def test_from_encodable_filters_binary_response():
+    """`BinaryResponse` members are dropped from unions before validation."""
+    cast_to = typing.Union[models.File, BinaryResponse]
+    response = from_encodable(data={"id": "abc", "size": 3}, load_with=cast_to)
+    assert isinstance(response, models.File)
+    assert response.size == 3
+
+
+def test_json_decoders_agree():
+    """Every decoder produces the same models from the same bytes."""
+    content = json.dumps(
+        [
+            {"id": f"site-{i}", "name": "site", "created_at": "2024-01-01T00:00:00Z"}
+            for i in range(3)
+        ]
+    ).encode()
+    cast_to = typing.List[models.Site]
+    decoders = [JsonDecoder(), PydanticJsonDecoder(untyped=JsonDecoder())]
+    if orjson_available():
+        decoders.append(OrjsonDecoder())
+    expected = JsonDecoder().validate(content, cast_to)
+    for decoder in decoders:
+        assert decoder.validate(content, cast_to) == expected
+        assert decoder.loads(content) == json.loads(content)
+
+
+def test_client_uses_configured_json_decoder():
+    class CountingDecoder(JsonDecoder):
+        calls = 0
+
+        def validate(self, content: bytes, load_with: typing.Any) -> typing.Any:
+            CountingDecoder.calls += 1
+            return super().validate(content, load_with)
+
+    client = Client(
+        token="API_TOKEN",
+        base_url="https://api.netlify.test/api/v1",
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"id": "site-1"})
+            )
+        ),
+        json_decoder=CountingDecoder(),
+    )
+    assert client.sites.get(site_id="site-1").id == "site-1"
+    assert CountingDecoder.calls == 1
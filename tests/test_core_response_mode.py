@@ -0,0 +1,99 @@
+import copy
+import pickle
+
+import httpx
+import pydantic
+import pytest
+
+from netlify_py import AsyncClient, Client
+from netlify_py.core import LazyModel
+from netlify_py.types import models
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+SITES = [
+    {"id": "site-1", "name": "one", "build_settings": {"cmd": "make"}},
+    {"id": "site-2", "name": "two", "created_at": 5},
+]
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/sites"):
+        return httpx.Response(200, json=SITES)
+    return httpx.Response(200, json=SITES[0])
+
+
+def make_client(**kwargs) -> Client:
+    return Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+def test_dict_mode_returns_parsed_json():
+    client = make_client(response_mode="dict")
+    assert client.sites.list() == SITES
+    # per-call modes override the client's
+    site = client.sites.get(
+        site_id="site-1", request_options={"response_mode": "model"}
+    )
+    assert isinstance(site, models.Site)
+    assert site.build_settings.cmd == "make"
+
+
+def test_lazy_mode_validates_on_first_access():
+    client = make_client()
+    sites = client.sites.list(request_options={"response_mode": "lazy"})
+    assert all(isinstance(site, LazyModel) for site in sites)
+    assert not any(site.validated for site in sites)
+
+    assert sites[0].name == "one"
+    assert sites[0].build_settings.cmd == "make"
+    assert sites[0].resolve() is sites[0].resolve()
+    assert not sites[1].validated
+    assert sites[1].raw == SITES[1]
+    # invalid objects only fail when read
+    with pytest.raises(pydantic.ValidationError):
+        sites[1].name
+
+    site = client.sites.get(site_id="site-1", request_options={"response_mode": "lazy"})
+    assert site == models.Site.model_validate(SITES[0])
+
+
+def test_lazy_models_copy_and_pickle():
+    site = make_client().sites.get(
+        site_id="site-1", request_options={"response_mode": "lazy"}
+    )
+    for clone in (
+        copy.copy(site),
+        copy.deepcopy(site),
+        pickle.loads(pickle.dumps(site)),
+    ):
+        assert isinstance(clone, LazyModel)
+        assert clone.raw == SITES[0]
+        assert clone.name == "one"
+        assert clone == site
+    with pytest.raises(AttributeError):
+        site._missing
+
+
+def test_unknown_response_mode_is_rejected():
+    with pytest.raises(ValueError):
+        make_client(response_mode="fast")
+    with pytest.raises(ValueError):
+        make_client().sites.list(request_options={"response_mode": "fast"})
+
+
+@pytest.mark.asyncio
+async def test_async_client_response_modes():
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        response_mode="lazy",
+    )
+    sites = await client.sites.list()
+    assert sites[0].name == "one"
+    assert await client.sites.list(request_options={"response_mode": "dict"}) == SITES
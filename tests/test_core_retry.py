@@ -0,0 +1,140 @@
+import time
+
+import httpx
+import pytest
+
+from netlify_py import ApiError, AsyncClient, Client, RetryBudget, RetryPolicy
+from netlify_py.core.retry import rate_limit_reset, retry_after
+
+BASE_URL = "https://api.netlify.test/api/v1"
+NO_WAIT = RetryPolicy(max_retries=3, backoff_factor=0)
+
+
+def _handler(responses: list, requests: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.method)
+        if isinstance(responses[0], Exception):
+            raise responses.pop(0)
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    return handler
+
+
+def _client(responses: list, requests: list, retry=NO_WAIT) -> Client:
+    return Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(_handler(responses, requests))
+        ),
+        retry=retry,
+    )
+
+
+def test_retries_rate_limited_and_transient_failures():
+    requests: list = []
+    client = _client(
+        [
+            httpx.Response(429, headers={"retry-after": "0"}),
+            httpx.Response(503),
+            httpx.Response(200, json={"id": "site-1"}),
+        ],
+        requests,
+    )
+    assert client.sites.get(site_id="site-1").id == "site-1"
+    assert requests == ["GET", "GET", "GET"]
+
+
+def test_gives_up_after_max_retries():
+    requests: list = []
+    client = _client([httpx.Response(502)], requests)
+    with pytest.raises(ApiError) as e:
+        client.sites.get(site_id="site-1")
+    assert e.value.status_code == 502
+    assert len(requests) == 4
+
+
+def test_non_idempotent_requests_retry_only_unprocessed():
+    requests: list = []
+    client = _client([httpx.Response(500), httpx.Response(200, json={})], requests)
+    with pytest.raises(ApiError):
+        client.sites.create()
+    assert requests == ["POST"]
+
+    requests.clear()
+    client = _client(
+        [
+            httpx.ConnectError("refused"),
+            httpx.Response(429),
+            httpx.Response(200, json={}),
+        ],
+        requests,
+    )
+    client.sites.create()
+    assert requests == ["POST", "POST", "POST"]
+
+
+def test_server_delay_longer_than_max_retry_after_is_not_retried():
+    requests: list = []
+    policy = RetryPolicy(max_retry_after=5)
+    client = _client(
+        [httpx.Response(429, headers={"retry-after": "3600"})], requests, policy
+    )
+    with pytest.raises(ApiError):
+        client.sites.get(site_id="site-1")
+    assert len(requests) == 1
+
+
+def test_per_request_policy_overrides_client():
+    requests: list = []
+    client = _client([httpx.Response(503)], requests)
+    with pytest.raises(ApiError):
+        client.sites.get(site_id="site-1", request_options={"retry": None})
+    assert len(requests) == 1
+
+
+def test_retry_budget_limits_retries():
+    budget = RetryBudget(ratio=0, min_retries=2)
+    requests: list = []
+    client = _client(
+        [httpx.Response(503)], requests, RetryPolicy(backoff_factor=0, budget=budget)
+    )
+    with pytest.raises(ApiError):
+        client.sites.get(site_id="site-1")
+    with pytest.raises(ApiError):
+        client.sites.get(site_id="site-1")
+    # the two retries of the budget were spent by the first request
+    assert len(requests) == 3 + 1
+
+
+def test_retry_delay_headers():
+    assert retry_after(httpx.Response(429, headers={"retry-after": "7"})) == 7
+    date = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 30))
+    delay = retry_after(httpx.Response(429, headers={"retry-after": date}))
+    assert delay is not None and 25 < delay <= 30
+    reset = str(int(time.time()) + 10)
+    delay = rate_limit_reset(httpx.Response(429, headers={"x-ratelimit-reset": reset}))
+    assert delay is not None and 5 < delay <= 10
+
+
+@pytest.mark.asyncio
+async def test_async_retries_rate_limited_requests():
+    requests: list = []
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                _handler(
+                    [
+                        httpx.Response(429, headers={"x-ratelimit-reset": "0"}),
+                        httpx.Response(200, json={"id": "site-1"}),
+                    ],
+                    requests,
+                )
+            )
+        ),
+        retry=NO_WAIT,
+    )
+    assert (await client.sites.get(site_id="site-1")).id == "site-1"
+    assert requests == ["GET", "GET"]
@@ -0,0 +1,93 @@
+import contextlib
+import random
+import typing
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from netlify_py.core import AsyncStreamResponse, SSEDecoder, StreamResponse
+
+STREAM = (
+    b"\xef\xbb\xbf: keep-alive comment\r\n"
+    b'event: deploy\r\nid: 1\r\ndata: {"state": "building"}\r\n\r\n'
+    b"data: line one\ndata:line two\nretry: 2500\n\n"
+    b'id\rdata: {"data": 3}\r\r'
+    b"event: ignored\n\n"
+    b"data: unterminated"
+)
+
+
+def _decode(chunks: typing.Iterable[bytes]):
+    decoder = SSEDecoder()
+    events = []
+    for chunk in chunks:
+        events.extend(decoder.feed(chunk))
+    events.extend(decoder.flush())
+    return [(e.event, e.data, e.id, e.retry) for e in events], decoder
+
+
+def test_decoder_fields_and_line_endings():
+    events, decoder = _decode([STREAM])
+    assert events == [
+        ("deploy", '{"state": "building"}', "1", None),
+        ("message", "line one\nline two", "1", 2500),
+        ("message", '{"data": 3}', "", None),
+        ("message", "unterminated", "", None),
+    ]
+    assert decoder.retry == 2500
+    assert decoder.last_event_id == ""
+
+
+def test_decoder_is_independent_of_chunk_boundaries():
+    expected, _ = _decode([STREAM])
+    rng = random.Random(0)
+    for _ in range(200):
+        cuts = sorted(rng.sample(range(1, len(STREAM)), rng.randint(1, 20)))
+        chunks = [STREAM[i:j] for i, j in zip([0, *cuts], [*cuts, len(STREAM)])]
+        assert _decode(chunks)[0] == expected
+    assert _decode([bytes([b]) for b in STREAM])[0] == expected
+
+
+class Event(BaseModel):
+    data: typing.Any
+
+
+def _response(chunks: typing.List[bytes]) -> httpx.Response:
+    return httpx.Response(200, content=iter(chunks))
+
+
+def test_stream_response_yields_every_buffered_event():
+    closed = []
+
+    @contextlib.contextmanager
+    def context():
+        yield
+        closed.append(True)
+
+    ctx = context()
+    ctx.__enter__()
+    stream = StreamResponse(
+        _response([b"data: 1\n\ndata: [2]\n\n: ping\n\ndata: plain\n\n"]), ctx, Event
+    )
+    assert [e.data for e in stream] == [1, [2], "plain"]
+    assert closed == [True]
+    with pytest.raises(StopIteration):
+        next(stream)
+
+
+@pytest.mark.asyncio
+async def test_async_stream_response():
+    @contextlib.asynccontextmanager
+    async def context():
+        yield
+
+    async def body():
+        yield b'id: 7\ndata: {"data": '
+        yield b'"x"}\n\n'
+
+    ctx = context()
+    await ctx.__aenter__()
+    stream = AsyncStreamResponse(httpx.Response(200, content=body()), ctx, Event)
+    assert [e.data async for e in stream] == ["x"]
+    assert stream.last_event_id == "7"
@@ -0,0 +1,88 @@
+import hashlib
+
+import httpx
+import pytest
+
+from netlify_py import AsyncClient, Client
+from netlify_py.core import ApiError
+from netlify_py.deploy import async_diff_directory, diff_directory
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+
+def sha(content: bytes) -> str:
+    return hashlib.sha1(content).hexdigest()
+
+
+DEPLOYED = [
+    {"id": "/index.html", "path": "/index.html", "sha": sha(b"home"), "size": 4},
+    {"id": "/app.js", "path": "/app.js", "sha": sha(b"app"), "size": 3},
+    {"id": "/old.css", "path": "/old.css", "sha": sha(b"old"), "size": 3},
+]
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/api/v1/sites/site-1/files":
+        return httpx.Response(200, json=DEPLOYED)
+    return httpx.Response(404, json={"message": "not found"})
+
+
+@pytest.fixture
+def build_dir(tmp_path):
+    (tmp_path / "index.html").write_bytes(b"home")
+    (tmp_path / "app.js").write_bytes(b"app v2")
+    (tmp_path / "new.css").write_bytes(b"new")
+    (tmp_path / ".env").write_bytes(b"SECRET=1")
+    return tmp_path
+
+
+def test_diff_directory(build_dir):
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    diff = diff_directory(client, site_id="site-1", directory=build_dir)
+    assert (diff.added, diff.removed, diff.changed) == (
+        ["/new.css"],
+        ["/old.css"],
+        ["/app.js"],
+    )
+
+    (build_dir / "app.js").write_bytes(b"app")
+    (build_dir / "new.css").unlink()
+    (build_dir / "old.css").write_bytes(b"old")
+    assert not diff_directory(client, site_id="site-1", directory=build_dir)
+
+    with pytest.raises(ApiError):
+        diff_directory(client, site_id="missing", directory=build_dir)
+
+
+def test_diff_directory_reports_files_without_digest_changed(build_dir):
+    listed = [
+        {**file, "sha": None} if file["id"] == "/index.html" else file
+        for file in DEPLOYED
+    ]
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json=listed)
+            )
+        ),
+    )
+    diff = diff_directory(client, site_id="site-1", directory=build_dir)
+    assert diff.changed == ["/app.js", "/index.html"]
+
+
+@pytest.mark.asyncio
+async def test_async_diff_directory(build_dir):
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    diff = await async_diff_directory(client, site_id="site-1", directory=build_dir)
+    assert diff.changed == ["/app.js"]
+    assert diff.added == ["/new.css"]
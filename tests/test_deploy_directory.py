@@ -0,0 +1,156 @@
+import hashlib
+import json
+import threading
+import typing
+
+import httpx
+import pytest
+
+from netlify_py import AsyncClient, Client
+from netlify_py.deploy import (
+    DeployError,
+    async_deploy_directory,
+    deploy_directory,
+    hash_directory,
+    hash_files,
+)
+from netlify_py.deploy.hashing import walk_directory
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+
+class StandInNetlify:
+    """In-memory stand-in for the deploy endpoints of the API."""
+
+    def __init__(self, known: typing.Iterable[str] = (), fail: bool = False):
+        self.known = set(known)
+        self.fail = fail
+        self.uploads: typing.Dict[str, str] = {}
+        self.functions: typing.Dict[str, str] = {}
+        self.required: typing.List[str] = []
+        self.created: typing.Dict[str, typing.Any] = {}
+        self.lock = threading.Lock()
+
+    def deploy(self, state: str) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "id": "deploy-1",
+                "state": state,
+                "required": self.required,
+                "required_functions": self.required_functions,
+            },
+        )
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path[len("/api/v1") :]
+        body = request.read()
+        if request.method == "POST" and path == "/sites/site-1/deploys":
+            self.created = json.loads(body)
+            self.required = sorted(set(self.created["files"].values()) - self.known)
+            self.required_functions = sorted(
+                set(self.created.get("functions", {}).values()) - self.known
+            )
+            return self.deploy("uploading")
+        if request.method == "PUT" and path.startswith("/deploys/deploy-1/files/"):
+            with self.lock:
+                self.uploads[path[len("/deploys/deploy-1/files") :]] = hashlib.sha1(
+                    body
+                ).hexdigest()
+            return httpx.Response(200, json={"id": path})
+        if request.method == "PUT" and path.startswith("/deploys/deploy-1/functions/"):
+            with self.lock:
+                self.functions[path.rsplit("/", 1)[1]] = hashlib.sha256(
+                    body
+                ).hexdigest()
+            return httpx.Response(200, json={"id": path})
+        if request.method == "GET" and path == "/sites/site-1/deploys/deploy-1":
+            if self.fail:
+                return self.deploy("error")
+            done = set(self.uploads.values()) >= set(self.required)
+            return self.deploy("ready" if done else "uploading")
+        return httpx.Response(404, json={"message": "not found"})
+
+
+@pytest.fixture
+def build_dir(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_bytes(b"<html>home</html>")
+    (tmp_path / "copy.html").write_bytes(b"<html>home</html>")
+    (tmp_path / "assets" / "app v2.js").write_bytes(b"console.log(1)")
+    (tmp_path / ".env").write_bytes(b"SECRET=1")
+    (tmp_path / "fn.zip").write_bytes(b"zip")
+    return tmp_path
+
+
+def test_hash_files_in_worker_processes(tmp_path):
+    """Large batches are hashed in worker processes with identical results."""
+    paths = []
+    for i in range(80):
+        path = tmp_path / f"{i}.txt"
+        path.write_bytes(str(i).encode())
+        paths.append(path)
+    assert hash_files(paths, max_workers=2) == hash_files(paths, max_workers=1)
+
+
+def test_walk_directory_does_not_follow_symlink_cycles(tmp_path):
+    """Links back to an ancestor are skipped, other links are followed."""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "f").write_bytes(b"f")
+    (tmp_path / "a" / "loop").symlink_to("..", target_is_directory=True)
+    (tmp_path / "b").symlink_to("a", target_is_directory=True)
+    paths = [deploy_path for deploy_path, _ in walk_directory(tmp_path)]
+    assert paths == ["/a/f", "/b/f"]
+
+
+def test_hash_directory_skips_hidden_files(build_dir):
+    """Deploy paths are rooted at `/` and hidden files are left out."""
+    digests = hash_directory(build_dir)
+    assert sorted(digests) == [
+        "/assets/app v2.js",
+        "/copy.html",
+        "/fn.zip",
+        "/index.html",
+    ]
+    assert digests["/index.html"] == hashlib.sha1(b"<html>home</html>").hexdigest()
+
+
+def test_deploy_directory_uploads_only_required(build_dir):
+    """Only unknown digests are uploaded, once each, then the deploy is ready."""
+    known = hashlib.sha1(b"zip").hexdigest()
+    server = StandInNetlify(known=[known])
+    client = Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(server.handle)),
+    )
+    deploy = deploy_directory(
+        client,
+        site_id="site-1",
+        directory=build_dir,
+        functions={"hello": build_dir / "fn.zip"},
+        poll_interval=0,
+    )
+    assert deploy.state == "ready"
+    assert len(server.created["files"]) == 4
+    assert sorted(server.uploads.values()) == server.required
+    assert len(server.uploads) == 2  # index.html and copy.html share a digest
+    assert "/assets/app v2.js" in server.uploads
+    assert server.functions == {"hello": hashlib.sha256(b"zip").hexdigest()}
+
+
+@pytest.mark.asyncio
+async def test_async_deploy_directory_raises_on_error_state(build_dir):
+    """A deploy that ends in the `error` state raises DeployError."""
+    server = StandInNetlify(fail=True)
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handle)),
+    )
+    with pytest.raises(DeployError) as error:
+        await async_deploy_directory(
+            client, site_id="site-1", directory=build_dir, poll_interval=0
+        )
+    assert error.value.deploy.state == "error"
+    assert len(server.uploads) == 3
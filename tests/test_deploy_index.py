@@ -0,0 +1,53 @@
+import hashlib
+import os
+
+from netlify_py.deploy import HashIndex, hash_directory
+from netlify_py.deploy import index as index_module
+
+
+def test_hash_index_rehashes_only_changed_files(tmp_path, monkeypatch):
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_bytes(name.encode())
+
+    hashed = []
+    real_hash_files = index_module.hash_files
+
+    def spy(paths, **kwargs):
+        hashed.extend(os.path.basename(p) for p in paths)
+        return real_hash_files(paths, **kwargs)
+
+    monkeypatch.setattr(index_module, "hash_files", spy)
+
+    with HashIndex(tmp_path / ".index.sqlite") as index:
+        assert hash_directory(tmp_path, index=index) == {
+            f"/{name}": hashlib.sha1(name.encode()).hexdigest()
+            for name in ("a.txt", "b.txt", "c.txt")
+        }
+        assert sorted(hashed) == ["a.txt", "b.txt", "c.txt"]
+
+        hashed.clear()
+        (tmp_path / "b.txt").write_bytes(b"changed content")
+        digests = hash_directory(tmp_path, index=index)
+        assert hashed == ["b.txt"]
+        assert digests["/b.txt"] == hashlib.sha1(b"changed content").hexdigest()
+
+    # digests survive reopening the database
+    hashed.clear()
+    with HashIndex(tmp_path / ".index.sqlite") as index:
+        hash_directory(tmp_path, index=index)
+        assert hashed == []
+        assert len(index) == 3
+
+
+def test_hash_index_compact_drops_deleted_files(tmp_path):
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_bytes(name.encode())
+
+    with HashIndex(tmp_path / ".index.sqlite") as index:
+        hash_directory(tmp_path, index=index)
+        (tmp_path / "a.txt").unlink()
+        (tmp_path / "c.txt").unlink()
+
+        assert index.compact() == 2
+        assert len(index) == 1
+        assert index.compact() == 0
@@ -0,0 +1,78 @@
+import hashlib
+
+import pytest
+
+from netlify_py.deploy import FileManifest, hash_directory
+from netlify_py.types import models
+
+
+def sha(content: bytes) -> str:
+    return hashlib.sha1(content).hexdigest()
+
+
+DEPLOYED = [
+    models.File(path="/index.html", sha=sha(b"index"), size=5, mime_type="text/html"),
+    models.File(path="/assets/app.js", sha=sha(b"app"), size=3),
+    models.File(path="/assets/old.css", sha=sha(b"old"), size=3),
+]
+
+
+def test_manifest_lookups():
+    manifest = FileManifest.from_files(DEPLOYED)
+    assert len(manifest) == 3
+    assert list(manifest) == ["/assets/app.js", "/assets/old.css", "/index.html"]
+    assert "/index.html" in manifest and "/missing" not in manifest
+    assert manifest.sha("/assets/app.js") == sha(b"app")
+    assert manifest.size("/index.html") == 5
+    assert manifest.mime_type("/index.html") == "text/html"
+    assert manifest.mime_type("/assets/app.js") is None
+    assert manifest.sha("/missing") is None
+    assert manifest.paths("/assets/") == ["/assets/app.js", "/assets/old.css"]
+    assert manifest.paths("/none/") == []
+    assert manifest.digests() == {f.path: f.sha for f in DEPLOYED}
+
+
+def test_manifest_rejects_invalid_digests():
+    with pytest.raises(ValueError):
+        FileManifest.from_digests({"/a": "not-a-sha"})
+    with pytest.raises(ValueError):
+        FileManifest.from_files([models.File(sha=sha(b"a"))])
+
+
+def test_manifest_diff_against_local_tree(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_bytes(b"index")
+    (tmp_path / "assets" / "app.js").write_bytes(b"app v2")
+    (tmp_path / "assets" / "new.css").write_bytes(b"new")
+
+    deployed = FileManifest.from_files(DEPLOYED)
+    local = FileManifest.from_digests(hash_directory(tmp_path))
+    diff = local.diff(deployed)
+    assert diff.added == ["/assets/new.css"]
+    assert diff.removed == ["/assets/old.css"]
+    assert diff.changed == ["/assets/app.js"]
+    assert diff
+
+    assert not deployed.diff(FileManifest.from_files(reversed(DEPLOYED)))
+    changed = FileManifest.from_digests({**deployed.digests(), "/index.html": sha(b"")})
+    assert changed.diff(deployed).changed == ["/index.html"]
+
+
+def test_files_without_digest_are_reported_changed():
+    unhashed = [
+        DEPLOYED[0],
+        models.File(path="/assets/app.js", sha=None, size=3),
+        DEPLOYED[2],
+    ]
+    deployed = FileManifest.from_files(unhashed)
+    assert deployed.unknown == {"/assets/app.js"}
+    assert deployed.sha("/assets/app.js") is None
+    assert "/assets/app.js" not in deployed.digests()
+
+    identical = FileManifest.from_files(DEPLOYED)
+    assert identical.diff(deployed).changed == ["/assets/app.js"]
+    assert deployed.diff(deployed).changed == ["/assets/app.js"]
+    partial = FileManifest.from_digests({"/assets/app.js": sha(b"app")})
+    diff = partial.diff(deployed)
+    assert diff.changed == ["/assets/app.js"]
+    assert diff.removed == ["/assets/old.css", "/index.html"]
@@ -0,0 +1,96 @@
+import hashlib
+from urllib.parse import unquote
+
+import httpx
+import pytest
+
+from netlify_py import AsyncClient, Client
+from netlify_py.deploy import MirrorError, async_mirror_site, mirror_site
+
+BASE_URL = "https://api.netlify.test/api/v1"
+
+CONTENT = {
+    "/index.html": b"<html>home</html>",
+    "/assets/app v2.js": b"console.log(1)",
+}
+
+
+class StandInSite:
+    def __init__(self, content, listed=None):
+        self.content = content
+        self.listed = listed or {
+            path: hashlib.sha1(body).hexdigest() for path, body in content.items()
+        }
+        self.downloads = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path[len("/api/v1/sites/site-1/files") :]
+        if not path:
+            return httpx.Response(
+                200,
+                json=[
+                    {"id": p, "path": p, "sha": sha} for p, sha in self.listed.items()
+                ],
+            )
+        path = unquote(path)
+        self.downloads.append(path)
+        return httpx.Response(200, content=self.content[path])
+
+
+def make_client(site: StandInSite) -> Client:
+    return Client(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(site.handle)),
+    )
+
+
+def test_mirror_site(tmp_path):
+    site = StandInSite(CONTENT)
+    client = make_client(site)
+    downloaded = mirror_site(client, site_id="site-1", directory=tmp_path)
+    assert downloaded == ["/assets/app v2.js", "/index.html"]
+    assert (tmp_path / "assets" / "app v2.js").read_bytes() == b"console.log(1)"
+    assert (tmp_path / "index.html").read_bytes() == b"<html>home</html>"
+
+    # unchanged files are not downloaded again
+    (tmp_path / "index.html").write_bytes(b"edited")
+    site.downloads.clear()
+    assert mirror_site(client, site_id="site-1", directory=tmp_path) == ["/index.html"]
+    assert site.downloads == ["/index.html"]
+
+
+def test_mirror_site_rejects_bad_files(tmp_path):
+    listed = {"/index.html": hashlib.sha1(b"other").hexdigest()}
+    client = make_client(StandInSite(CONTENT, listed))
+    with pytest.raises(MirrorError) as error:
+        mirror_site(client, site_id="site-1", directory=tmp_path)
+    assert error.value.path == "/index.html"
+    assert not (tmp_path / "index.html").exists()
+
+    listed = {"/../escape.html": hashlib.sha1(b"x").hexdigest()}
+    client = make_client(StandInSite(CONTENT, listed))
+    with pytest.raises(MirrorError):
+        mirror_site(client, site_id="site-1", directory=tmp_path / "mirror")
+
+
+def test_mirror_site_downloads_files_without_digest(tmp_path):
+    listed = {"/index.html": None}
+    client = make_client(StandInSite(CONTENT, listed))
+    assert mirror_site(client, site_id="site-1", directory=tmp_path) == ["/index.html"]
+    assert (tmp_path / "index.html").read_bytes() == b"<html>home</html>"
+    # without a digest to compare with, the file is downloaded again
+    assert mirror_site(client, site_id="site-1", directory=tmp_path) == ["/index.html"]
+
+
+@pytest.mark.asyncio
+async def test_async_mirror_site(tmp_path):
+    site = StandInSite(CONTENT)
+    client = AsyncClient(
+        token="API_TOKEN",
+        base_url=BASE_URL,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(site.handle)),
+    )
+    downloaded = await async_mirror_site(client, site_id="site-1", directory=tmp_path)
+    assert downloaded == ["/assets/app v2.js", "/index.html"]
+    assert (tmp_path / "index.html").read_bytes() == b"<html>home</html>"
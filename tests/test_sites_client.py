@@ -243,6 +243,68 @@ async def test_await_list_for_account_200_generated_success():
     assert is_json, "failed response type check"
 
 
+def test_iter_list_for_account_200_generated_success():
+    """Tests paginated GET requests to the /{account_slug}/sites endpoint.
+
+    Operation: iter_list_for_account
+    Test Case ID: generated_success
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : typing.List[models.Site]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Every page is requested until the `Link` header has no next page
+    - Response data matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests iterating over all pages with example data
+    client = Client(token="API_TOKEN", environment=Environment.MOCK_SERVER)
+    response = list(client.sites.iter_list_for_account(account_slug="string"))
+    try:
+        pydantic.TypeAdapter(typing.List[models.Site]).validate_python(response)
+        is_json = True
+    except pydantic.ValidationError:
+        is_json = False
+    assert is_json, "failed response type check"
+
+
+@pytest.mark.asyncio
+async def test_await_iter_list_for_account_200_generated_success():
+    """Tests paginated GET requests to the /{account_slug}/sites endpoint.
+
+    Operation: iter_list_for_account
+    Test Case ID: generated_success
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : typing.List[models.Site]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Every page is requested until the `Link` header has no next page
+    - Response data matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests iterating over all pages asynchronously with example data
+    client = AsyncClient(token="API_TOKEN", environment=Environment.MOCK_SERVER)
+    response = [
+        item
+        async for item in client.sites.aiter_list_for_account(account_slug="string")
+    ]
+    try:
+        pydantic.TypeAdapter(typing.List[models.Site]).validate_python(response)
+        is_json = True
+    except pydantic.ValidationError:
+        is_json = False
+    assert is_json, "failed response type check"
+
+
 def test_get_200_generated_success():
     """Tests a GET request to the /sites/{site_id} endpoint.
 
@@ -361,6 +423,65 @@ async def test_await_list_200_generated_success():
     assert is_json, "failed response type check"
 
 
+def test_iter_list_200_generated_success():
+    """Tests paginated GET requests to the /sites endpoint.
+
+    Operation: iter_list
+    Test Case ID: generated_success
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : typing.List[models.Site]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Every page is requested until the `Link` header has no next page
+    - Response data matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests iterating over all pages with example data
+    client = Client(token="API_TOKEN", environment=Environment.MOCK_SERVER)
+    response = list(client.sites.iter_list())
+    try:
+        pydantic.TypeAdapter(typing.List[models.Site]).validate_python(response)
+        is_json = True
+    except pydantic.ValidationError:
+        is_json = False
+    assert is_json, "failed response type check"
+
+
+@pytest.mark.asyncio
+async def test_await_iter_list_200_generated_success():
+    """Tests paginated GET requests to the /sites endpoint.
+
+    Operation: iter_list
+    Test Case ID: generated_success
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : typing.List[models.Site]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Every page is requested until the `Link` header has no next page
+    - Response data matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests iterating over all pages asynchronously with example data
+    client = AsyncClient(token="API_TOKEN", environment=Environment.MOCK_SERVER)
+    response = [item async for item in client.sites.aiter_list()]
+    try:
+        pydantic.TypeAdapter(typing.List[models.Site]).validate_python(response)
+        is_json = True
+    except pydantic.ValidationError:
+        is_json = False
+    assert is_json, "failed response type check"
+
+
 def test_delete_204_generated_success():
     """Tests a DELETE request to the /sites/{site_id} endpoint.
 
@@ -1,3 +1,4 @@
+import io
 import pydantic
 import pytest
 import typing
@@ -123,3 +124,117 @@ async def test_await_list_200_generated_success():
     except pydantic.ValidationError:
         is_json = False
     assert is_json, "failed response type check"
+
+
+def test_stream_list_200_generated_success():
+    """Tests a streamed GET request to the /sites/{site_id}/files endpoint.
+
+    Operation: stream_list
+    Test Case ID: generated_success
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : typing.List[models.File]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Every item of the streamed array is yielded
+    - Response data matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests streaming the items with example data
+    client = Client(token="API_TOKEN", environment=Environment.MOCK_SERVER)
+    response = list(client.sites.files.stream_list(site_id="string"))
+    try:
+        pydantic.TypeAdapter(typing.List[models.File]).validate_python(response)
+        is_json = True
+    except pydantic.ValidationError:
+        is_json = False
+    assert is_json, "failed response type check"
+
+
+@pytest.mark.asyncio
+async def test_await_stream_list_200_generated_success():
+    """Tests a streamed GET request to the /sites/{site_id}/files endpoint.
+
+    Operation: stream_list
+    Test Case ID: generated_success
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : typing.List[models.File]
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - Every item of the streamed array is yielded
+    - Response data matches expected schema
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests streaming the items asynchronously with example data
+    client = AsyncClient(token="API_TOKEN", environment=Environment.MOCK_SERVER)
+    response = [
+        item async for item in client.sites.files.astream_list(site_id="string")
+    ]
+    try:
+        pydantic.TypeAdapter(typing.List[models.File]).validate_python(response)
+        is_json = True
+    except pydantic.ValidationError:
+        is_json = False
+    assert is_json, "failed response type check"
+
+
+def test_download_200_generated_success():
+    """Tests a streamed download from the /sites/{site_id}/files/{file_path} endpoint.
+
+    Operation: download
+    Test Case ID: generated_success
+    Expected Status: 200
+    Mode: Synchronous execution
+
+    Response : Download
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - The body is written to the destination
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests downloading to a buffer with example data
+    client = Client(token="API_TOKEN", environment=Environment.MOCK_SERVER)
+    buffer = io.BytesIO()
+    response = client.sites.files.download(
+        file_path="string", site_id="string", destination=buffer
+    )
+    assert response.size == len(buffer.getvalue())
+
+
+@pytest.mark.asyncio
+async def test_await_download_200_generated_success():
+    """Tests a streamed download from the /sites/{site_id}/files/{file_path} endpoint.
+
+    Operation: download
+    Test Case ID: generated_success
+    Expected Status: 200
+    Mode: Asynchronous execution
+
+    Response : Download
+
+    Validates:
+    - Authentication requirements are satisfied
+    - All required input parameters are properly handled
+    - The body is written to the destination
+
+    This test uses example data to verify the endpoint behavior.
+    """
+    # tests downloading to a buffer asynchronously with example data
+    client = AsyncClient(token="API_TOKEN", environment=Environment.MOCK_SERVER)
+    buffer = io.BytesIO()
+    response = await client.sites.files.download(
+        file_path="string", site_id="string", destination=buffer
+    )
+    assert response.size == len(buffer.getvalue())